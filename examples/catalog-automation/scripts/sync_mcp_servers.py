@@ -9,15 +9,29 @@ Prevents catalog pollution, ID collisions, and index corruption.
 from __future__ import annotations
 
 import argparse
+import copy
+import hashlib
 import json
+import os
 import re
 import shutil
-from collections.abc import Iterable
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from json.encoder import encode_basestring
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+try:  # optional speedup; stdlib json is used when orjson is missing
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # Import from installed mcp_ingest package
 try:
     from mcp_ingest.harvest.source import harvest_source
@@ -38,17 +52,114 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+def loads_json(data: bytes) -> Any:
+    """Parse JSON from raw bytes."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def read_json(path: Path) -> Any:
     """Read and parse JSON file."""
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads_json(path.read_bytes())
 
 
-def write_json(path: Path, obj: Any) -> None:
-    """Write JSON with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+def dumps_json(obj: Any) -> bytes:
+    """Serialize with the catalog's formatting (2-space indent, sorted keys, newline)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+_skipped_writes = 0
+_skipped_writes_lock = threading.Lock()
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly these bytes.
+
+    Returns False (and leaves the file untouched) when nothing changed. Parent
+    directories are only created when the first write attempt needs them.
+    """
+    global _skipped_writes
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            with _skipped_writes_lock:
+                _skipped_writes += 1
+            return False
+    except FileNotFoundError:
+        pass
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return True
+
+
+def write_json(path: Path, obj: Any) -> bool:
+    """Write JSON with consistent formatting; see write_bytes_if_changed."""
+    return write_bytes_if_changed(path, dumps_json(obj))
+
+
+def _dumps_nested(obj: Any, level: int) -> bytes:
+    """Serialize obj as it appears ``level`` indents deep inside dumps_json output."""
+    return dumps_json(obj).rstrip(b"\n").replace(b"\n", b"\n" + b"  " * level)
+
 
+# Every top-level index item has these keys (sorted, as dumps_json emits them),
+# so items are rendered through one fixed template instead of a generic dump.
+_ITEM_KEYS = ("id", "manifest_path", "name", "repo", "status", "subpath", "transport", "type")
+_ITEM_LINES = ",\n".join(f'      "{k}": %s' for k in _ITEM_KEYS)
+_ITEM_TEMPLATE = f"{{\n{_ITEM_LINES}\n    }}".encode()
 
+
+def dumps_index_item(item: dict[str, Any]) -> bytes:
+    """Serialize a top-level index item at its nesting depth inside index.json."""
+    if len(item) == len(_ITEM_KEYS):
+        try:
+            values = [item[k] for k in _ITEM_KEYS]
+        except KeyError:
+            values = []
+        if values and all(isinstance(v, str) or v is None for v in values):
+            return _ITEM_TEMPLATE % tuple(
+                b"null" if v is None else encode_basestring(v).encode("utf-8") for v in values
+            )
+    return _dumps_nested(item, 2)
+
+
+def write_json_stream(
+    path: Path,
+    obj: dict[str, Any],
+    stream_key: str,
+    dump_item: Callable[[Any], bytes] | None = None,
+) -> None:
+    """Write obj exactly as write_json would, but emit obj[stream_key] item by item.
+
+    Avoids materializing the serialized form of a large list in one buffer;
+    the file is written to a temp name and swapped in atomically.
+    """
+    dump_item = dump_item or (lambda item: _dumps_nested(item, 2))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(b"{")
+        for i, key in enumerate(sorted(obj)):
+            fh.write(b",\n  " if i else b"\n  ")
+            fh.write(_dumps_nested(key, 1) + b": ")
+            value = obj[key]
+            if key == stream_key and value:
+                for j, item in enumerate(value):
+                    fh.write(b",\n    " if j else b"[\n    ")
+                    fh.write(dump_item(item))
+                fh.write(b"\n  ]")
+            else:
+                fh.write(_dumps_nested(value, 1))
+        fh.write(b"\n}\n" if obj else b"}\n")
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=4096)
 def norm_repo_full(repo_url: str) -> str:
     """Normalize GitHub repo URL to owner/repo format."""
     s = (repo_url or "").strip().rstrip("/")
@@ -59,23 +170,44 @@ def norm_repo_full(repo_url: str) -> str:
     return s.strip("/")
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
 def safe_slug(s: str) -> str:
     """Convert string to filesystem-safe slug."""
     s = s.lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
+    s = _SLUG_RE.sub("-", s)
     return s.strip("-") or "unknown"
 
 
+# One separator -> one "__" (not collapsed) so existing variant dirs keep their names
+_SUBPATH_SEP = re.compile(r"[\\/]")
+
+
 def subpath_to_variant(repo: str, subpath: str) -> str:
     """Build variant directory name: <repo>__<subpath>."""
-    sp = (subpath or "").lstrip("/").strip()
-    if not sp:
-        sp = "."
-    sp = sp.replace("\\", "/").replace("/", "__")
-    return f"{repo}__{sp}"
+    sp = (subpath or "").lstrip("/").strip() or "."
+    return f"{repo}__{_SUBPATH_SEP.sub('__', sp)}"
+
 
+def remove_stale_harvests(harvest_out: Path) -> None:
+    """Delete harvest directories renamed aside by earlier runs."""
+    for old in harvest_out.parent.glob(f"{harvest_out.name}.old-*"):
+        shutil.rmtree(old, ignore_errors=True)
 
-def resolve_manifest_path(harvest_out: Path, mp: str) -> Path | None:
+
+def build_name_index(harvest_out: Path) -> dict[str, list[Path]]:
+    """Group every JSON file under the harvest output by filename (one tree walk)."""
+    name_index: dict[str, list[Path]] = {}
+    for p in harvest_out.rglob("*.json"):
+        name_index.setdefault(p.name, []).append(p)
+    return name_index
+
+
+def resolve_manifest_path(
+    harvest_out: Path, mp: str, name_index: dict[str, list[Path]]
+) -> Path | None:
     """Resolve manifest path from harvester output."""
     p = Path(mp)
 
@@ -88,8 +220,8 @@ def resolve_manifest_path(harvest_out: Path, mp: str) -> Path | None:
     if p2.exists():
         return p2
 
-    # Last resort: search by filename
-    matches = list(harvest_out.rglob(p.name))
+    # Last resort: look up by filename in the prebuilt index
+    matches = name_index.get(p.name, [])
     if len(matches) == 1:
         return matches[0]
 
@@ -176,25 +308,66 @@ def mark_deprecated(manifest: dict[str, Any], reason: str) -> dict[str, Any]:
 # ---------------------------
 
 
-def iter_existing_manifests(servers_dir: Path) -> Iterable[Path]:
-    """Yield all manifest.json files in servers directory."""
-    yield from servers_dir.glob("**/manifest.json")
-
-
-def load_existing_by_key(servers_dir: Path) -> dict[CatalogKey, Path]:
-    """Map stable keys to existing manifest paths."""
-    out: dict[CatalogKey, Path] = {}
-    for mf in iter_existing_manifests(servers_dir):
+def _walk_manifests(root: Path) -> Iterator[Path]:
+    """Yield every manifest.json under root (pre-order, no per-directory Path objects)."""
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
         try:
-            m = read_json(mf)
-        except Exception:
-            continue
-        if m.get("type") != "mcp_server":
+            with os.scandir(d) as it:
+                subdirs: list[str] = []
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name == "manifest.json":
+                        yield Path(entry.path)
+        except OSError:
             continue
-        repo_full, subpath = extract_source_repo_path(m)
-        transport = extract_transport(m)
-        key = CatalogKey(repo_full=repo_full, subpath=subpath, transport=transport)
-        out[key] = mf
+        stack.extend(reversed(subdirs))
+
+
+def iter_existing_manifests(servers_dir: Path) -> Iterable[Path]:
+    """Yield all manifest.json files in servers directory."""
+    yield from _walk_manifests(servers_dir)
+
+
+@lru_cache(maxsize=8192)
+def _read_manifest_cached(path: str, mtime_ns: int) -> Any:
+    """Parse a manifest once per (path, mtime) so reruns in-process are free."""
+    return read_json(Path(path))
+
+
+def _load_existing(mf: Path) -> Any:
+    # A private copy: callers mark/deprecate manifests in place, which must not
+    # leak into the cached parse shared with later calls
+    try:
+        return copy.deepcopy(_read_manifest_cached(str(mf), mf.stat().st_mtime_ns))
+    except Exception:
+        return None
+
+
+def load_existing_by_key(
+    servers_dir: Path, all_paths: list[Path] | None = None, max_workers: int = 8
+) -> dict[CatalogKey, tuple[Path, dict[str, Any]]]:
+    """Map stable keys to existing manifest paths and their parsed contents.
+
+    Files are read on a bounded thread pool. If ``all_paths`` is given, every
+    manifest.json found is appended to it (regardless of type) so callers can
+    reuse this walk.
+    """
+    paths = list(iter_existing_manifests(servers_dir))
+    if all_paths is not None:
+        all_paths.extend(paths)
+
+    out: dict[CatalogKey, tuple[Path, dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as ex:
+        for mf, m in zip(paths, ex.map(_load_existing, paths), strict=True):
+            if m is None or m.get("type") != "mcp_server":
+                continue
+            repo_full, subpath = extract_source_repo_path(m)
+            transport = extract_transport(m)
+            key = CatalogKey(repo_full=repo_full, subpath=subpath, transport=transport)
+            out[key] = (mf, m)
     return out
 
 
@@ -217,17 +390,234 @@ def build_variant_dir(group_dir: Path, repo_full: str, subpath: str) -> Path:
     return group_dir / variant
 
 
-def rebuild_group_indexes(servers_dir: Path) -> None:
-    """Rebuild group-level index.json files."""
-    for group in servers_dir.iterdir():
-        if not group.is_dir():
+def write_group_indexes(servers_dir: Path, manifest_paths: Iterable[Path]) -> None:
+    """Write group-level index.json files from already-known manifest paths."""
+    group_manifests: dict[Path, set[str]] = {
+        group: set() for group in servers_dir.iterdir() if group.is_dir()
+    }
+    for mf in manifest_paths:
+        try:
+            parts = mf.relative_to(servers_dir).parts
+        except ValueError:
             continue
-        relpaths: list[str] = []
-        for mf in group.glob("**/manifest.json"):
-            rel = str(mf.relative_to(group)).replace("\\", "/")
-            relpaths.append(rel)
-        relpaths = sorted(set(relpaths))
-        write_json(group / "index.json", {"manifests": relpaths})
+        if len(parts) < 2:
+            continue
+        group_manifests.setdefault(servers_dir / parts[0], set()).add("/".join(parts[1:]))
+    for group, relpaths in group_manifests.items():
+        write_json(group / "index.json", {"manifests": sorted(relpaths)})
+
+
+# ---------------------------
+# Per-manifest work (runs in worker threads)
+# ---------------------------
+
+_skipped_unchanged = 0
+_skipped_unchanged_lock = threading.Lock()
+
+
+def _count_unchanged() -> None:
+    global _skipped_unchanged
+    with _skipped_unchanged_lock:
+        _skipped_unchanged += 1
+
+
+# Provenance fields restamped on every harvest run; not part of a manifest's content
+_VOLATILE_PROVENANCE = frozenset({"harvested_at"})
+
+
+def content_digest(manifest: dict[str, Any]) -> str:
+    """sha256 of a harvested manifest's canonical form, ignoring per-run timestamps.
+
+    Two harvests of the same source produce the same digest, so an unchanged
+    manifest can be recognized on the next sync.
+    """
+    prov = manifest.get("provenance")
+    if isinstance(prov, dict) and not _VOLATILE_PROVENANCE.isdisjoint(prov):
+        stable = {k: v for k, v in prov.items() if k not in _VOLATILE_PROVENANCE}
+        manifest = {**manifest, "provenance": stable}
+    return hashlib.sha256(dumps_json(manifest)).hexdigest()
+
+
+# Every variant index has the same content; serialize it once
+_VARIANT_INDEX = dumps_json({"manifests": ["./manifest.json"]})
+
+
+@dataclass
+class Harvested:
+    """One harvested mcp_server manifest, read and keyed but not yet written."""
+
+    key: CatalogKey
+    mid: str
+    manifest: dict[str, Any]
+    content_sha256: str
+    variant_dir: Path
+    unchanged: bool
+
+
+def read_one(
+    mp: str,
+    *,
+    harvest_out: Path,
+    name_index: dict[str, list[Path]],
+    existing_by_key: dict[CatalogKey, tuple[Path, dict[str, Any]]],
+    servers_dir: Path,
+) -> Harvested | str | None:
+    """Read one harvested manifest and work out where it goes (no writes).
+
+    Returns None for non-mcp_server manifests and a warning string when the
+    path cannot be resolved.
+    """
+    src_path = resolve_manifest_path(harvest_out, mp, name_index)
+    if not src_path:
+        return f"Could not resolve: {mp}"
+
+    manifest = read_json(src_path)
+    if manifest.get("type") != "mcp_server":
+        return None
+    content_sha256 = content_digest(manifest)
+
+    repo_full, subpath = extract_source_repo_path(manifest)
+    transport = extract_transport(manifest)
+    key = CatalogKey(repo_full=repo_full, subpath=subpath, transport=transport)
+
+    group_dir = build_group_dir(servers_dir, repo_full)
+    variant_dir = build_variant_dir(group_dir, repo_full, subpath)
+
+    # Unchanged since the last sync: only refresh lifecycle/last_seen on the
+    # catalog copy and skip rewriting provenance and the variant index.
+    existing = existing_by_key.get(key)
+    unchanged = (
+        existing is not None
+        and existing[0] == variant_dir / "manifest.json"
+        and (existing[1].get("harvest") or {}).get("content_sha256") == content_sha256
+    )
+    if existing is not None and unchanged:
+        manifest = existing[1]
+
+    return Harvested(
+        key=key,
+        mid=str(manifest.get("id") or "").strip(),
+        manifest=manifest,
+        content_sha256=content_sha256,
+        variant_dir=variant_dir,
+        unchanged=unchanged,
+    )
+
+
+def write_one(
+    h: Harvested, *, catalog_root: Path, source_repo: str
+) -> tuple[dict[str, Any], str | None]:
+    """Write one manifest (plus provenance and variant index) into the catalog.
+
+    Returns ``(item, rel_manifest)`` where ``rel_manifest`` is set only for
+    active manifests. Not safe to run concurrently for one variant directory;
+    see write_in_order.
+    """
+    key = h.key
+    variant_dir = h.variant_dir
+    dest_manifest = variant_dir / "manifest.json"
+
+    # Mark as active/seen
+    manifest = mark_active_seen(h.manifest)
+
+    if h.unchanged:
+        write_json(dest_manifest, manifest)
+        _count_unchanged()
+    else:
+        manifest["harvest"]["content_sha256"] = h.content_sha256
+
+        # Write to catalog (write_json creates variant_dir on first write)
+        write_json(dest_manifest, manifest)
+
+        # Write provenance
+        prov = manifest.get("provenance") or {}
+        if not prov:
+            prov = {
+                "repo_url": f"https://github.com/{key.repo_full}",
+                "subpath": key.subpath,
+                "transport": key.transport,
+                "harvested_from": source_repo,
+                "harvested_at": now_iso(),
+            }
+        write_json(variant_dir / "provenance.json", prov)
+
+        # Write variant index
+        write_bytes_if_changed(variant_dir / "index.json", _VARIANT_INDEX)
+
+    # Track for top-level index
+    rel_manifest = str(dest_manifest.relative_to(catalog_root)).replace("\\", "/")
+
+    # Validate path (critical for avoiding index corruption)
+    if rel_manifest.startswith("http://") or rel_manifest.startswith("https://"):
+        raise SystemExit(f"❌ BUG: manifest path is URL: {rel_manifest}")
+    if not dest_manifest.exists():
+        raise SystemExit(f"❌ BUG: manifest missing on disk: {rel_manifest}")
+
+    status = (manifest.get("lifecycle") or {}).get("status", "active")
+    item = {
+        "type": "mcp_server",
+        "id": h.mid,
+        "name": manifest.get("name"),
+        "transport": key.transport,
+        "status": status,
+        "manifest_path": rel_manifest,
+        "repo": f"https://github.com/{key.repo_full}",
+        "subpath": key.subpath,
+    }
+    return item, rel_manifest if status == "active" else None
+
+
+def write_in_order(
+    ex: ThreadPoolExecutor,
+    to_write: list[Harvested],
+    write: Callable[[Harvested], tuple[dict[str, Any], str | None]],
+) -> list[tuple[dict[str, Any], str | None]]:
+    """Run *write* for every item; returns the results in *to_write* order.
+
+    Variant directories ignore transport, so several keys can land in one
+    directory. Those are written one after another in harvest order (the last
+    one wins, as in a serial run); distinct directories are written in parallel.
+    """
+    groups: dict[Path, list[int]] = {}
+    for i, h in enumerate(to_write):
+        groups.setdefault(h.variant_dir, []).append(i)
+
+    def write_group(indices: list[int]) -> list[tuple[dict[str, Any], str | None]]:
+        return [write(to_write[i]) for i in indices]
+
+    by_index: dict[int, tuple[dict[str, Any], str | None]] = {}
+    for indices, done in zip(groups.values(), ex.map(write_group, groups.values()), strict=True):
+        by_index.update(zip(indices, done, strict=True))
+    return [by_index[i] for i in range(len(to_write))]
+
+
+def deprecate_one(
+    existing: tuple[Path, dict[str, Any]], *, catalog_root: Path, reason: str
+) -> dict[str, Any]:
+    """Mark an existing manifest deprecated and return its top-level index item.
+
+    ``existing`` comes from load_existing_by_key, which only keeps mcp_server
+    manifests, so no re-read or type check is needed here.
+    """
+    mf_path, m = existing
+    m = mark_deprecated(m, reason=reason)
+    write_json(mf_path, m)
+
+    repo_full, subpath = extract_source_repo_path(m)
+    transport = extract_transport(m)
+    mid = str(m.get("id") or "").strip()
+    rel_manifest = str(mf_path.relative_to(catalog_root)).replace("\\", "/")
+
+    return {
+        "type": "mcp_server",
+        "id": mid,
+        "name": m.get("name"),
+        "transport": transport,
+        "status": "deprecated",
+        "manifest_path": rel_manifest,
+        "repo": f"https://github.com/{repo_full}",
+        "subpath": subpath,
+    }
 
 
 # ---------------------------
@@ -236,6 +626,10 @@ def rebuild_group_indexes(servers_dir: Path) -> None:
 
 
 def main() -> None:
+    global _skipped_writes, _skipped_unchanged
+    _skipped_writes = 0
+    _skipped_unchanged = 0
+
     ap = argparse.ArgumentParser(description="Sync MCP servers catalog")
     ap.add_argument("--source-repo", required=True, help="Source repository URL")
     ap.add_argument("--catalog-root", default=".", help="Catalog root directory")
@@ -248,11 +642,16 @@ def main() -> None:
     servers_dir = (catalog_root / args.servers_dir).resolve()
     index_file = (catalog_root / args.index_file).resolve()
 
-    # Temporary harvest directory
+    # Temporary harvest directory. A previous harvest is renamed aside and
+    # deleted in the background so the new harvest can start immediately.
     harvest_out = catalog_root / ".tmp" / "harvest"
     if harvest_out.exists():
-        shutil.rmtree(harvest_out)
+        os.rename(harvest_out, harvest_out.with_name(f"{harvest_out.name}.old-{time.time_ns()}"))
     harvest_out.mkdir(parents=True, exist_ok=True)
+    cleanup = threading.Thread(
+        target=remove_stale_harvests, args=(harvest_out,), name="harvest-cleanup"
+    )
+    cleanup.start()
 
     servers_dir.mkdir(parents=True, exist_ok=True)
 
@@ -260,7 +659,8 @@ def main() -> None:
     print(f"📁 Output directory: {servers_dir}")
 
     # Load existing manifests for deprecation tracking
-    existing_by_key = load_existing_by_key(servers_dir)
+    catalog_manifests: list[Path] = []
+    existing_by_key = load_existing_by_key(servers_dir, catalog_manifests, args.max_parallel)
     seen_keys: set[CatalogKey] = set()
 
     # Run mcp_ingest harvester
@@ -289,142 +689,97 @@ def main() -> None:
 
     print(f"✅ Found {len(manifest_paths)} manifests in harvest")
 
+    # Index harvested files by name once instead of re-walking per unresolved path
+    name_index = build_name_index(harvest_out)
+
     # Track for collision detection
     id_to_key: dict[str, CatalogKey] = {}
     top_items: list[dict[str, Any]] = []
     active_manifest_relpaths: list[str] = []
-
-    # Process each harvested manifest
-    for mp in manifest_paths:
-        src_path = resolve_manifest_path(harvest_out, mp)
-        if not src_path:
-            print(f"⚠️  Could not resolve: {mp}")
-            continue
-
-        manifest = read_json(src_path)
-        if manifest.get("type") != "mcp_server":
-            continue
-
-        repo_full, subpath = extract_source_repo_path(manifest)
-        transport = extract_transport(manifest)
-        key = CatalogKey(repo_full=repo_full, subpath=subpath, transport=transport)
-
-        # Mark as active/seen
-        manifest = mark_active_seen(manifest)
-
-        # Validate ID
-        mid = str(manifest.get("id") or "").strip()
-        if not mid:
-            raise SystemExit(f"❌ Manifest missing 'id' (repo={repo_full}, subpath={subpath})")
-
-        # Check for ID collisions
-        if mid in id_to_key and id_to_key[mid] != key:
-            raise SystemExit(
-                f"❌ ID collision detected:\n"
-                f"  ID: {mid}\n"
-                f"  Key 1: {id_to_key[mid]}\n"
-                f"  Key 2: {key}\n"
-            )
-        id_to_key[mid] = key
-
-        # Write to catalog
-        group_dir = build_group_dir(servers_dir, repo_full)
-        variant_dir = build_variant_dir(group_dir, repo_full, subpath)
-        variant_dir.mkdir(parents=True, exist_ok=True)
-
-        dest_manifest = variant_dir / "manifest.json"
-        write_json(dest_manifest, manifest)
-
-        # Write provenance
-        prov = manifest.get("provenance") or {}
-        if not prov:
-            prov = {
-                "repo_url": f"https://github.com/{repo_full}",
-                "subpath": subpath,
-                "transport": transport,
-                "harvested_from": args.source_repo,
-                "harvested_at": now_iso(),
-            }
-        write_json(variant_dir / "provenance.json", prov)
-
-        # Write variant index
-        write_json(variant_dir / "index.json", {"manifests": ["./manifest.json"]})
-
-        # Track for top-level index
-        rel_manifest = str(dest_manifest.relative_to(catalog_root)).replace("\\", "/")
-
-        # Validate path (critical for avoiding index corruption)
-        if rel_manifest.startswith("http://") or rel_manifest.startswith("https://"):
-            raise SystemExit(f"❌ BUG: manifest path is URL: {rel_manifest}")
-        if not dest_manifest.exists():
-            raise SystemExit(f"❌ BUG: manifest missing on disk: {rel_manifest}")
-
-        seen_keys.add(key)
-        status = (manifest.get("lifecycle") or {}).get("status", "active")
-
-        top_items.append(
-            {
-                "type": "mcp_server",
-                "id": mid,
-                "name": manifest.get("name"),
-                "transport": transport,
-                "status": status,
-                "manifest_path": rel_manifest,
-                "repo": f"https://github.com/{repo_full}",
-                "subpath": subpath,
-            }
-        )
-
-        # Only active manifests go into ingestion list
-        if status == "active":
-            active_manifest_relpaths.append(rel_manifest)
-
-    # Deprecate missing manifests
-    deprecated_added = 0
-    for key, mf_path in existing_by_key.items():
-        if key in seen_keys:
-            continue
+    # process_one checks dest_manifest.exists() before returning an item
+    verified_relpaths: set[str] = set()
+
+    # Two passes on a bounded pool. Reads come first and nothing is written
+    # until every id has been checked for collisions on the main thread (in
+    # harvest order), so a collision leaves the catalog untouched.
+    workers = max(1, args.max_parallel)
+    read = partial(
+        read_one,
+        harvest_out=harvest_out,
+        name_index=name_index,
+        existing_by_key=existing_by_key,
+        servers_dir=servers_dir,
+    )
+    write = partial(write_one, catalog_root=catalog_root, source_repo=args.source_repo)
+    to_write: list[Harvested] = []
+    with ThreadPoolExecutor(max_workers=workers) as ex:
         try:
-            m = read_json(mf_path)
-        except Exception:
-            continue
-        if m.get("type") != "mcp_server":
-            continue
+            for h in ex.map(read, manifest_paths):
+                if isinstance(h, str):
+                    print(f"⚠️  {h}")
+                    continue
+                if h is None:
+                    continue
+
+                # Validate ID
+                if not h.mid:
+                    raise SystemExit(
+                        f"❌ Manifest missing 'id' (repo={h.key.repo_full}, subpath={h.key.subpath})"
+                    )
+
+                # Check for ID collisions
+                if h.mid in id_to_key and id_to_key[h.mid] != h.key:
+                    raise SystemExit(
+                        f"❌ ID collision detected:\n"
+                        f"  ID: {h.mid}\n"
+                        f"  Key 1: {id_to_key[h.mid]}\n"
+                        f"  Key 2: {h.key}\n"
+                    )
+                id_to_key[h.mid] = h.key
+                to_write.append(h)
+
+            for h, (item, rel_manifest) in zip(
+                to_write, write_in_order(ex, to_write, write), strict=True
+            ):
+                seen_keys.add(h.key)
+                top_items.append(item)
+                catalog_manifests.append(catalog_root / item["manifest_path"])
+                verified_relpaths.add(item["manifest_path"])
+
+                # Only active manifests go into ingestion list
+                if rel_manifest:
+                    active_manifest_relpaths.append(rel_manifest)
+        except BaseException:
+            # Don't let the executor's exit run what is still queued
+            ex.shutdown(wait=True, cancel_futures=True)
+            raise
 
-        m = mark_deprecated(m, reason=f"Not found in latest harvest from {args.source_repo}")
-        write_json(mf_path, m)
-        deprecated_added += 1
-
-        repo_full, subpath = extract_source_repo_path(m)
-        transport = extract_transport(m)
-        mid = str(m.get("id") or "").strip()
-        rel_manifest = str(mf_path.relative_to(catalog_root)).replace("\\", "/")
-
-        top_items.append(
-            {
-                "type": "mcp_server",
-                "id": mid,
-                "name": m.get("name"),
-                "transport": transport,
-                "status": "deprecated",
-                "manifest_path": rel_manifest,
-                "repo": f"https://github.com/{repo_full}",
-                "subpath": subpath,
-            }
-        )
+    # Deprecate missing manifests
+    reason = f"Not found in latest harvest from {args.source_repo}"
+    missing = [existing for key, existing in existing_by_key.items() if key not in seen_keys]
+    deprecate = partial(deprecate_one, catalog_root=catalog_root, reason=reason)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        deprecated_items = list(ex.map(deprecate, missing))
+    deprecated_added = len(deprecated_items)
+    top_items.extend(deprecated_items)
 
-    # Rebuild group indexes
-    rebuild_group_indexes(servers_dir)
+    # Rebuild group indexes from the paths gathered above (no second tree walk)
+    write_group_indexes(servers_dir, catalog_manifests)
 
     # Sort deterministically
-    top_items.sort(key=lambda x: (str(x.get("id") or ""), str(x.get("manifest_path") or "")))
-    active_manifest_relpaths = sorted(set(active_manifest_relpaths))
-
-    # Final validation: all active paths must exist
-    for rel in active_manifest_relpaths:
-        p = catalog_root / rel
-        if not p.exists():
-            raise SystemExit(f"❌ index.json.manifests contains missing path: {rel}")
+    # id and manifest_path are always str on items built by process_one/deprecate_one
+    top_items.sort(key=itemgetter("id", "manifest_path"))
+    active_manifest_relpaths = sorted(dict.fromkeys(active_manifest_relpaths))
+
+    # Final validation: all active paths must exist. Every path written this
+    # run was already checked on disk, so only stat what wasn't.
+    if not verified_relpaths.issuperset(active_manifest_relpaths):
+        for rel in active_manifest_relpaths:
+            if rel in verified_relpaths:
+                continue
+            p = catalog_root / rel
+            if not p.exists():
+                raise SystemExit(f"❌ index.json.manifests contains missing path: {rel}")
 
     # Build top-level index
     top_index = {
@@ -442,12 +797,16 @@ def main() -> None:
         "manifests": active_manifest_relpaths,  # ONLY ACTIVE, RELATIVE PATHS
     }
 
-    write_json(index_file, top_index)
+    write_json_stream(index_file, top_index, "items", dumps_index_item)
+
+    cleanup.join()
 
     print("\n✅ Sync complete!")
     print(f"   Total items: {len(top_items)}")
     print(f"   Active manifests: {len(active_manifest_relpaths)}")
     print(f"   Newly deprecated: {deprecated_added}")
+    print(f"   Unchanged manifests (incremental skip): {_skipped_unchanged}")
+    print(f"   Unchanged files skipped: {_skipped_writes}")
     print(f"   Index written: {index_file}")
 
 
@@ -12,9 +12,33 @@ Ensures:
 from __future__ import annotations
 
 import json
+import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:  # optional speedup; stdlib json is used when orjson is missing
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _walk_manifests(root: Path) -> Iterator[str]:
+    """Yield the path of every manifest.json under root using os.scandir."""
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "manifest.json":
+                        yield entry.path
+        except OSError:
+            continue
+
 
 def main() -> None:
     root = Path(".")
@@ -26,7 +50,8 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        index_data = json.loads(index_path.read_text(encoding="utf-8"))
+        raw = index_path.read_bytes()
+        index_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         print(f"❌ Failed to parse index.json: {e}", file=sys.stderr)
         sys.exit(1)
@@ -46,18 +71,30 @@ def main() -> None:
         print("❌ index.json 'manifests' must be a list", file=sys.stderr)
         errors += 1
     else:
+        local_paths: list[str] = []
         for mp in manifest_paths:
             # Check not a URL
             if str(mp).startswith("http://") or str(mp).startswith("https://"):
                 print(f"❌ manifests must be relative paths (found URL): {mp}", file=sys.stderr)
                 errors += 1
                 continue
-
-            # Check file exists
-            p = root / mp
-            if not p.exists():
-                print(f"❌ manifests path does not exist on disk: {mp}", file=sys.stderr)
-                errors += 1
+            local_paths.append(str(mp))
+
+        # Check files exist: one walk of the referenced top-level dirs, then a
+        # set difference; only paths the walk can't vouch for are stat'ed.
+        tops = {mp.split("/", 1)[0] for mp in local_paths if "/" in mp}
+        existing = {
+            os.path.relpath(p, root).replace("\\", "/")
+            for top in tops
+            for p in _walk_manifests(root / top)
+        }
+        unknown = sorted(set(local_paths) - existing)
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            found = ex.map(lambda mp: (root / mp).exists(), unknown)
+            missing = [mp for mp, ok in zip(unknown, found, strict=True) if not ok]
+        for mp in missing:
+            print(f"❌ manifests path does not exist on disk: {mp}", file=sys.stderr)
+        errors += len(missing)
 
     # Validate items
     items = index_data.get("items", [])
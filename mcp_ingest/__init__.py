@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from .sdk import autoinstall, describe
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .sdk import autoinstall, describe
 
 __all__ = ["describe", "autoinstall", "__version__"]
 __version__ = "0.1.2"
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the SDK re-exports on first use so importing a submodule
+    # (e.g. the CLI) doesn't drag in the HTTP client stack.
+    if name in ("describe", "autoinstall"):
+        from . import sdk
+
+        return getattr(sdk, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
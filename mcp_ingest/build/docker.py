@@ -1,21 +1,53 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import subprocess
+import tempfile
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 __all__ = ["BuildResult", "build_image", "tag_image"]
 
 
+def _iter_files(root: Path) -> Iterator[tuple[str, str, int]]:
+    """Yield (relpath, abspath, size) for files under root using cached dirents."""
+    stack = [(str(root), "")]
+    while stack:
+        d, prefix = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    rel = prefix + e.name
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append((e.path, rel + "/"))
+                    elif e.is_file():
+                        yield rel, e.path, e.stat().st_size
+        except OSError:
+            continue
+
+
+def _file_digest(path: str) -> bytes:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "blake2b").digest()
+    except OSError:
+        return b""
+
+
 def _hash_path(path: Path) -> str:
-    # quick-and-dirty content hash (filenames + mtimes) to cache builds
-    h = hashlib.sha256()
-    for p in sorted(path.rglob("*")):
-        if p.is_file():
-            h.update(str(p.relative_to(path)).encode())
-            h.update(str(int(p.stat().st_mtime)).encode())
+    # content hash of the tree (relpath + size + file digest) to cache builds
+    files = sorted(_iter_files(path))
+    with ThreadPoolExecutor() as ex:
+        digests = ex.map(_file_digest, [abspath for _, abspath, _ in files])
+        h = hashlib.sha256()
+        for (rel, _, size), digest in zip(files, digests, strict=True):
+            h.update(rel.encode())
+            h.update(size.to_bytes(8, "big"))
+            h.update(digest)
     return h.hexdigest()
 
 
@@ -71,9 +103,9 @@ def build_image(
     # Guess a name from folder if not provided
     name = image_name or f"mcp-{src.name.lower().replace('_', '-')}"
 
-    # Create a temporary Dockerfile
-    df = f"""
-FROM {runtime}
+    # Create a temporary Dockerfile (a BuildKit cache mount keeps the pip cache across
+    # builds; the default frontend supports it, so no syntax directive or image pull)
+    df = f"""FROM {runtime}
 ENV PYTHONDONTWRITEBYTECODE=1 \\
     PYTHONUNBUFFERED=1
 RUN apt-get update -y && apt-get install -y --no-install-recommends \\
@@ -81,7 +113,8 @@ RUN apt-get update -y && apt-get install -y --no-install-recommends \\
 WORKDIR /app
 COPY . /app
 # Pinned deps if requirements.txt present; else best-effort install project
-RUN python -m pip install --upgrade pip \\
+RUN --mount=type=cache,target=/root/.cache/pip \\
+    python -m pip install --upgrade pip \\
     && if [ -f requirements.txt ]; then pip install -r requirements.txt; \\
     elif [ -f pyproject.toml ]; then pip install .; \\
     else echo "No requirements found; skipping"; fi
@@ -96,26 +129,41 @@ CMD ["python", "-c", "print('image built; provide CMD at run time')"]
         lbl_flags += ["--label", f"{k}={v}"]
 
     try:
-        # We need to pipe the Dockerfile content to the docker build command
-        proc = subprocess.run(
-            ["docker", "build", "-f", "-", "-t", name, *lbl_flags, str(src)],
-            input=df,
-            text=True,
-            capture_output=True,
-            check=True,
-        )
+        # We need to pipe the Dockerfile content to the docker build command.
+        # --iidfile makes docker report the image ID for exactly this build.
+        with tempfile.TemporaryDirectory(prefix="mcp-build-") as tdir:
+            iidfile = Path(tdir) / "iid"
+            proc = subprocess.run(
+                [
+                    "docker",
+                    "build",
+                    "-f",
+                    "-",
+                    "-t",
+                    name,
+                    "--iidfile",
+                    str(iidfile),
+                    "--build-arg",
+                    "BUILDKIT_INLINE_CACHE=1",
+                    f"--cache-from={name}:latest",
+                    *lbl_flags,
+                    str(src),
+                ],
+                input=df,
+                text=True,
+                capture_output=True,
+                check=True,
+                env={**os.environ, "DOCKER_BUILDKIT": "1"},
+            )
+            # .Id is content-addressable id (sha256:...)
+            digest = iidfile.read_text(encoding="utf-8").strip() if iidfile.exists() else None
         logs = proc.stdout + "\n" + proc.stderr
 
-        # Inspect image ID / digest
-        inspect = _run(
-            ["docker", "images", "--no-trunc", "--format", "{{.Repository}}:{{.Tag}} {{.ID}}", name]
-        )
-        img_line = inspect.stdout.strip().splitlines()[:1]
-        digest = None
-        if img_line:
-            # .ID is content-addressable id (sha256:...)
-            parts = img_line[0].split()
-            digest = parts[1] if len(parts) > 1 else None
+        if not digest:
+            # Single-image lookup (no full image listing)
+            inspect = _run(["docker", "image", "inspect", "-f", "{{.Id}}", name])
+            if inspect.returncode == 0:
+                digest = inspect.stdout.strip() or None
 
         # Create a stable tag by digest short
         if digest and digest.startswith("sha256:"):
@@ -14,54 +14,72 @@ All commands print structured JSON to stdout (CI-friendly). Python 3.11+.
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from .detect.fastmcp import detect_path as detect_fastmcp
-from .sdk import autoinstall as sdk_autoinstall
-from .sdk import describe as sdk_describe
+from .utils import _json
 from .utils.auth import get_matrixhub_token
 
-# Optional (Stage-1+: repo harvester)
-try:  # pragma: no cover - optional dependency within the package
-    from .harvest.repo import harvest_repo  # type: ignore
-except Exception:  # pragma: no cover
-    harvest_repo = None  # type: ignore
+# The SDK (HTTP client) and the harvesters are imported inside the commands that
+# use them, so `detect` and `--help` don't pay for their import chains.
 
-# Optional (Stage-2+: README extractor + source orchestrator)
-try:  # pragma: no cover - optional import until feature lands
-    from .harvest.source import harvest_source  # type: ignore
-except Exception:  # pragma: no cover
-    harvest_source = None  # type: ignore
 
-# Optional (Stage-3+: Registry API harvester)
-try:  # pragma: no cover - optional import
-    from .registry.harvest import harvest_registry  # type: ignore
-except Exception:  # pragma: no cover
-    harvest_registry = None  # type: ignore
+# ------------------------- helpers -------------------------
 
+# One "k=v" pair per match; keys/values are trimmed and commas separate pairs.
+_KV_RE = re.compile(r"\s*([^=,]*?)\s*=\s*([^,]*?)\s*(?:,|$)")
 
-# ------------------------- helpers -------------------------
+
+def _dumps_bytes(obj: Any) -> bytes:
+    return _json.dumps_bytes(obj, indent=True, sort_keys=True, newline=True)
 
 
 def _print_json(obj: Any) -> None:
-    json.dump(obj, sys.stdout, indent=2, sort_keys=True)
-    sys.stdout.write("\n")
+    """Serialize *obj* once and hand it to stdout's binary buffer in a single write."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:  # e.g. stdout replaced by a StringIO
+        sys.stdout.write(json.dumps(obj, indent=2, sort_keys=True) + "\n")
+        return
+    data = _dumps_bytes(obj)
+    sys.stdout.flush()  # keep ordering with anything already written in text mode
+    out.write(data)
+    out.flush()
+
+
+def _load_manifest(path: Path) -> dict[str, Any]:
+    """Parse a manifest straight from bytes (json and orjson both accept them)."""
+    return _json.loads(path.read_bytes())
+
+
+class _PathEncoder(json.JSONEncoder):
+    """JSONEncoder that stringifies os.PathLike values as it reaches them."""
+
+    def default(self, o: Any) -> Any:
+        if hasattr(o, "__fspath__"):
+            return os.fspath(o)
+        return super().default(o)
+
+
+def _stream_json(obj: Any) -> None:
+    """Like _print_json, but encode incrementally so large payloads never exist as one str."""
+    write = sys.stdout.write
+    for chunk in _PathEncoder(indent=2, sort_keys=True).iterencode(obj):
+        write(chunk)
+    write("\n")
 
 
 def _parse_kv_list(values: list[str] | None) -> list[dict[str, Any]]:
     """Parse repeated --resource 'k=v,k=v' flags into list[dict]."""
     out: list[dict[str, Any]] = []
-    if not values:
-        return out
-    for item in values:
-        entry: dict[str, Any] = {}
-        for kv in item.split(",") if item else []:
-            if "=" in kv:
-                k, v = kv.split("=", 1)
-                entry[k.strip()] = v.strip()
+    for item in values or ():
+        entry = {m.group(1): m.group(2) for m in _KV_RE.finditer(item)}
         if entry:
             out.append(entry)
     return out
@@ -81,6 +99,8 @@ def cmd_detect(args: argparse.Namespace) -> None:
 
 
 def cmd_describe(args: argparse.Namespace) -> None:
+    from .sdk import describe as sdk_describe
+
     tools: list[str] = [t for t in (args.tools or []) if t]
     resources = _parse_kv_list(args.resource)
 
@@ -94,15 +114,18 @@ def cmd_describe(args: argparse.Namespace) -> None:
         entity_id=args.entity_id,
         entity_name=args.entity_name,
         out_dir=args.out,
+        in_memory=args.out == "-",
     )
     _print_json({"ok": True, **out})
 
 
 def cmd_register(args: argparse.Namespace) -> None:
+    from .sdk import autoinstall as sdk_autoinstall
+
     mpath = Path(args.manifest).expanduser()
     if not mpath.exists():
         raise SystemExit(f"manifest not found: {mpath}")
-    manifest = json.loads(mpath.read_text(encoding="utf-8"))
+    manifest = _load_manifest(mpath)
 
     # Non-breaking: default to env token if --token is not provided
     if not args.token:
@@ -119,6 +142,9 @@ def cmd_register(args: argparse.Namespace) -> None:
 
 
 def cmd_pack(args: argparse.Namespace) -> None:
+    from .sdk import autoinstall as sdk_autoinstall
+    from .sdk import describe as sdk_describe
+
     # 1) Detect (fastmcp only for now)
     report = detect_fastmcp(args.source)
 
@@ -142,14 +168,17 @@ def cmd_pack(args: argparse.Namespace) -> None:
         description=args.description or report.summarize_description(),
         version=args.version,
         out_dir=args.out,
+        in_memory=args.out == "-",
     )
 
     result: dict[str, Any] = {"detected": report.to_dict(), "describe": out}
 
     # 3) Optional register
     if args.register:
-        mpath = Path(out["manifest_path"]).expanduser()
-        manifest = json.loads(mpath.read_text(encoding="utf-8"))
+        if "manifest" in out:  # --out -: already in memory
+            manifest = out["manifest"]
+        else:
+            manifest = _load_manifest(Path(out["manifest_path"]).expanduser())
         res = sdk_autoinstall(
             matrixhub_url=args.matrixhub,
             manifest=manifest,
@@ -163,8 +192,12 @@ def cmd_pack(args: argparse.Namespace) -> None:
 
 
 def cmd_harvest_repo(args: argparse.Namespace) -> None:
-    if harvest_repo is None:  # pragma: no cover
-        raise SystemExit("harvest-repo is unavailable: .harvest.repo not found in package")
+    try:
+        from .harvest.repo import harvest_repo
+    except Exception:  # pragma: no cover
+        raise SystemExit(
+            "harvest-repo is unavailable: .harvest.repo not found in package"
+        ) from None
 
     if args.register and not args.matrixhub:
         raise SystemExit("--matrixhub is required when using --register")
@@ -177,21 +210,26 @@ def cmd_harvest_repo(args: argparse.Namespace) -> None:
         register=bool(args.register),
         matrixhub_url=args.matrixhub,
         emit_minimal=bool(args.emit_minimal),
+        no_cache=bool(args.no_cache),
     )
 
-    # Convert dataclass-like to plain dict for JSON
+    # Paths are left as-is; _PathEncoder stringifies them while streaming
     payload: dict[str, Any] = {
-        "manifests": [str(p) for p in getattr(res, "manifests", [])],
-        "index_path": str(getattr(res, "index_path", "")),
+        "manifests": getattr(res, "manifests", []),
+        "index_path": getattr(res, "index_path", ""),
         "errors": list(getattr(res, "errors", [])),
         "summary": getattr(res, "summary", {}),
     }
-    _print_json(payload)
+    _stream_json(payload)
 
 
 def cmd_harvest_source(args: argparse.Namespace) -> None:
-    if harvest_source is None:  # pragma: no cover
-        raise SystemExit("harvest-source is unavailable: .harvest.source not found in package")
+    try:
+        from .harvest.source import harvest_source
+    except Exception:  # pragma: no cover
+        raise SystemExit(
+            "harvest-source is unavailable: .harvest.source not found in package"
+        ) from None
 
     if args.register and not args.matrixhub:
         raise SystemExit("--matrixhub is required when using --register")
@@ -218,10 +256,12 @@ def cmd_harvest_source(args: argparse.Namespace) -> None:
 
 
 def cmd_harvest_registry(args: argparse.Namespace) -> None:
-    if harvest_registry is None:  # pragma: no cover
+    try:
+        from .registry.harvest import harvest_registry
+    except Exception:  # pragma: no cover
         raise SystemExit(
             "harvest-registry is unavailable: httpx dependency required (pip install httpx)"
-        )
+        ) from None
 
     index_path = harvest_registry(
         registry_base_url=args.registry_base,
@@ -239,17 +279,14 @@ def cmd_harvest_registry(args: argparse.Namespace) -> None:
 # ------------------------- parser -------------------------
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="mcp-ingest", description="MCP ingest SDK/CLI")
-    sub = p.add_subparsers(dest="cmd", required=True)
-
-    # detect
-    d = sub.add_parser("detect", help="Detect FastMCP server metadata (offline)")
+# detect
+def _args_detect(d: argparse.ArgumentParser) -> None:
     d.add_argument("source", help="file or directory to scan")
     d.set_defaults(func=cmd_detect)
 
-    # describe
-    s = sub.add_parser("describe", help="Write manifest.json + index.json")
+
+# describe
+def _args_describe(s: argparse.ArgumentParser) -> None:
     s.add_argument("name")
     s.add_argument("url")
     s.add_argument("--tools", nargs="*", help="tool names (optional)")
@@ -262,11 +299,14 @@ def build_parser() -> argparse.ArgumentParser:
     s.add_argument("--version", default="0.1.0")
     s.add_argument("--entity-id")
     s.add_argument("--entity-name")
-    s.add_argument("--out", default=".")
+    s.add_argument(
+        "--out", default=".", help="output directory; '-' prints the manifest without writing files"
+    )
     s.set_defaults(func=cmd_describe)
 
-    # register
-    r = sub.add_parser("register", help="Register manifest to MatrixHub /catalog/install")
+
+# register
+def _args_register(r: argparse.ArgumentParser) -> None:
     r.add_argument("--matrixhub", required=True)
     r.add_argument("--manifest", default="./manifest.json")
     r.add_argument("--entity-uid")
@@ -274,14 +314,17 @@ def build_parser() -> argparse.ArgumentParser:
     r.add_argument("--token")
     r.set_defaults(func=cmd_register)
 
-    # pack (detect -> describe -> optional register)
-    k = sub.add_parser("pack", help="Detect, describe, and optionally register in one go")
+
+# pack (detect -> describe -> optional register)
+def _args_pack(k: argparse.ArgumentParser) -> None:
     k.add_argument("source", help="file or directory to scan")
     k.add_argument("--name")
     k.add_argument("--url")
     k.add_argument("--description", default="")
     k.add_argument("--version", default="0.1.0")
-    k.add_argument("--out", default=".")
+    k.add_argument(
+        "--out", default=".", help="output directory; '-' prints the manifest without writing files"
+    )
     k.add_argument("--register", action="store_true")
     k.add_argument("--matrixhub")
     k.add_argument("--entity-uid")
@@ -289,11 +332,9 @@ def build_parser() -> argparse.ArgumentParser:
     k.add_argument("--token")
     k.set_defaults(func=cmd_pack)
 
-    # harvest-repo (repo-wide discovery -> many manifests)
-    h = sub.add_parser(
-        "harvest-repo",
-        help="Scan a repo (dir|git|zip), generate per-server manifests and a repo-level index",
-    )
+
+# harvest-repo (repo-wide discovery -> many manifests)
+def _args_harvest_repo(h: argparse.ArgumentParser) -> None:
     h.add_argument("source", help="path | git URL | zip URL of a repo to harvest")
     h.add_argument("--out", default="dist/servers", help="output directory for artifacts")
     h.add_argument(
@@ -309,15 +350,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=True,
         help="emit minimal manifests for candidates with no detector signal (default: True)",
     )
+    h.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="re-run detectors instead of reusing cached results for unchanged directories",
+    )
     h.set_defaults(func=cmd_harvest_repo)
 
-    # harvest-source (README extractor -> multi-repo harvest -> merge)
-    hs = sub.add_parser(
-        "harvest-source",
-        help=(
-            "Extract README links from a GitHub repo, harvest each candidate, and merge into one catalog"
-        ),
-    )
+
+# harvest-source (README extractor -> multi-repo harvest -> merge)
+def _args_harvest_source(hs: argparse.ArgumentParser) -> None:
     hs.add_argument("repo", help="GitHub repository URL to read the README from")
     hs.add_argument("--out", required=True, help="Output directory for merged catalog")
     hs.add_argument("-y", "--yes", action="store_true", help="Skip confirmation prompt")
@@ -358,11 +401,9 @@ def build_parser() -> argparse.ArgumentParser:
     )
     hs.set_defaults(func=cmd_harvest_source)
 
-    # harvest-registry (Registry API → catalog)
-    hr = sub.add_parser(
-        "harvest-registry",
-        help="Harvest MCP servers from Registry API (recommended for production catalogs)",
-    )
+
+# harvest-registry (Registry API → catalog)
+def _args_harvest_registry(hr: argparse.ArgumentParser) -> None:
     hr.add_argument(
         "--registry-base",
         default="https://registry.modelcontextprotocol.io",
@@ -409,11 +450,46 @@ def build_parser() -> argparse.ArgumentParser:
     )
     hr.set_defaults(func=cmd_harvest_registry)
 
+
+# name -> (help, argument registrar). Only the invoked command's arguments are
+# registered; the others get a bare stub so `--help` and choice errors still list them.
+_SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "detect": ("Detect FastMCP server metadata (offline)", _args_detect),
+    "describe": ("Write manifest.json + index.json", _args_describe),
+    "register": ("Register manifest to MatrixHub /catalog/install", _args_register),
+    "pack": ("Detect, describe, and optionally register in one go", _args_pack),
+    "harvest-repo": (
+        "Scan a repo (dir|git|zip), generate per-server manifests and a repo-level index",
+        _args_harvest_repo,
+    ),
+    "harvest-source": (
+        "Extract README links from a GitHub repo, harvest each candidate, and merge into one catalog",
+        _args_harvest_source,
+    ),
+    "harvest-registry": (
+        "Harvest MCP servers from Registry API (recommended for production catalogs)",
+        _args_harvest_registry,
+    ),
+}
+
+
+@functools.cache
+def build_parser(cmd: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with *cmd*, fully register only that subcommand."""
+    p = argparse.ArgumentParser(prog="mcp-ingest", description="MCP ingest SDK/CLI")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    for name, (help_, add_args) in _SUBCOMMANDS.items():
+        sp = sub.add_parser(name, help=help_)
+        if cmd is None or name == cmd:
+            add_args(sp)
     return p
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    cmd = argv[0] if argv and argv[0] in _SUBCOMMANDS else None
+    parser = build_parser(cmd)
     args = parser.parse_args(argv)
     args.func(args)
     return 0
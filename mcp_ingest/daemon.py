@@ -0,0 +1,130 @@
+"""mcp_ingest.daemon
+
+Keeps one warm interpreter around for callers that run many short CLI jobs
+(e.g. the harvester service). Every job is a regular `mcp-ingest` invocation,
+forked from the daemon so it starts with the CLI and harvesters already imported
+and still gets a private process (stdout, cwd, globals, crash isolation).
+
+Protocol, over an AF_UNIX stream socket, one job per connection:
+  - the client sends one JSON line ``{"argv": [...], "cwd": str|null, "timeout": int|null}``
+    with its stdout and stderr file descriptors attached (SCM_RIGHTS);
+  - the job's output goes straight to those descriptors;
+  - the daemon answers ``{"rc": int}`` and closes. A connection that closes
+    without an answer means the job died (e.g. killed at its timeout).
+
+Run with: mcp-ingest-daemon --socket /var/run/mcp-ingest.sock (Linux/macOS only).
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+from pathlib import Path
+
+__all__ = ["DEFAULT_SOCKET", "serve", "main"]
+
+DEFAULT_SOCKET = "/var/run/mcp-ingest.sock"
+
+# Imported once in the daemon so forked jobs don't pay for them
+_PRELOAD = ("mcp_ingest.cli", "mcp_ingest.sdk", "mcp_ingest.harvest.repo")
+_MAX_REQUEST = 64 * 1024
+
+
+def _preload() -> None:
+    for name in _PRELOAD:
+        try:
+            importlib.import_module(name)
+        except Exception:  # pragma: no cover - optional extras missing
+            pass
+
+
+def _run_job(conn: socket.socket) -> int:
+    """Child side: read the request, wire up the passed fds, run the CLI."""
+    msg, fds, _flags, _addr = socket.recv_fds(conn, _MAX_REQUEST, 2)
+    if len(fds) != 2:
+        raise ValueError("expected stdout and stderr descriptors")
+    req = json.loads(msg)
+    os.dup2(fds[0], 1)
+    os.dup2(fds[1], 2)
+    for fd in fds:
+        os.close(fd)
+    if req.get("cwd"):
+        os.chdir(req["cwd"])
+    if req.get("timeout"):
+        signal.alarm(int(req["timeout"]))  # default SIGALRM action ends the job
+
+    from .cli import main as cli_main
+
+    try:
+        rc = cli_main([str(a) for a in req.get("argv") or []])
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            rc = e.code or 0
+        else:
+            sys.stderr.write(f"{e.code}\n")
+            rc = 1
+    except BaseException:
+        traceback.print_exc()
+        rc = 1
+    return rc
+
+
+def _child(conn: socket.socket) -> None:
+    rc = 1
+    try:
+        rc = _run_job(conn)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            conn.sendall(json.dumps({"rc": rc}).encode("utf-8") + b"\n")
+        finally:
+            os._exit(0)
+
+
+def serve(path: str | Path = DEFAULT_SOCKET) -> None:
+    """Accept jobs on the socket at *path* forever, one forked child per job."""
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    _preload()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # children are reaped automatically
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as srv:
+        srv.bind(str(path))
+        os.chmod(path, 0o660)
+        srv.listen(64)
+        while True:
+            conn, _ = srv.accept()
+            if os.fork() == 0:
+                srv.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                _child(conn)
+            conn.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="mcp-ingest-daemon", description="Serve mcp-ingest jobs from a warm interpreter"
+    )
+    p.add_argument(
+        "--socket",
+        default=os.getenv("MCP_INGEST_SOCKET", DEFAULT_SOCKET),
+        help="Unix socket path to listen on (env: MCP_INGEST_SOCKET)",
+    )
+    args = p.parse_args(argv)
+    try:
+        serve(args.socket)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
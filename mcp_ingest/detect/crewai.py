@@ -4,6 +4,7 @@ import ast
 from pathlib import Path
 from typing import Any
 
+from ..utils.io import iter_files
 from .base import DetectReport
 
 try:  # optional YAML parsing (graceful degrade)
@@ -21,7 +22,7 @@ _TASK_CALL = "Task"
 def _walk_py(root: Path) -> list[Path]:
     if root.is_file() and root.suffix == ".py":
         return [root]
-    return [p for p in root.rglob("*.py") if p.is_file()]
+    return list(iter_files(root, ".py"))
 
 
 def _call_name(node: ast.AST) -> str:
@@ -121,7 +122,7 @@ def detect_path(source: str) -> DetectReport:
             )
 
     # Parse YAML crew files (agents.yaml, tasks.yaml, crew.yaml)
-    for y in [p for p in root.rglob("*.yaml") if p.is_file()]:
+    for y in iter_files(root, ".yaml"):
         if y.name not in {"agents.yaml", "tasks.yaml", "crew.yaml"}:
             continue
         data = _load_yaml(y)
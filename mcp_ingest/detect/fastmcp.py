@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from ..utils.io import iter_files
 from ..utils.jsonschema import infer_schema_from_ast_func
 from .base import DetectReport
 
@@ -10,7 +11,7 @@ from .base import DetectReport
 def _walk_py_files(root: Path) -> list[Path]:
     if root.is_file() and root.suffix == ".py":
         return [root]
-    return [p for p in root.rglob("*.py") if p.is_file()]
+    return list(iter_files(root, ".py"))
 
 
 def _is_tool_decorator(dec: ast.expr) -> bool:
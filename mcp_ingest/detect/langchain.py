@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from ..utils.io import iter_files
 from ..utils.jsonschema import infer_schema_from_ast_func
 from .base import DetectReport
 
@@ -21,7 +22,7 @@ _PROMPT_HINTS = ("PromptTemplate", "from langchain.prompts")
 def _walk_py(root: Path) -> list[Path]:
     if root.is_file() and root.suffix == ".py":
         return [root]
-    return [p for p in root.rglob("*.py") if p.is_file()]
+    return list(iter_files(root, ".py"))
 
 
 def _is_langchain_file(text: str) -> bool:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from ..utils.io import iter_files
 from ..utils.jsonschema import infer_schema_from_ast_func
 from .base import DetectReport
 
@@ -30,7 +31,7 @@ _LI_AGENT_NAMES = {
 def _walk_py(root: Path) -> list[Path]:
     if root.is_file() and root.suffix == ".py":
         return [root]
-    return [p for p in root.rglob("*.py") if p.is_file()]
+    return list(iter_files(root, ".py"))
 
 
 def _call_name(node: ast.AST) -> str:
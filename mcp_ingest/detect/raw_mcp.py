@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from ..utils.io import iter_files
 from .base import DetectReport
 
 __all__ = ["detect_path"]
@@ -18,7 +19,7 @@ def _candidate_files(root: Path) -> list[Path]:
         return [root] if root.suffix == ".py" else []
     names = {"server.py", "app.py", "main.py"}
     out: list[Path] = []
-    for p in root.rglob("*.py"):
+    for p in iter_files(root, ".py"):
         if p.name in names or "/server/" in str(p.as_posix()):
             out.append(p)
     return out
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Literal
 
-from ..utils.sse import ensure_sse, strip_trailing_slash
+from ..utils.sse import ensure_sse as _ensure_sse_raw
+from ..utils.sse import strip_trailing_slash
 
 __all__ = ["build_manifest"]
 
 REQUIRED_TOP = ("type", "id", "name", "version")
+_REQ_GET = itemgetter(*REQUIRED_TOP)
+_D2S = str.maketrans("-", " ")
+_S2D = str.maketrans(" ", "-")
+
+# ensure_sse is a pure string transform; servers harvested from one repo often
+# share a base URL, so memoize it.
+ensure_sse = lru_cache(maxsize=512)(_ensure_sse_raw)
 AllowedTransport = Literal["SSE", "STDIO", "WS"]
 
 
@@ -49,7 +59,7 @@ def build_manifest(
         raise ValueError("transport must be one of: 'SSE', 'STDIO', 'WS'")
 
     ent_id = entity_id or f"{server_name}-agent"
-    ent_name = entity_name or server_name.replace("-", " ").title()
+    ent_name = entity_name or server_name.translate(_D2S).title()
 
     # ---- Build the server block based on transport ----
     server_block: dict[str, Any] = {
@@ -102,7 +112,7 @@ def build_manifest(
     # ---- Optional tool block ----
     tool_block: dict[str, Any] | None = None
     if tool_id or tool_name:
-        _tid = tool_id or (tool_name or "tool").replace(" ", "-").lower()
+        _tid = tool_id or (tool_name or "tool").translate(_S2D).lower()
         _tname = tool_name or tool_id or "tool"
         tool_block = {
             "id": _tid,
@@ -111,21 +121,32 @@ def build_manifest(
             "integration_type": "MCP",
         }
 
-    res_list = list(resources or [])
-    pr_list = list(prompts or [])
-
-    # Associated IDs
-    assoc_tools = [tool_block["id"]] if tool_block else []
-    assoc_resources = [r.get("id", r.get("name")) for r in res_list if isinstance(r, dict)]
-    assoc_prompts = [p.get("id") for p in pr_list if isinstance(p, dict) and p.get("id")]
-
-    server_block.update(
-        {
-            "associated_tools": assoc_tools,
-            "associated_resources": assoc_resources,
-            "associated_prompts": assoc_prompts,
-        }
-    )
+    # Copy resources/prompts and collect their associated IDs in the same pass
+    res_list: list[dict[str, Any]] = []
+    assoc_resources: list[Any] = []
+    for r in resources or ():
+        res_list.append(r)
+        if isinstance(r, dict):
+            assoc_resources.append(r.get("id", r.get("name")))
+
+    pr_list: list[dict[str, Any]] = []
+    assoc_prompts: list[Any] = []
+    for pr in prompts or ():
+        pr_list.append(pr)
+        if isinstance(pr, dict) and pr.get("id"):
+            assoc_prompts.append(pr["id"])
+
+    server_block["associated_tools"] = [tool_block["id"]] if tool_block else []
+    server_block["associated_resources"] = assoc_resources
+    server_block["associated_prompts"] = assoc_prompts
+
+    mcp_reg: dict[str, Any] = {
+        "resources": res_list,
+        "prompts": pr_list,
+        "server": server_block,
+    }
+    if tool_block:
+        mcp_reg["tool"] = tool_block
 
     manifest: dict[str, Any] = {
         "type": "mcp_server",
@@ -133,12 +154,7 @@ def build_manifest(
         "name": ent_name,
         "version": version,
         "description": description,
-        "mcp_registration": {
-            **({"tool": tool_block} if tool_block else {}),
-            "resources": res_list,
-            "prompts": pr_list,
-            "server": server_block,
-        },
+        "mcp_registration": mcp_reg,
     }
 
     _validate_manifest(manifest)
@@ -146,10 +162,14 @@ def build_manifest(
 
 
 def _validate_manifest(manifest: dict[str, Any]) -> None:
-    # Top-level required
-    for k in REQUIRED_TOP:
-        if not manifest.get(k):
-            raise ValueError(f"manifest missing required field: {k}")
+    # Top-level required (one C-level fetch for all fields)
+    try:
+        vals = _REQ_GET(manifest)
+    except KeyError as e:
+        raise ValueError(f"manifest missing required field: {e.args[0]}") from None
+    if not all(vals):
+        missing = next(k for k, v in zip(REQUIRED_TOP, vals, strict=True) if not v)
+        raise ValueError(f"manifest missing required field: {missing}")
 
     mreg = manifest.get("mcp_registration")
     if not isinstance(mreg, dict):
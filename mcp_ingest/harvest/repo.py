@@ -27,9 +27,15 @@ Compatibility: MatrixHub /catalog/install (via sdk.autoinstall)
 
 import json
 import logging
+import os
+import re
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from ..detect.base import DetectReport
 from ..detect.fastmcp import detect_path as detect_fastmcp
@@ -37,9 +43,11 @@ from ..detect.langchain import detect_path as detect_langchain
 from ..detect.raw_mcp import detect_path as detect_raw_mcp
 from ..emit.enrich import enrich_manifest
 from ..emit.index import write_index
-from ..sdk import autoinstall as sdk_autoinstall
+from ..sdk import autoinstall_many as sdk_autoinstall_many
 from ..sdk import describe as sdk_describe
+from ..utils import _json, detect_cache
 from ..utils.fetch import LocalSource, prepare_source
+from ..utils.io import iter_files
 
 # Optional publisher; imported lazily when used
 try:  # pragma: no cover (optional dep path at runtime)
@@ -47,6 +55,11 @@ try:  # pragma: no cover (optional dep path at runtime)
 except Exception:  # pragma: no cover
     publish_static = None  # type: ignore
 
+try:  # optional
+    import pathspec
+except Exception:  # pragma: no cover
+    pathspec = None  # type: ignore
+
 __all__ = ["HarvestResult", "harvest_repo"]
 
 log = logging.getLogger(__name__)
@@ -73,6 +86,7 @@ def harvest_repo(
     register: bool = False,
     matrixhub_url: str | None = None,
     emit_minimal: bool = True,
+    no_cache: bool = False,
 ) -> HarvestResult:
     """Harvest a repo for MCP servers and emit manifests/index.
 
@@ -91,6 +105,9 @@ def harvest_repo(
     emit_minimal : bool
         If True (default), emit minimal manifests for candidates with no detector signal.
         If False, skip candidates with no detector signal (useful for automated harvesting).
+    no_cache : bool
+        If True, bypass the on-disk detector cache (see utils.detect_cache). The cache is
+        only consulted for local directory sources; clones and archives are always fresh.
     """
 
     log.info(
@@ -102,6 +119,8 @@ def harvest_repo(
     )
 
     manifests: list[Path] = []
+    # manifest path -> enriched document, so register doesn't re-read what we just wrote
+    docs: dict[Path, dict[str, Any]] = {}
     errors: list[str] = []
     by_detector: dict[str, int] = {"fastmcp": 0, "node": 0, "langchain": 0, "raw": 0}
     transports: dict[str, int] = {"sse": 0, "messages": 0, "unknown": 0}
@@ -134,10 +153,15 @@ def harvest_repo(
         log.debug("output root: %s", out_root)
 
         # 4) Process candidates
+        use_cache = not no_cache and local.kind == "dir"
+        repo_slug = _repo_slug(local)
         for cdir in candidates:
             log.info("candidate: %s", cdir)
             try:
-                report, detector_tag = _run_detectors_in_order(cdir)
+                if use_cache:
+                    report, detector_tag = _run_detectors_cached(cdir)
+                else:
+                    report, detector_tag = _run_detectors_in_order(cdir)
                 log.debug(
                     "detector result: dir=%s detector=%s conf=%.2f tools=%s url=%s",
                     cdir,
@@ -184,7 +208,7 @@ def harvest_repo(
                         resources.append({"uri": f"file://{hint}", "name": hint.name})
 
                 # Per-server output dir: make a stable slug
-                rel_slug = _slug_from_repo_and_path(local, cdir)
+                rel_slug = _slug_from_repo_and_path(local, cdir, repo_slug)
                 srv_out = out_root / rel_slug
                 srv_out.mkdir(parents=True, exist_ok=True)
 
@@ -237,9 +261,10 @@ def harvest_repo(
                     server_file = candidate_server
                 else:
                     # small search inside candidate dir
-                    for py in cdir.rglob("server.py"):
-                        server_file = py
-                        break
+                    server_file = next(
+                        (py for py in iter_files(cdir, "server.py") if py.name == "server.py"),
+                        None,
+                    )
 
                 if server_file is not None:
                     try:
@@ -250,7 +275,7 @@ def harvest_repo(
                         server_relpath = None
 
                 # --- NEW: enrich in place ---
-                enrich_manifest(
+                docs[mpath] = enrich_manifest(
                     mpath,
                     homepage=homepage,
                     git_origin=git_origin,
@@ -264,12 +289,16 @@ def harvest_repo(
                 log.warning("candidate failed: %s (%s)", cdir, e)
                 errors.append(f"{cdir}: {e}")
 
+        if use_cache:
+            detect_cache.flush()
+
         # 6) Repo-level index.json
         repo_index = out_root / "index.json"
         # Paths in index can be relative to out_root for portability
+        root_prefix = os.path.join(str(out_root), "")
+        n = len(root_prefix)
         rel_manifest_paths = [
-            str(p.relative_to(out_root)) if str(p).startswith(str(out_root)) else str(p)
-            for p in manifests
+            ps[n:] if ps.startswith(root_prefix) else ps for ps in map(str, manifests)
         ]
         write_index(repo_index, rel_manifest_paths, additive=False)
         log.info("wrote repo index: %s (manifests=%d)", repo_index, len(manifests))
@@ -301,15 +330,36 @@ def harvest_repo(
                 log.error(msg)
                 errors.append(msg)
             else:
+                # Use the documents kept from step 5; only a manifest whose enrichment
+                # failed is read back from disk. A read/parse failure is kept in place
+                # and reported in order.
+                loaded: list[tuple[Path, Any]] = []
                 for mpath in manifests:
+                    doc = docs.get(mpath)
+                    if doc is not None:
+                        loaded.append((mpath, doc))
+                        continue
                     try:
-                        with open(mpath, encoding="utf-8") as fh:
-                            manifest = json.load(fh)
-                        sdk_autoinstall(matrixhub_url=matrixhub_url, manifest=manifest)
+                        loaded.append((mpath, _loads(mpath.read_bytes())))
+                    except Exception as le:  # pragma: no cover - env dependent
+                        loaded.append((mpath, le))
+
+                # One batched install for everything that parsed (the hub client falls
+                # back to concurrent single installs when the hub has no batch route).
+                docs_ok = [m for _, m in loaded if not isinstance(m, Exception)]
+                try:
+                    results = iter(
+                        sdk_autoinstall_many(matrixhub_url=matrixhub_url, manifests=docs_ok)
+                    )
+                except Exception as be:  # pragma: no cover - env dependent
+                    results = iter([be] * len(docs_ok))
+                for mpath, manifest in loaded:
+                    res = manifest if isinstance(manifest, Exception) else next(results)
+                    if isinstance(res, Exception):
+                        log.error("register failed for %s: %s", mpath.name, res)
+                        errors.append(f"register failed for {mpath.name}: {res}")
+                    else:
                         log.info("registered manifest: %s", mpath.name)
-                    except Exception as re:  # pragma: no cover - env dependent
-                        log.exception("register failed for %s: %s", mpath.name, re)
-                        errors.append(f"register failed for {mpath.name}: {re}")
 
         summary: dict[str, object] = {
             "source": local.origin,
@@ -340,6 +390,12 @@ def harvest_repo(
 
 PY_SERVER_FILENAMES = {"server.py", "app.py", "main.py"}
 
+# Any of these in a small .py file marks its directory as a server (raw bytes, one pass)
+_PY_SERVER_MARKERS = re.compile(rb"FastMCP\(|@mcp\.tool|from mcp\.server")
+
+# Top-level folders whose whole subtree is scanned regardless of depth
+_SPECIAL_DIR_NAMES = {"servers", "packages", "examples", "apps", "services"}
+
 # Directories to ignore during candidate discovery (vendor/build/cache dirs)
 IGNORE_DIR_NAMES = {
     "node_modules",
@@ -378,6 +434,46 @@ IGNORE_DIR_NAMES = {
 }
 
 
+# Vendored/build/cache/editor trees that never hold a server: not inspected even
+# as direct children of the root, and never descended into
+_PRUNE_DIR_NAMES = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".next",
+        ".nuxt",
+        ".cache",
+        "coverage",
+        ".idea",
+        ".vscode",
+    }
+)
+
+
+def _load_gitignore(root: Path) -> Any:
+    """Return a pathspec matcher for *root*/.gitignore, or None (no file / no pathspec)."""
+    if pathspec is None:
+        return None
+    try:
+        lines = (root / ".gitignore").read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return None
+    try:
+        return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+    except Exception as e:
+        log.debug("candidate:gitignore unusable in %s: %s", root, e)
+        return None
+
+
 def _is_ignored_dir(p: Path) -> bool:
     """Check if path contains any ignored directory in its components."""
     return any(part in IGNORE_DIR_NAMES for part in p.parts)
@@ -391,57 +487,86 @@ def _iter_candidate_dirs(root: Path) -> Iterable[Path]:
       - any directory containing server.py/app.py/main.py
       - any directory containing package.json (Node-based MCP)
       - special folders named "servers", "packages", "examples" (scan their children)
-    """
-    seen: set[Path] = set()
 
-    def add(p: Path, reason: str) -> None:
-        if p.is_dir() and p not in seen:
-            seen.add(p)
-            log.debug("candidate:add %s (%s)", p, reason)
-
-    # Consider root as candidate
-    if _looks_like_py_server_dir(root):
-        add(root, "root:py-server")
-    elif _has_package_json(root):
-        add(root, "root:package.json")
-
-    # 1) direct children heuristic
-    for child in root.iterdir():
-        if child.is_dir() and child.name in {"servers", "packages", "examples", "apps", "services"}:
-            for sub in child.rglob("*"):
-                if not sub.is_dir():
-                    continue
-                if _is_ignored_dir(sub):
-                    continue
-                if _looks_like_py_server_dir(sub):
-                    add(sub, "rglob:py-server")
-                elif _has_package_json(sub):
-                    add(sub, "rglob:package.json")
-        elif child.is_dir():
-            if _looks_like_py_server_dir(child):
-                add(child, "child:py-server")
-            elif _has_package_json(child):
-                add(child, "child:package.json")
-
-    # 2) fallback: scan up to a limited depth for server.py/package.json
-    # Depth guard to avoid pathological repos
-    max_depth = 4
-    for sub in root.rglob("*"):
-        if not sub.is_dir():
-            continue
-        if _is_ignored_dir(sub):
-            continue
-        if _depth(root, sub) > max_depth:
+    A single breadth-first os.scandir walk lists the directories to inspect;
+    the per-directory inspection (stat + small reads) is I/O bound and runs on
+    a thread pool. Ignored directories are checked when they are direct
+    children of *root* but never descended into; vendored/cache directories
+    (and, with ``pathspec`` installed, anything the root .gitignore excludes)
+    are skipped outright.
+    """
+    max_depth = 4  # depth guard to avoid pathological repos (not applied under special folders)
+    root_ignored = _is_ignored_dir(root)
+    gitignore = _load_gitignore(root)
+    root_s = str(root)
+
+    # directory -> where it was found (only used for logging)
+    to_check: dict[Path, str] = {root: "root"}
+    queue: deque[tuple[str, int, bool]] = deque([(str(root), 0, False)])
+    while queue:
+        cur, depth, special = queue.popleft()
+        try:
+            with os.scandir(cur) as it:
+                entries = [e for e in it if e.is_dir()]
+        except OSError:
             continue
-        if _looks_like_py_server_dir(sub):
-            add(sub, "fallback:py-server")
-        elif _has_package_json(sub):
-            add(sub, "fallback:package.json")
+        depth += 1
+        for e in entries:
+            if e.name in _PRUNE_DIR_NAMES:
+                continue
+            if gitignore is not None:
+                rel = os.path.relpath(e.path, root_s).replace(os.sep, "/")
+                if gitignore.match_file(rel + "/"):
+                    continue
+            ignored = root_ignored or e.name in IGNORE_DIR_NAMES
+            if depth == 1 and e.name in _SPECIAL_DIR_NAMES:
+                sub_special = True
+                where = None if ignored else "special"
+            elif depth == 1:
+                sub_special = False
+                where = "child"
+            else:
+                sub_special = special
+                if ignored:
+                    where = None
+                elif special:
+                    where = "special"
+                else:
+                    where = "fallback" if depth <= max_depth else None
+            if where:
+                to_check[Path(e.path)] = where
+            if not ignored and (sub_special or depth < max_depth) and not e.is_symlink():
+                queue.append((e.path, depth, sub_special))
+
+    dirs = list(to_check)
+    seen: set[Path] = set()
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        for d, kind in zip(dirs, ex.map(_classify_dir, dirs), strict=True):
+            if kind:
+                seen.add(d)
+                log.debug("candidate:add %s (%s:%s)", d, to_check[d], kind)
 
     # Prefer stable order
     return sorted(seen, key=lambda p: str(p))
 
 
+def _classify_dir(d: Path) -> str | None:
+    entries = _list_dir(d)  # one scandir shared by both checks
+    if _looks_like_py_server_dir(d, entries):
+        return "py-server"
+    if _has_package_json(d, entries):
+        return "package.json"
+    return None
+
+
+def _list_dir(d: Path) -> dict[str, os.DirEntry[str]]:
+    try:
+        with os.scandir(d) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
 def _depth(root: Path, sub: Path) -> int:
     try:
         return len(sub.relative_to(root).parts)
@@ -449,33 +574,37 @@ def _depth(root: Path, sub: Path) -> int:
         return 0
 
 
-def _looks_like_py_server_dir(d: Path) -> bool:
+def _looks_like_py_server_dir(d: Path, entries: dict[str, os.DirEntry[str]] | None = None) -> bool:
+    if entries is None:
+        entries = _list_dir(d)
     # quick signals
-    for name in PY_SERVER_FILENAMES:
-        if (d / name).exists():
-            return True
+    if not PY_SERVER_FILENAMES.isdisjoint(entries):
+        return True
     # scan small files for FastMCP/@tool
     try:
-        for py in d.glob("*.py"):
-            if py.stat().st_size > 256_000:
+        for name, e in entries.items():
+            if not name.endswith(".py") or e.stat().st_size > 256_000:
                 continue
-            txt = py.read_text(encoding="utf-8", errors="ignore")
-            if "FastMCP(" in txt or "@mcp.tool" in txt or "from mcp.server" in txt:
-                return True
+            with open(e.path, "rb") as fh:
+                if _PY_SERVER_MARKERS.search(fh.read()):
+                    return True
     except Exception:
         pass
     return False
 
 
-def _has_package_json(d: Path) -> bool:
+def _has_package_json(d: Path, entries: dict[str, os.DirEntry[str]] | None = None) -> bool:
     """Check if directory has package.json with MCP-related dependencies."""
-    pj = d / "package.json"
-    if not pj.exists():
+    if entries is None:
+        entries = _list_dir(d)
+    pj = entries.get("package.json")
+    if pj is None:
         return False
     try:
         if pj.stat().st_size > 256_000:
             return False
-        data = json.loads(pj.read_text(encoding="utf-8", errors="ignore"))
+        with open(pj.path, "rb") as fh:
+            data = _loads(fh.read())
         deps = {}
         for k in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
             v = data.get(k)
@@ -524,6 +653,19 @@ def _run_detectors_in_order(cdir: Path) -> tuple[DetectReport, str]:
     return rep, "raw"
 
 
+def _run_detectors_cached(cdir: Path) -> tuple[DetectReport, str]:
+    """_run_detectors_in_order, memoized on disk by the directory's metadata fingerprint."""
+    key = detect_cache.content_key(cdir)
+    hit = detect_cache.lookup(key)
+    if hit is not None:
+        log.debug("detector cache hit: %s", cdir)
+        data, tag = hit
+        return DetectReport(**data), tag
+    rep, tag = _run_detectors_in_order(cdir)
+    detect_cache.store(key, rep.to_dict(), tag)
+    return rep, tag
+
+
 def _has_signal(rep: DetectReport | None) -> bool:
     if not rep:
         return False
@@ -538,6 +680,9 @@ def _has_signal(rep: DetectReport | None) -> bool:
 
 # Minimal Node MCP heuristic (kept local to avoid a whole new module for MVP)
 
+# First "PORT=NNNN" / "--port NNNN" / "-p NNNN" in package.json scripts
+_PORT_RE = re.compile(r"(?:PORT=|--port[=\s]\s*|-p\s+)(\d+)")
+
 
 def _detect_node_mcp(path: str) -> DetectReport:
     d = Path(path)
@@ -546,7 +691,7 @@ def _detect_node_mcp(path: str) -> DetectReport:
     if not pj.exists():
         return out
     try:
-        data = json.loads(pj.read_text(encoding="utf-8", errors="ignore"))
+        data = _loads(pj.read_bytes())
     except Exception:
         return out
 
@@ -572,16 +717,8 @@ def _detect_node_mcp(path: str) -> DetectReport:
     route = "/sse"
     if "/messages" in joined_scripts:
         route = "/messages"
-    port = 6288
-    for hint in ("PORT=", "--port ", "-p "):
-        if hint in joined_scripts:
-            try:
-                # very loose parse
-                tail = joined_scripts.split(hint, 1)[1].split()[0]
-                port = int("".join(ch for ch in tail if ch.isdigit()))
-                break
-            except Exception:
-                pass
+    m = _PORT_RE.search(joined_scripts)
+    port = int(m.group(1)) if m else 6288
 
     out.server_url = f"http://127.0.0.1:{port}{route}"
 
@@ -603,29 +740,51 @@ def _detect_node_mcp(path: str) -> DetectReport:
 # ----------------------------
 
 
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available); undecodable bytes are dropped."""
+    try:
+        return _json.loads(raw)
+    except _json.JSONDecodeError:
+        pass  # e.g. invalid UTF-8: let the lenient path decide
+    return json.loads(raw.decode("utf-8", errors="ignore"))
+
+
 def _default_url() -> str:
     # offline-friendly default SSE endpoint
     return "http://127.0.0.1:6288/sse"
 
 
+_TRANSPORT_TAGS = {"sse": "sse", "messages": "messages"}
+
+
 def _transport_tag(url: str) -> str:
-    u = url.lower().strip()
-    if u.endswith("/sse"):
-        return "sse"
-    if u.endswith("/messages"):
-        return "messages"
-    return "unknown"
+    _, slash, last = url.strip().rpartition("/")
+    return _TRANSPORT_TAGS.get(last.lower(), "unknown") if slash else "unknown"
+
+
+_SLUG_TRANS = str.maketrans({"/": "__", " ": "-"})
+
+
+def _repo_slug(local: LocalSource) -> str:
+    return (local.repo_name or Path(local.path).name).lower().replace(" ", "-")
 
 
-def _slug_from_repo_and_path(local: LocalSource, cdir: Path) -> str:
-    """Stable slug like: <repo-name>__path__to__dir"""
-    repo = (local.repo_name or Path(local.path).name).lower().replace(" ", "-")
+@lru_cache(maxsize=4096)
+def _join_slug(repo: str, rel: str) -> str:
+    safe = rel.strip("/").translate(_SLUG_TRANS)
+    return f"{repo}__{safe}" if safe else repo
+
+
+def _slug_from_repo_and_path(local: LocalSource, cdir: Path, repo_slug: str | None = None) -> str:
+    """Stable slug like: <repo-name>__path__to__dir
+
+    Pass *repo_slug* (see _repo_slug) when slugging many dirs of the same repo.
+    """
     try:
         rel = cdir.relative_to(local.path).as_posix()
     except Exception:
         rel = cdir.as_posix()
-    safe = rel.strip("/").replace("/", "__").replace(" ", "-")
-    return f"{repo}__{safe}" if safe else repo
+    return _join_slug(repo_slug if repo_slug is not None else _repo_slug(local), rel)
 
 
 def _first_existing(*candidates: Path) -> Path | None:
@@ -23,7 +23,7 @@ import tempfile
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 from urllib.parse import urlparse
 
 from ..harvest.repo import HarvestResult, harvest_repo
@@ -226,16 +226,20 @@ def _run_plan(
 
 
 def _register_many(matrixhub_url: str, manifest_paths: Sequence[str]) -> None:
-    client = HubClient(matrixhub_url)
+    items: list[dict[str, Any]] = []
     for mp in manifest_paths:
         try:
             data = json.loads(Path(mp).read_text(encoding="utf-8"))
             entity_uid = (
-                f"{data.get('type', 'mcp_server')}:{data.get('id')}@{data.get('version', '0.1.0')}"
+                f"{data.get('type', 'mcp_server')}:{data.get('id')}"
+                f"@{data.get('version', '0.1.0')}"
             )
-            client.install_manifest(entity_uid=entity_uid, target="./", manifest=data)
         except Exception:
             continue
+        items.append({"id": entity_uid, "target": "./", "manifest": data})
+    # best-effort, as before: per-item failures come back as values and are ignored
+    with HubClient(matrixhub_url) as client:
+        client.install_manifests(items)
 
 
 # ---------------------------------------------------------------------------
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import shutil
 import subprocess
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from ..utils import _json
+
 try:  # optional
-    import boto3  # type: ignore
+    import boto3
+except Exception:  # pragma: no cover
+    boto3 = None
+
+try:  # optional, faster content hashing
+    import blake3
 except Exception:  # pragma: no cover
-    boto3 = None  # type: ignore
+    blake3 = None
 
 __all__ = [
     "PublishResult",
@@ -44,12 +52,34 @@ class PublishResult:
 # -----------------------------------------------------------------------------
 
 
-def _sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+# Content-token hash families; sha256 is the default, blake3 is opt-in (hash_algo=)
+# because it changes every published object name
+_HASHERS: dict[str, Callable[..., Any]] = {"sha256": hashlib.sha256}
+if blake3 is not None:
+    _HASHERS["blake3"] = blake3.blake3
+_TOKEN_PREFIX = {"sha256": "", "blake3": "b3-"}  # the two families never collide
+
+
+@lru_cache(maxsize=4096)
+def _file_token(path: str, size: int, mtime_ns: int, algo: str) -> str:
+    """Content token for one file version; a file published to several providers is
+    hashed once. Keyed by (path, size, mtime_ns) so an edited file is re-hashed."""
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, _HASHERS[algo]).hexdigest()
+    return _TOKEN_PREFIX[algo] + digest[:16]
+
+
+def _content_hash(p: Path, data: bytes | None = None, algo: str = "sha256") -> str:
+    """Short content token used in published object names.
+
+    The first 16 hex chars of SHA-256 by default; ``algo="blake3"`` gives a
+    ``b3-`` prefixed BLAKE3 token. Pass *data* when the file is already in
+    memory to skip re-reading it.
+    """
+    if data is not None:
+        return _TOKEN_PREFIX[algo] + _HASHERS[algo](data).hexdigest()[:16]
+    st = p.stat()
+    return _file_token(str(p), st.st_size, st.st_mtime_ns, algo)
 
 
 def _ensure_listable_paths(paths: dict[str, str | Path]) -> dict[str, Path]:
@@ -62,12 +92,12 @@ def _ensure_listable_paths(paths: dict[str, str | Path]) -> dict[str, Path]:
     return out
 
 
+_MIME = {"json": "application/json", "yaml": "application/x-yaml", "yml": "application/x-yaml"}
+
+
 def _guess_mime(name: str) -> str:
-    if name.endswith(".json"):
-        return "application/json"
-    if name.endswith(".yaml") or name.endswith(".yml"):
-        return "application/x-yaml"
-    return "application/octet-stream"
+    _, dot, ext = name.rpartition(".")
+    return _MIME.get(ext.lower(), "application/octet-stream") if dot else "application/octet-stream"
 
 
 def _run(cmd: Sequence[str]) -> None:
@@ -76,6 +106,30 @@ def _run(cmd: Sequence[str]) -> None:
         raise RuntimeError(f"command failed: {' '.join(cmd)}\n{p.stderr}")
 
 
+def _upload_all(
+    paths: dict[str, Path], upload: Callable[[str, Path], str], *, max_workers: int = 16
+) -> tuple[dict[str, str], str | None]:
+    """Run upload(key, path) -> url for every path concurrently.
+
+    Returns (published, error). On the first failure, pending uploads are cancelled
+    and *published* holds whatever had already finished.
+    """
+    published: dict[str, str] = {}
+    error: str | None = None
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as ex:
+        futs = {ex.submit(upload, k, p): k for k, p in paths.items()}
+        for f in as_completed(futs):
+            try:
+                published[futs[f]] = f.result()
+            except Exception as e:
+                error = str(e)
+                for other in futs:
+                    other.cancel()
+                break
+    # report in the caller's key order, not completion order
+    return {k: published[k] for k in paths if k in published}, error
+
+
 # -----------------------------------------------------------------------------
 # Providers
 # -----------------------------------------------------------------------------
@@ -83,9 +137,12 @@ def _run(cmd: Sequence[str]) -> None:
 
 # S3 provider (boto3 preferred; fallback to aws CLI)
 
+# Below this size a single put_object beats upload_file's transfer-manager setup
+_PUT_OBJECT_MAX = 2 * 1024 * 1024
+
 
 def _publish_s3(
-    paths: dict[str, Path], dest: str, *, cache_control: str, content_hash: bool
+    paths: dict[str, Path], dest: str, *, cache_control: str, content_hash: bool, hash_algo: str
 ) -> PublishResult:
     # dest example: s3://my-bucket/prefix/
     if not dest.startswith("s3://"):
@@ -101,49 +158,70 @@ def _publish_s3(
 
     published: dict[str, str] = {}
 
-    def _object_key(name: str, p: Path) -> str:
+    def _object_key(name: str, p: Path, data: bytes | None = None) -> str:
         if content_hash:
-            h = _sha256_file(p)[:16]
+            h = _content_hash(p, data, hash_algo)
             base = p.name
             return f"{prefix}{h}-{base}"
         return f"{prefix}{p.name}"
 
-    # boto3 path
+    # boto3 path (the client is thread-safe; one transfer per worker thread)
     if boto3 is not None:
         try:
+            from boto3.s3.transfer import TransferConfig
+
             s3 = boto3.client("s3")
-            for k, p in paths.items():
-                key = _object_key(k, p)
-                extra = {"CacheControl": cache_control, "ContentType": _guess_mime(p.name)}
-                s3.upload_file(str(p), bucket, key, ExtraArgs=extra)
-                published[k] = f"https://{bucket}.s3.amazonaws.com/{key}"
-            return PublishResult("s3", dest, published, True)
+            cfg = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024, max_concurrency=8, use_threads=True
+            )
+
+            def _upload_boto(k: str, p: Path) -> str:
+                ctype = _guess_mime(p.name)
+                if p.stat().st_size < _PUT_OBJECT_MAX:
+                    # small file: read once, hash and send the same buffer in one PUT
+                    data = p.read_bytes()
+                    key = _object_key(k, p, data)
+                    s3.put_object(
+                        Bucket=bucket,
+                        Key=key,
+                        Body=data,
+                        CacheControl=cache_control,
+                        ContentType=ctype,
+                    )
+                else:
+                    key = _object_key(k, p)
+                    extra = {"CacheControl": cache_control, "ContentType": ctype}
+                    s3.upload_file(str(p), bucket, key, ExtraArgs=extra, Config=cfg)
+                return f"https://{bucket}.s3.amazonaws.com/{key}"
+
+            published, err = _upload_all(paths, _upload_boto)
         except Exception as e:  # pragma: no cover
             return PublishResult("s3", dest, published, False, error=str(e))
+        return PublishResult("s3", dest, published, err is None, error=err)
 
-    # fallback to AWS CLI
+    # fallback to AWS CLI (one `aws s3 cp` process per file, run concurrently)
     if shutil.which("aws"):
-        try:
-            for k, p in paths.items():
-                key = _object_key(k, p)
-                url = f"s3://{bucket}/{key}"
-                # set cache-control and content-type if possible
-                cmd = [
-                    "aws",
-                    "s3",
-                    "cp",
-                    str(p),
-                    url,
-                    "--cache-control",
-                    cache_control,
-                    "--content-type",
-                    _guess_mime(p.name),
-                ]
-                _run(cmd)
-                published[k] = f"https://{bucket}.s3.amazonaws.com/{key}"
-            return PublishResult("s3", dest, published, True)
-        except Exception as e:  # pragma: no cover
-            return PublishResult("s3", dest, published, False, error=str(e))
+
+        def _upload_cli(k: str, p: Path) -> str:
+            key = _object_key(k, p)
+            url = f"s3://{bucket}/{key}"
+            # set cache-control and content-type if possible
+            cmd = [
+                "aws",
+                "s3",
+                "cp",
+                str(p),
+                url,
+                "--cache-control",
+                cache_control,
+                "--content-type",
+                _guess_mime(p.name),
+            ]
+            _run(cmd)
+            return f"https://{bucket}.s3.amazonaws.com/{key}"
+
+        published, err = _upload_all(paths, _upload_cli, max_workers=8)
+        return PublishResult("s3", dest, published, err is None, error=err)
 
     return PublishResult("s3", dest, {}, False, error="boto3 or aws CLI required for S3 publishing")
 
@@ -152,7 +230,7 @@ def _publish_s3(
 
 
 def _publish_ghpages(
-    paths: dict[str, Path], dest: str, *, cache_control: str, content_hash: bool
+    paths: dict[str, Path], dest: str, *, cache_control: str, content_hash: bool, hash_algo: str
 ) -> PublishResult:
     # dest example: ./public or ../docs (a folder tracked by GitHub Pages)
     target = Path(dest).expanduser().resolve()
@@ -161,7 +239,7 @@ def _publish_ghpages(
 
     for k, p in paths.items():
         if content_hash:
-            h = _sha256_file(p)[:16]
+            h = _content_hash(p, algo=hash_algo)
             out = target / f"{h}-{p.name}"
         else:
             out = target / p.name
@@ -186,17 +264,29 @@ def publish(
     provider: str = "s3",
     cache_control: str = "public,max-age=31536000",
     content_hash: bool = True,
+    hash_algo: str = "sha256",
 ) -> PublishResult:
     """Publish artifacts (manifest.json, index.json, etc.) to a target provider.
 
     Returns PublishResult with mapping of logical keys -> final URLs/paths.
-    Idempotent when content_hash=True.
+    Idempotent when content_hash=True. *hash_algo* picks the content-token hash:
+    "sha256" (default) or "blake3" (needs the blake3 package; tokens get a
+    ``b3-`` prefix, so switching renames every published object).
     """
+    if hash_algo not in _HASHERS:
+        error = f"unsupported hash_algo: {hash_algo}" + (
+            " (install blake3)" if hash_algo == "blake3" else ""
+        )
+        return PublishResult(provider, dest, {}, False, error=error)
     norm = _ensure_listable_paths(paths)
     if provider == "s3":
-        return _publish_s3(norm, dest, cache_control=cache_control, content_hash=content_hash)
+        return _publish_s3(
+            norm, dest, cache_control=cache_control, content_hash=content_hash, hash_algo=hash_algo
+        )
     if provider in {"ghpages", "gh", "local"}:
-        return _publish_ghpages(norm, dest, cache_control=cache_control, content_hash=content_hash)
+        return _publish_ghpages(
+            norm, dest, cache_control=cache_control, content_hash=content_hash, hash_algo=hash_algo
+        )
     return PublishResult(provider, dest, {}, False, error=f"unknown provider: {provider}")
 
 
@@ -215,18 +305,17 @@ def update_global_index(
     existing: list[str] = []
     if shard.exists():
         try:
-            data = json.loads(shard.read_text(encoding="utf-8"))
+            data = _json.loads(shard.read_bytes())
             if isinstance(data, dict) and isinstance(data.get("manifests"), list):
                 existing = [str(x) for x in data["manifests"] if isinstance(x, str)]
         except Exception:  # pragma: no cover
             existing = []
 
-    merged: list[str] = []
-    for x in [*existing, *manifests]:
-        if x not in merged:
-            merged.append(x)
+    # first-seen order, O(n)
+    merged = list(dict.fromkeys([*existing, *manifests]))
 
-    shard.write_text(json.dumps({"manifests": merged}, indent=2, sort_keys=True), encoding="utf-8")
+    payload = {"manifests": merged}
+    shard.write_bytes(_json.dumps_bytes(payload, indent=True, sort_keys=True))
 
 
 # -----------------------------------------------------------------------------
@@ -302,7 +391,7 @@ def merge_indexes(child_index_paths: Iterable[str | Path]) -> dict[str, Any]:
         if ipath.exists():
             try:
                 base_dir = ipath.parent.resolve()
-                data = json.loads(ipath.read_text(encoding="utf-8"))
+                data = _json.loads(ipath.read_bytes())
             except Exception:
                 data = None
         if not data:
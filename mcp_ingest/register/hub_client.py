@@ -1,11 +1,37 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
 
 from ..utils.auth import get_matrixhub_token
-from ..utils.idempotency import RetryConfig, retry_request
+from ..utils.idempotency import HTTPError, RetryConfig, retry_request
+
+# Statuses meaning "this hub has no batch endpoint": fall back to one POST per manifest
+_BATCH_UNSUPPORTED = frozenset({404, 405, 501})
+# Failures raised before the batch request left this process: nothing can have been installed
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _rejected(e: Exception) -> bool:
+    """A 4xx answer to the batch: the hub refused it as a whole, so nothing was applied."""
+    return isinstance(e, HTTPError) and e.status is not None and 400 <= e.status < 500
+
+
+def _batch_item_result(entry: Any) -> dict[str, Any] | Exception:
+    """One entry of a batch response: the install result, or an HTTPError for a failed item."""
+    if not isinstance(entry, dict):
+        return HTTPError(f"batch install returned a non-object result: {entry!r}", body=entry)
+    status = entry.get("status_code", entry.get("status"))
+    status = status if isinstance(status, int) else None
+    if status is not None and status >= 400 and status != 409:
+        return HTTPError(f"batch item failed ({status})", status=status, body=entry)
+    if entry.get("error"):
+        return HTTPError(f"batch item failed: {entry['error']}", status=status, body=entry)
+    return entry
 
 
 class HubClient:
@@ -15,6 +41,38 @@ class HubClient:
         # Non-breaking: if token not provided, try env (MATRIX_HUB_TOKEN, MATRIX_TOKEN, API_TOKEN)
         self.token = token or get_matrixhub_token()
         self.timeout = timeout
+        # Both are fixed for the client's lifetime; build them once, not per request.
+        self._install_url = f"{self.base_url}/catalog/install"
+        self._batch_url = f"{self.base_url}/catalog/install:batch"
+        self._batch_supported: bool | None = None  # unknown until the first batch call
+        self._headers_dict = self._headers()
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Lazily build one pooled httpx.Client, so repeated installs (and retries)
+        reuse keep-alive connections instead of paying TCP/TLS setup each time."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            try:
+                self._client.close()
+            finally:
+                self._client = None
+
+    def __enter__(self) -> HubClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def _headers(self) -> dict[str, str]:
         h = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -26,17 +84,16 @@ class HubClient:
     def install_manifest(
         self, *, entity_uid: str, target: str, manifest: dict[str, Any]
     ) -> dict[str, Any]:
-        url = f"{self.base_url}/catalog/install"
+        url = self._install_url
         body = {"id": entity_uid, "target": target, "manifest": manifest}
 
         def _do() -> tuple[int, dict[str, Any]]:
-            with httpx.Client(timeout=self.timeout) as c:
-                r = c.post(url, headers=self._headers(), json=body)
-                try:
-                    data = r.json()
-                except Exception:
-                    data = {"raw": r.text}
-                return r.status_code, data
+            r = self._get_client().post(url, headers=self._headers_dict, json=body)
+            try:
+                data = r.json()
+            except Exception:
+                data = {"raw": r.text}
+            return r.status_code, data
 
         cfg = RetryConfig(attempts=3, base_delay=0.6, max_delay=4.0)
         try:
@@ -50,3 +107,60 @@ class HubClient:
                     "to mcp-ingest register/pack."
                 )
             raise type(e)(msg) from e
+
+    def install_manifests(
+        self, items: Sequence[dict[str, Any]], *, max_workers: int = 8
+    ) -> list[dict[str, Any] | Exception]:
+        """Install many manifests; each item is ``{"id", "target", "manifest"}``.
+
+        Tries a single POST to /catalog/install:batch first (one attempt, no
+        retries). The items are fanned out over install_manifest (which has its
+        own retry policy) whenever the batch certainly installed nothing: any
+        4xx (404/405/501 mean the hub has no batch endpoint, remembered so it is
+        not probed again), a connection failure before the request was sent, or
+        an answer that is not a batch response. A timeout or 5xx may have left
+        items installed, so it is reported for every item instead.
+        Returns one result per item, in order; a failed item yields its exception
+        (including per-item errors inside a batch response).
+        """
+        if not items:
+            return []
+        if self._batch_supported is not False:
+            try:
+                data = self._post_batch(items)
+            except Exception as e:
+                if isinstance(e, HTTPError) and e.status in _BATCH_UNSUPPORTED:
+                    self._batch_supported = False
+                elif not (_rejected(e) or isinstance(e, _NOT_SENT)):
+                    return [e] * len(items)
+            else:
+                results = data.get("results") if isinstance(data, dict) else None
+                if isinstance(results, list) and len(results) == len(items):
+                    self._batch_supported = True
+                    return [_batch_item_result(r) for r in results]
+                # Not a batch response we understand (e.g. a catch-all route)
+                self._batch_supported = False
+
+        def _one(item: dict[str, Any]) -> dict[str, Any] | Exception:
+            try:
+                return self.install_manifest(
+                    entity_uid=item["id"], target=item["target"], manifest=item["manifest"]
+                )
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as ex:
+            return list(ex.map(_one, items))
+
+    def _post_batch(self, items: Sequence[dict[str, Any]]) -> Any:
+        body = {"items": list(items)}
+
+        def _do() -> tuple[int, Any]:
+            r = self._get_client().post(self._batch_url, headers=self._headers_dict, json=body)
+            try:
+                data = r.json()
+            except Exception:
+                data = {"raw": r.text}
+            return r.status_code, data
+
+        return retry_request(_do, cfg=RetryConfig(attempts=1))
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import logging
 import os
+import random
 import time
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 from urllib.parse import urlencode
 
+from ..utils import _json
+
 try:
     import httpx
 except ImportError:
@@ -19,6 +25,9 @@ __all__ = ["RegistryClient"]
 
 log = logging.getLogger(__name__)
 
+# Upper bound on a server-supplied Retry-After, so one bad header can't stall a sync
+_MAX_RETRY_AFTER_S = 120.0
+
 
 def _env_int(name: str, default: int) -> int:
     raw = os.environ.get(name)
@@ -31,6 +40,23 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+def _retry_after(value: str | None) -> float | None:
+    """Seconds to wait per a Retry-After header (delta-seconds or HTTP-date), if usable."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
 def _env_bool(name: str, default: bool = False) -> bool:
     raw = os.environ.get(name)
     if raw is None:
@@ -62,6 +88,13 @@ class RegistryClient:
     use_http2: bool = field(default_factory=lambda: _env_bool("MCP_REGISTRY_HTTP2", False))
 
     _client: Any = field(default=None, init=False, repr=False, compare=False)
+    _base: str = field(default="", init=False, repr=False, compare=False)
+    _retry_statuses: frozenset[int] = field(
+        default=frozenset({429, 502, 503, 504}), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._base = self.base_url.rstrip("/")
 
     def _headers(self) -> dict[str, str]:
         """Build request headers with optional auth token."""
@@ -101,7 +134,7 @@ class RegistryClient:
                 "httpx is required for registry client. Install with: pip install httpx"
             )
 
-        url = f"{self.base_url.rstrip('/')}{path}"
+        url = f"{self._base}{path}"
         qs = urlencode({k: v for k, v in params.items() if v is not None})
         full = f"{url}?{qs}" if qs else url
 
@@ -111,22 +144,29 @@ class RegistryClient:
             try:
                 r = client.get(full)
 
-                # Retry on rate limiting or server errors
-                if r.status_code in (429, 502, 503, 504):
+                # Retry on rate limiting or server errors; the server's Retry-After
+                # wins over our own (jittered) exponential backoff.
+                if r.status_code in self._retry_statuses:
                     if attempt < self.max_retries - 1:
+                        ra = _retry_after(r.headers.get("Retry-After"))
+                        if ra is not None:
+                            sleep_for = min(ra, _MAX_RETRY_AFTER_S)
+                        else:
+                            sleep_for = backoff * (0.5 + random.random())
                         log.warning(
                             "Registry returned %d, retrying in %.1fs (attempt %d/%d)",
                             r.status_code,
-                            backoff,
+                            sleep_for,
                             attempt + 1,
                             self.max_retries,
                         )
-                        time.sleep(backoff)
+                        r.close()
+                        time.sleep(sleep_for)
                         backoff = min(backoff * 2, 30)
                         continue
 
                 r.raise_for_status()
-                return r.json()
+                return _json.loads(r.content)
 
             except (
                 httpx.TimeoutException,
@@ -134,14 +174,15 @@ class RegistryClient:
                 httpx.RemoteProtocolError,
             ) as exc:
                 if attempt < self.max_retries - 1:
+                    sleep_for = backoff * (0.5 + random.random())
                     log.warning(
                         "Registry request failed (%s), retrying in %.1fs (attempt %d/%d)",
                         exc.__class__.__name__,
-                        backoff,
+                        sleep_for,
                         attempt + 1,
                         self.max_retries,
                     )
-                    time.sleep(backoff)
+                    time.sleep(sleep_for)
                     backoff = min(backoff * 2, 30)
                     continue
                 raise
@@ -171,31 +212,42 @@ class RegistryClient:
         dict
             ServerResponse entries from the registry
         """
-        cursor = None
         count = 0
 
-        try:
-            while True:
-                log.info(
-                    "Fetching servers from registry (cursor=%s, count=%d/%s)",
-                    cursor or "initial",
-                    count,
-                    top or "unlimited",
-                )
+        def _fetch(cursor: str | None, seen: int) -> dict[str, Any]:
+            log.info(
+                "Fetching servers from registry (cursor=%s, count=%d/%s)",
+                cursor or "initial",
+                seen,
+                top or "unlimited",
+            )
+
+            # Try without version parameter first (API may not support it)
+            params = {
+                "cursor": cursor,
+                "limit": limit,
+            }
+            if updated_since:
+                params["updated_since"] = updated_since
 
-                # Try without version parameter first (API may not support it)
-                params = {
-                    "cursor": cursor,
-                    "limit": limit,
-                }
-                if updated_since:
-                    params["updated_since"] = updated_since
+            return self._get("/v0.1/servers", params)
 
-                data = self._get("/v0.1/servers", params)
+        # One page in flight ahead of the caller: page N+1 downloads while the
+        # consumer is still working through page N.
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="registry-prefetch")
+        pending: Future[dict[str, Any]] | None = pool.submit(_fetch, None, 0)
+        try:
+            while pending is not None:
+                data = pending.result()
+                pending = None
 
                 items = data.get("servers") or data.get("items") or []
                 meta = data.get("metadata") or {}
 
+                cursor = meta.get("nextCursor") or meta.get("next_cursor")
+                if cursor and (top is None or count + len(items) < top):
+                    pending = pool.submit(_fetch, cursor, count + len(items))
+
                 for it in items:
                     yield it
                     count += 1
@@ -203,9 +255,11 @@ class RegistryClient:
                         log.info("Reached top limit of %d servers", top)
                         return
 
-                cursor = meta.get("nextCursor") or meta.get("next_cursor")
                 if not cursor:
                     log.info("No more pages, total fetched: %d servers", count)
                     return
         finally:
+            if pending is not None:
+                pending.cancel()
+            pool.shutdown(wait=True)
             self.close()
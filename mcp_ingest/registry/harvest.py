@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+from ..utils import _json
 from .client import RegistryClient
 from .normalize import normalize_registry_server
 from .promote import promote_to_agent, promote_to_tool
@@ -17,6 +20,11 @@ __all__ = ["harvest_registry"]
 
 log = logging.getLogger(__name__)
 
+_WRITE_BUFFER = 64 * 1024
+_WRITE_WORKERS = 8
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_ITEM_ORDER = itemgetter("id", "manifest_path")  # index.json items sort key
+
 
 def utc_now_iso() -> str:
     """Get current UTC timestamp in ISO format (Python 3.11 compatible)."""
@@ -26,14 +34,26 @@ def utc_now_iso() -> str:
 def safe_slug(s: str) -> str:
     """Convert string to safe filesystem slug."""
     s = (s or "").lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+    s = _SLUG_RE.sub("-", s).strip("-")
     return s or "unknown"
 
 
 def write_json(path: Path, obj: Any) -> None:
-    """Write JSON object to file with pretty formatting."""
+    """Write JSON object to file with pretty formatting.
+
+    Goes through a temp file and os.replace, so a crash never leaves a
+    truncated manifest or index behind.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    data = _json.dumps_bytes(obj, indent=True, sort_keys=True, newline=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb", buffering=_WRITE_BUFFER) as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def group_and_variant(manifest: dict[str, Any]) -> tuple[str, str]:
@@ -112,146 +132,166 @@ def harvest_registry(
 
     servers_dir = out_dir / "servers"
     servers_dir.mkdir(parents=True, exist_ok=True)
-    tools_dir = out_dir / "tools"
-    agents_dir = out_dir / "agents"
 
-    items: list[dict[str, Any]] = []
-    manifests_active: list[str] = []
+    # Items deduped by manifest_path as they are produced (latest wins based on
+    # version): several server versions can point at the same manifest
+    items_by_path: dict[str, dict[str, Any]] = {}
+
+    def add_item(item: dict[str, Any]) -> None:
+        path = item["manifest_path"]
+        prev = items_by_path.get(path)
+        # Keep the item with the higher version (semantic version comparison would be better)
+        if prev is None or (item.get("version") or "") >= (prev.get("version") or ""):
+            items_by_path[path] = item
+
     server_count = 0
     manifest_count = 0
     promoted_tools_count = 0
     promoted_agents_count = 0
-
-    for srv in client.iter_servers_latest(updated_since=updated_since, limit=limit, top=top):
-        server_count += 1
-        server_name = (srv.get("server") or {}).get("name", "unknown")
-
-        log.debug("Processing server %d: %s", server_count, server_name)
-
-        try:
-            manifests = normalize_registry_server(srv, registry_base_url)
-
-            for m in manifests:
-                manifest_count += 1
-                status = (m.get("lifecycle") or {}).get("status", "active")
-
-                # Skip deleted servers (not installable)
-                if status == "deleted":
-                    log.debug("Skipping deleted manifest: %s", m["id"])
-                    continue
-
-                # Determine storage location
-                group, variant = group_and_variant(m)
-                folder = servers_dir / group / variant
-                dest = folder / "manifest.json"
-
-                # Write manifest
-                write_json(dest, m)
-
-                # Calculate relative path for index
-                rel = str(dest.relative_to(out_dir)).replace("\\", "/")
-
-                # Add to items list (includes deprecated for audit)
-                items.append(
-                    {
-                        "type": "mcp_server",
-                        "id": m["id"],
-                        "name": m.get("name"),
-                        "version": m.get("version"),
-                        "transport": (m.get("mcp_registration") or {})
-                        .get("server", {})
-                        .get("transport"),
-                        "status": status,
-                        "manifest_path": rel,
-                    }
-                )
-
-                # Add to active manifests list (for ingestion)
-                if status == "active":
-                    manifests_active.append(rel)
-
-                # ----- Promotion to sibling tool / agent entries -----
-                # Each promoted entry preserves the parent's
-                # mcp_registration block so MatrixHub's one-click install
-                # works without a second lookup.
-                if promote_tools and status == "active":
-                    tool = promote_to_tool(m)
-                    if tool is not None:
-                        t_group, t_variant = group_and_variant(tool)
-                        t_dest = tools_dir / t_group / t_variant / "manifest.json"
-                        write_json(t_dest, tool)
-                        t_rel = str(t_dest.relative_to(out_dir)).replace("\\", "/")
-                        items.append(
-                            {
-                                "type": "tool",
-                                "id": tool["id"],
-                                "name": tool.get("name"),
-                                "version": tool.get("version"),
-                                "transport": (tool.get("mcp_registration") or {})
-                                .get("server", {})
-                                .get("transport"),
-                                "status": "active",
-                                "manifest_path": t_rel,
-                            }
-                        )
-                        manifests_active.append(t_rel)
-                        promoted_tools_count += 1
-
-                if promote_agents and status == "active":
-                    agent = promote_to_agent(m)
-                    if agent is not None:
-                        a_group, a_variant = group_and_variant(agent)
-                        a_dest = agents_dir / a_group / a_variant / "manifest.json"
-                        write_json(a_dest, agent)
-                        a_rel = str(a_dest.relative_to(out_dir)).replace("\\", "/")
-                        items.append(
-                            {
-                                "type": "agent",
-                                "id": agent["id"],
-                                "name": agent.get("name"),
-                                "version": agent.get("version"),
-                                "transport": (agent.get("mcp_registration") or {})
-                                .get("server", {})
-                                .get("transport"),
-                                "status": "active",
-                                "manifest_path": a_rel,
-                            }
-                        )
-                        manifests_active.append(a_rel)
-                        promoted_agents_count += 1
-
-        except Exception as e:
-            log.error("Failed to process server %s: %s", server_name, e, exc_info=True)
-            continue
-
-    # Dedupe items by manifest_path (latest wins based on version)
-    # This fixes the issue where multiple server versions point to the same manifest
-    items_by_path: dict[str, dict[str, Any]] = {}
-    for item in items:
-        path = item["manifest_path"]
-        if path not in items_by_path:
-            items_by_path[path] = item
-        else:
-            # Keep the item with the higher version (semantic version comparison would be better)
-            existing_version = items_by_path[path].get("version") or ""
-            new_version = item.get("version") or ""
-            if new_version >= existing_version:
-                items_by_path[path] = item
+    # one timestamp for the whole run, shared by every manifest's harvest.last_seen_at
+    now_iso = utc_now_iso()
+
+    # Manifest writes go to a small pool so disk I/O overlaps normalization (which
+    # is CPU-bound and stays on this thread). Writes to the same path are chained
+    # so the file ends up holding the last manifest produced for it, as before.
+    writer = ThreadPoolExecutor(max_workers=_WRITE_WORKERS, thread_name_prefix="catalog-write")
+    last_write: dict[Path, Future[None]] = {}
+    writes: list[tuple[Path, Future[None]]] = []
+
+    def _write_after(prev: Future[None] | None, dest: Path, obj: dict[str, Any]) -> None:
+        if prev is not None:
+            wait([prev])
+        write_json(dest, obj)
+
+    def write(dest: Path, obj: dict[str, Any]) -> None:
+        fut = writer.submit(_write_after, last_write.get(dest), dest, obj)
+        last_write[dest] = fut
+        writes.append((dest, fut))
+
+    try:
+        for srv in client.iter_servers_latest(updated_since=updated_since, limit=limit, top=top):
+            server_count += 1
+            server_name = (srv.get("server") or {}).get("name", "unknown")
+
+            log.debug("Processing server %d: %s", server_count, server_name)
+
+            try:
+                manifests = normalize_registry_server(srv, registry_base_url, now_iso)
+
+                for m in manifests:
+                    manifest_count += 1
+                    status = (m.get("lifecycle") or {}).get("status", "active")
+
+                    # Skip deleted servers (not installable)
+                    if status == "deleted":
+                        log.debug("Skipping deleted manifest: %s", m["id"])
+                        continue
+
+                    # Determine storage location
+                    group, variant = group_and_variant(m)
+                    # Relative path for the index, built from its (slug-safe) parts
+                    rel = f"servers/{group}/{variant}/manifest.json"
+
+                    # Write manifest
+                    write(out_dir / rel, m)
+
+                    # Add to items (includes deprecated for audit)
+                    add_item(
+                        {
+                            "type": "mcp_server",
+                            "id": m["id"],
+                            "name": m.get("name"),
+                            "version": m.get("version"),
+                            "transport": (m.get("mcp_registration") or {})
+                            .get("server", {})
+                            .get("transport"),
+                            "status": status,
+                            "manifest_path": rel,
+                        }
+                    )
+
+                    # ----- Promotion to sibling tool / agent entries -----
+                    # Each promoted entry preserves the parent's
+                    # mcp_registration block so MatrixHub's one-click install
+                    # works without a second lookup.
+                    if promote_tools and status == "active":
+                        tool = promote_to_tool(m)
+                        if tool is not None:
+                            t_group, t_variant = group_and_variant(tool)
+                            t_rel = f"tools/{t_group}/{t_variant}/manifest.json"
+                            write(out_dir / t_rel, tool)
+                            add_item(
+                                {
+                                    "type": "tool",
+                                    "id": tool["id"],
+                                    "name": tool.get("name"),
+                                    "version": tool.get("version"),
+                                    "transport": (tool.get("mcp_registration") or {})
+                                    .get("server", {})
+                                    .get("transport"),
+                                    "status": "active",
+                                    "manifest_path": t_rel,
+                                }
+                            )
+                            promoted_tools_count += 1
+
+                    if promote_agents and status == "active":
+                        agent = promote_to_agent(m)
+                        if agent is not None:
+                            a_group, a_variant = group_and_variant(agent)
+                            a_rel = f"agents/{a_group}/{a_variant}/manifest.json"
+                            write(out_dir / a_rel, agent)
+                            add_item(
+                                {
+                                    "type": "agent",
+                                    "id": agent["id"],
+                                    "name": agent.get("name"),
+                                    "version": agent.get("version"),
+                                    "transport": (agent.get("mcp_registration") or {})
+                                    .get("server", {})
+                                    .get("transport"),
+                                    "status": "active",
+                                    "manifest_path": a_rel,
+                                }
+                            )
+                            promoted_agents_count += 1
+
+            except Exception as e:
+                log.error("Failed to process server %s: %s", server_name, e, exc_info=True)
+                continue
+    finally:
+        writer.shutdown(wait=True)
+
+    # An item whose manifest failed to write (at any point) is left out of the
+    # index, so index.json never points at a missing or stale manifest
+    failed: set[str] = set()
+    for dest, fut in writes:
+        exc = fut.exception()
+        if exc is not None:
+            log.error("Failed to write manifest %s: %s", dest, exc)
+            failed.add(dest.relative_to(out_dir).as_posix())
+    for rel in failed:
+        items_by_path.pop(rel, None)
 
     deduped_items = list(items_by_path.values())
 
-    # Count active vs deprecated from unique manifests only
-    active_count = sum(1 for item in deduped_items if item["status"] == "active")
-    deprecated_count = sum(1 for item in deduped_items if item["status"] == "deprecated")
-    disabled_count = sum(1 for item in deduped_items if item["status"] == "disabled")
-
-    # Per-type breakdown for the homepage tabs (MCP / Tools / Agents).
+    # One pass over the unique manifests: status counts, the per-type breakdown
+    # for the homepage tabs (MCP / Tools / Agents) and the active paths that
+    # feed the manifests[] stream for ingestion.
+    active_count = deprecated_count = disabled_count = 0
     by_type: dict[str, int] = {}
+    active_manifest_paths: list[str] = []
     for item in deduped_items:
-        if item.get("status") != "active":
-            continue
-        t = item.get("type") or "mcp_server"
-        by_type[t] = by_type.get(t, 0) + 1
+        status = item["status"]
+        if status == "active":
+            active_count += 1
+            active_manifest_paths.append(item["manifest_path"])
+            t = item.get("type") or "mcp_server"
+            by_type[t] = by_type.get(t, 0) + 1
+        elif status == "deprecated":
+            deprecated_count += 1
+        elif status == "disabled":
+            disabled_count += 1
 
     log.info(
         "Harvest complete: %d servers, %d unique manifests "
@@ -266,11 +306,7 @@ def harvest_registry(
     )
 
     # Build top-level index.json (MatrixHub-friendly)
-    # Only include active manifests in the manifests[] stream for ingestion
-    active_manifest_paths = [
-        item["manifest_path"] for item in deduped_items if item["status"] == "active"
-    ]
-
+    # Only active manifests (collected above) go in the manifests[] stream
     index = {
         "generated_at": utc_now_iso(),
         "source": {
@@ -284,9 +320,9 @@ def harvest_registry(
             "active_manifests": active_count,
             "deprecated": deprecated_count,
             "disabled": disabled_count,
-            "by_type": dict(sorted(by_type.items())),
+            "by_type": by_type,  # key order comes from write_json's sort_keys
         },
-        "items": sorted(deduped_items, key=lambda x: (x["id"], x["manifest_path"])),
+        "items": sorted(deduped_items, key=_ITEM_ORDER),
         "manifests": sorted(active_manifest_paths),
     }
 
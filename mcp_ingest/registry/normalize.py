@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 __all__ = ["normalize_registry_server"]
@@ -37,9 +38,13 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+@lru_cache(maxsize=8192)
 def short_hash(s: str) -> str:
-    """Generate short hash for stable identity keys."""
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()[:10]
+    """Generate short hash for stable identity keys.
+
+    Memoized: each manifest hashes its variant key twice (id + identity_key).
+    """
+    return hashlib.sha256(s.encode("utf-8"), usedforsecurity=False).hexdigest()[:10]
 
 
 def stable_manifest_id(server_name: str, transport: str, variant_key: str) -> str:
@@ -110,21 +115,20 @@ def to_stdio_exec(pkg: dict[str, Any]) -> dict[str, Any] | None:
     if not rt:
         rt = RUNTIME_HINT_BY_TYPE.get(reg_type, "")
 
-    args = pkg.get("runtimeArguments") or []
+    args = pkg.get("runtimeArguments") or ()
     ident = pkg.get("identifier")
     ver = pkg.get("version")
 
     if not (rt and ident):
         return None
 
-    sep = VERSION_SEP_BY_TYPE.get(reg_type, "==")
-    if ver:
-        return {"cmd": [rt, *args, f"{ident}{sep}{ver}"], "env": {}}
-    return {"cmd": [rt, *args, str(ident)], "env": {}}
+    target = f"{ident}{VERSION_SEP_BY_TYPE.get(reg_type, '==')}{ver}" if ver else str(ident)
+    # env stays a fresh dict: manifests are serialized and may be edited downstream
+    return {"cmd": [rt, *args, target], "env": {}}
 
 
 def normalize_registry_server(
-    server_response: dict[str, Any], registry_base_url: str
+    server_response: dict[str, Any], registry_base_url: str, now_iso: str | None = None
 ) -> list[dict[str, Any]]:
     """
     Convert a Registry ServerResponse into MatrixHub-compatible manifests.
@@ -139,6 +143,9 @@ def normalize_registry_server(
         ServerResponse from registry API
     registry_base_url : str
         Base URL of the registry (for provenance)
+    now_iso : str | None
+        Harvest run timestamp for ``harvest.last_seen_at``; pass one value for a
+        whole run. Defaults to the current time.
 
     Returns
     -------
@@ -162,11 +169,21 @@ def normalize_registry_server(
 
     manifests: list[dict[str, Any]] = []
     links = pick_links(server)
+    seen_at = now_iso or utc_now_iso()
 
     # Extract inputs/variables if present
     inputs = server.get("inputs") or {}
     variables = inputs.get("variables") or {}
 
+    # Optional fields shared by every manifest of this server (inputs, tags, license)
+    extras: dict[str, Any] = {}
+    if variables:
+        extras["inputs"] = {"variables": variables}
+    if server.get("tags"):
+        extras["tags"] = server["tags"]
+    if server.get("license"):
+        extras["license"] = server["license"]
+
     # 1) Process packages => STDIO manifests
     for pkg in server.get("packages") or []:
         reg_type = pkg.get("registryType")
@@ -219,19 +236,10 @@ def normalize_registry_server(
                 "identity_key": short_hash(variant_key),
             },
             "lifecycle": build_lifecycle(manifest_status, lifecycle_reason),
-            "harvest": {"seen_in_latest_run": True, "last_seen_at": utc_now_iso()},
+            "harvest": {"seen_in_latest_run": True, "last_seen_at": seen_at},
+            **extras,
         }
 
-        # Add inputs/variables if present
-        if variables:
-            manifest["inputs"] = {"variables": variables}
-
-        # Add tags and license if present
-        if server.get("tags"):
-            manifest["tags"] = server["tags"]
-        if server.get("license"):
-            manifest["license"] = server["license"]
-
         manifests.append(manifest)
 
     # 2) Process remotes => SSE/WS manifests
@@ -270,19 +278,10 @@ def normalize_registry_server(
                 "identity_key": short_hash(variant_key),
             },
             "lifecycle": build_lifecycle(status),
-            "harvest": {"seen_in_latest_run": True, "last_seen_at": utc_now_iso()},
+            "harvest": {"seen_in_latest_run": True, "last_seen_at": seen_at},
+            **extras,
         }
 
-        # Add inputs/variables if present
-        if variables:
-            manifest["inputs"] = {"variables": variables}
-
-        # Add tags and license if present
-        if server.get("tags"):
-            manifest["tags"] = server["tags"]
-        if server.get("license"):
-            manifest["license"] = server["license"]
-
         manifests.append(manifest)
 
     return manifests
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 from .emit.manifest import build_manifest
 from .register.hub_client import HubClient
+from .utils.auth import get_matrixhub_token
 from .utils.io import write_json
 
-__all__ = ["describe", "autoinstall"]
+__all__ = ["describe", "autoinstall", "autoinstall_many"]
 
 
 def describe(
@@ -21,9 +25,11 @@ def describe(
     entity_id: str | None = None,
     entity_name: str | None = None,
     out_dir: str | Path = ".",
-) -> dict[str, str]:
+    in_memory: bool = False,
+) -> dict[str, Any]:
     """Create manifest.json and index.json without running the server.
-    Returns paths {manifest_path, index_path}.
+    Returns paths {manifest_path, index_path}; with in_memory=True nothing is
+    written and the documents themselves are returned as {manifest, index}.
     """
     tool_id = (tools or [None])[0]
     manifest = build_manifest(
@@ -40,17 +46,48 @@ def describe(
         prompts=[],
     )
 
+    index = {"manifests": ["./manifest.json"]}
+    if in_memory:
+        return {"manifest": manifest, "index": index}
+
     out = Path(out_dir).expanduser().resolve()
     out.mkdir(parents=True, exist_ok=True)
     manifest_path = out / "manifest.json"
     index_path = out / "index.json"
 
     write_json(manifest_path, manifest)
-    write_json(index_path, {"manifests": ["./manifest.json"]})
+    write_json(index_path, index)
 
     return {"manifest_path": str(manifest_path), "index_path": str(index_path)}
 
 
+_HUB_CLIENTS: OrderedDict[tuple[str, str | None], HubClient] = OrderedDict()
+_HUB_CLIENTS_MAX = 8
+_hub_clients_lock = threading.Lock()
+
+
+def _hub_client(matrixhub_url: str, token: str | None) -> HubClient:
+    """One pooled client per (hub, token), shared by repeated autoinstall calls.
+
+    Keyed on the token actually used, so a token taken from the environment is
+    re-read on every call; the least recently used client is closed once more
+    than a few are cached (long-lived processes such as mcp-ingest-daemon).
+    """
+    key = (matrixhub_url, token or get_matrixhub_token())
+    evicted = None
+    with _hub_clients_lock:
+        client = _HUB_CLIENTS.get(key)
+        if client is not None:
+            _HUB_CLIENTS.move_to_end(key)
+            return client
+        client = _HUB_CLIENTS[key] = HubClient(matrixhub_url, token=key[1])
+        if len(_HUB_CLIENTS) > _HUB_CLIENTS_MAX:
+            _, evicted = _HUB_CLIENTS.popitem(last=False)
+    if evicted is not None:
+        evicted.close()
+    return client
+
+
 def autoinstall(
     *,
     matrixhub_url: str,
@@ -67,16 +104,50 @@ def autoinstall(
         mpath = Path(manifest_path or "./manifest.json").expanduser()
         import json
 
-        manifest = json.loads(mpath.read_text(encoding="utf-8"))
+        manifest = json.loads(mpath.read_bytes())
 
     # compute uid if missing
     if not entity_uid:
-        t = manifest.get("type", "mcp_server")
-        i = manifest.get("id")
-        v = manifest.get("version", "0.1.0")
-        if not i:
-            raise ValueError("manifest.id is required to compute entity_uid")
-        entity_uid = f"{t}:{i}@{v}"
-
-    client = HubClient(matrixhub_url, token=token)
+        entity_uid = _entity_uid(manifest)
+
+    client = _hub_client(matrixhub_url, token)
     return client.install_manifest(entity_uid=entity_uid, target=target, manifest=manifest)
+
+
+def autoinstall_many(
+    *,
+    matrixhub_url: str,
+    manifests: Sequence[dict[str, Any]],
+    target: str = "./",
+    token: str | None = None,
+) -> list[dict[str, Any] | Exception]:
+    """Install several inline manifests in one go (see HubClient.install_manifests).
+
+    Returns one entry per manifest, in order: the hub's response, or the exception
+    that made that manifest fail (including a missing manifest.id).
+    """
+    results: list[dict[str, Any] | Exception | None] = [None] * len(manifests)
+    items: list[dict[str, Any]] = []
+    slots: list[int] = []
+    for n, manifest in enumerate(manifests):
+        try:
+            uid = _entity_uid(manifest)
+        except ValueError as e:
+            results[n] = e
+            continue
+        items.append({"id": uid, "target": target, "manifest": manifest})
+        slots.append(n)
+
+    client = _hub_client(matrixhub_url, token)
+    for n, res in zip(slots, client.install_manifests(items), strict=True):
+        results[n] = res
+    return results  # type: ignore[return-value]
+
+
+def _entity_uid(manifest: dict[str, Any]) -> str:
+    t = manifest.get("type", "mcp_server")
+    i = manifest.get("id")
+    v = manifest.get("version", "0.1.0")
+    if not i:
+        raise ValueError("manifest.id is required to compute entity_uid")
+    return f"{t}:{i}@{v}"
@@ -0,0 +1,74 @@
+# mcp_ingest/utils/_json.py
+"""
+Single JSON entry point: orjson when installed, stdlib json otherwise
+(decoding also tries ujson before falling back to the stdlib).
+
+Both backends produce the same bytes: non-ASCII characters are written as
+UTF-8 (not \\u escapes) and compact output has no spaces after separators,
+so write-if-changed and content hashes don't depend on whether orjson is
+installed. Anything orjson cannot encode (non-str keys, integers beyond
+64 bits, ...) falls back to the stdlib encoder.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # optional, decode-only fallback when orjson is missing
+    import ujson
+except Exception:  # pragma: no cover
+    ujson = None
+
+__all__ = ["JSONDecodeError", "loads", "dumps", "dumps_bytes"]
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Parse a JSON document; bytes are accepted directly (no decode round-trip)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            pass  # let the stdlib produce the (standard) error, or accept what ujson won't
+    return json.loads(data)
+
+
+def dumps_bytes(
+    obj: Any, *, indent: bool = False, sort_keys: bool = False, newline: bool = False
+) -> bytes:
+    """Serialize *obj* to UTF-8 bytes; ``indent`` means two spaces, like the rest of the repo."""
+    if orjson is not None:
+        opt = 0
+        if indent:
+            opt |= orjson.OPT_INDENT_2
+        if sort_keys:
+            opt |= orjson.OPT_SORT_KEYS
+        if newline:
+            opt |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(obj, option=opt)
+        except TypeError:
+            pass  # fall through to the stdlib encoder
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+    )
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize *obj* to a str (see dumps_bytes)."""
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys).decode("utf-8")
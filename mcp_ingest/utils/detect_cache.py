@@ -0,0 +1,146 @@
+# mcp_ingest/utils/detect_cache.py
+"""
+Persistent cache for detector results.
+
+Detectors parse every Python file under a candidate directory, so re-harvesting
+an unchanged local checkout repeats the same work. Results are cached on disk,
+keyed by a fingerprint of the directory built from the metadata of the files
+the detectors read (relative path, size, mtime_ns) - no file contents are read
+to compute it.
+
+- Location: $MCP_INGEST_DETECT_CACHE (default ~/.cache/mcp_ingest/detect.json)
+- Entries expire after 7 days and are pruned when the cache is flushed
+- The package version is part of the key, so detector changes invalidate it
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from . import _json
+
+__all__ = ["content_key", "lookup", "store", "flush", "clear_detect_cache"]
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILE = Path(
+    os.getenv("MCP_INGEST_DETECT_CACHE", "~/.cache/mcp_ingest/detect.json")
+).expanduser()
+_TTL_S = 7 * 24 * 3600
+
+_lock = threading.Lock()
+_cache: dict[str, dict[str, Any]] | None = None
+_dirty = False
+
+
+# The only files the detectors open; everything else can't change their result
+_DETECTED_SUFFIX = ".py"
+_DETECTED_NAMES = frozenset({"package.json"})
+
+
+def content_key(d: Path) -> str:
+    """Fingerprint *d* from the metadata of the files the detectors read beneath it.
+
+    Every directory is listed (detectors check for e.g. ``tools/``) but only
+    ``*.py`` and ``package.json`` files contribute their size and mtime. Like
+    the detectors' own walk (utils.io.iter_files), no directory is skipped, so
+    a change under a vendored tree such as ``.venv`` changes the key too.
+    Symlinks are not followed, and an entry that can't be stat'ed is recorded
+    as such instead of ending the walk of its directory.
+    """
+    from .. import __version__
+
+    root = str(d.resolve())
+    rows: list[str] = []
+    stack = [root]
+    while stack:
+        cur = stack.pop()
+        try:
+            with os.scandir(cur) as it:
+                entries = list(it)
+        except OSError:
+            rows.append(f"{os.path.relpath(cur, root)}/\0?")
+            continue
+        for e in entries:
+            rel = os.path.relpath(e.path, root)
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    rows.append(f"{rel}/")
+                    stack.append(e.path)
+                elif e.name.endswith(_DETECTED_SUFFIX) or e.name in _DETECTED_NAMES:
+                    st = e.stat(follow_symlinks=False)
+                    rows.append(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}")
+            except OSError:
+                rows.append(f"{rel}\0?")
+    rows.sort()
+    h = hashlib.sha256(f"{__version__}\0{root}\n".encode())
+    h.update("\n".join(rows).encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
+def _load() -> dict[str, dict[str, Any]]:
+    global _cache
+    if _cache is None:
+        _cache = {}
+        if _CACHE_FILE.exists():
+            try:
+                data = _json.loads(_CACHE_FILE.read_bytes())
+                if isinstance(data, dict):
+                    _cache = data
+                logger.debug("Loaded detect cache with %d entries", len(_cache))
+            except Exception as e:
+                logger.warning("Failed to load detect cache from %s: %s", _CACHE_FILE, e)
+    return _cache
+
+
+def lookup(key: str) -> tuple[dict[str, Any], str] | None:
+    """Return (report_dict, detector_tag) for *key* if cached and not expired."""
+    with _lock:
+        entry = _load().get(key)
+    if not entry or time.time() - entry.get("ts", 0) > _TTL_S:
+        return None
+    return entry["report"], entry["tag"]
+
+
+def store(key: str, report: dict[str, Any], tag: str) -> None:
+    global _dirty
+    with _lock:
+        _load()[key] = {"report": report, "tag": tag, "ts": time.time()}
+        _dirty = True
+
+
+def flush() -> None:
+    """Write pending entries to disk (atomic replace), dropping expired ones."""
+    global _dirty
+    with _lock:
+        if not _dirty or _cache is None:
+            return
+        cutoff = time.time() - _TTL_S
+        live = {k: v for k, v in _cache.items() if v.get("ts", 0) >= cutoff}
+        try:
+            _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = _CACHE_FILE.with_name(f"{_CACHE_FILE.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(_json.dumps_bytes(live))
+            os.replace(tmp, _CACHE_FILE)
+            _dirty = False
+            logger.debug("Saved detect cache with %d entries to %s", len(live), _CACHE_FILE)
+        except Exception as e:
+            logger.warning("Failed to save detect cache to %s: %s", _CACHE_FILE, e)
+
+
+def clear_detect_cache() -> None:
+    """Forget all cached detector results (memory and disk)."""
+    global _cache, _dirty
+    with _lock:
+        _cache = {}
+        _dirty = False
+        try:
+            _CACHE_FILE.unlink()
+        except FileNotFoundError:
+            pass
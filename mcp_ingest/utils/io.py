@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from . import _json
+
 try:
     import yaml  # type: ignore
 except Exception:  # pragma: no cover
@@ -31,7 +35,33 @@ def read_json_or_yaml(path: str | Path) -> dict[str, Any]:
 def write_json(path: str | Path, data: dict[str, Any]) -> None:
     p = Path(path).expanduser().resolve()
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    p.write_bytes(_json.dumps_bytes(data, indent=True, sort_keys=True))
+
+
+def iter_files(root: str | Path, suffix: str) -> Iterator[Path]:
+    """Files under *root* whose name ends with *suffix*, in ``Path.rglob`` order.
+
+    One ``os.scandir`` per directory: file/dir checks use the cached dirent type
+    instead of a stat per entry. Symlinked directories are not descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        cur = stack.pop()
+        try:
+            with os.scandir(cur) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: list[str] = []
+        for e in entries:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif e.name.endswith(suffix) and e.is_file():
+                    yield Path(e.path)
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
 
 
-__all__ = ["read_text", "read_json_or_yaml", "write_json"]
+__all__ = ["read_text", "read_json_or_yaml", "write_json", "iter_files"]
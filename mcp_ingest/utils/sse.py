@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+_MESSAGES = "/messages"
+_SSE = "/sse"
+
 
 def strip_trailing_slash(url: str) -> str:
-    # This is a more direct way to remove a trailing slash and fixes the syntax error.
     return url.rstrip("/")
 
 
@@ -14,13 +16,12 @@ def ensure_sse(url: str) -> str:
     """
     if not url:
         return url
-    u = strip_trailing_slash(url)
-    # All path fragments must be string literals (enclosed in quotes).
-    if u.endswith("/messages"):
-        return u.rsplit("/messages", 1)[0] + "/sse"
-    if u.endswith("/sse"):
+    u = url.rstrip("/")
+    if u.endswith(_MESSAGES):
+        return u[: -len(_MESSAGES)] + _SSE
+    if u.endswith(_SSE):
         return u
-    return u + "/sse"
+    return u + _SSE
 
 
 __all__ = ["ensure_sse", "strip_trailing_slash"]
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import queue
 import re
 import subprocess
+import threading
 import time
-from dataclasses import asdict, dataclass
-from typing import Any
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, AnyStr
+
+try:  # optional: talk to the daemon over one API connection instead of N CLI spawns
+    import docker
+    from requests.exceptions import Timeout as _SdkTimeout
+except Exception:  # pragma: no cover
+    docker = None
+    _SdkTimeout = subprocess.TimeoutExpired  # type: ignore
 
 # Optional: reuse MVP probe when network is allowed
 try:  # pragma: no cover (optional at runtime)
-    from ..validate.mcp_probe import probe_mcp as _probe_mcp  # type: ignore
+    from ..validate.mcp_probe import probe_mcp as _probe_mcp
 except Exception:  # pragma: no cover
     _probe_mcp = None  # type: ignore
 
@@ -35,51 +46,90 @@ class ValidationReport:
     error: str | None
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
+        # Flat fields: a shallow copy is enough (asdict would deepcopy every value)
+        d = {k: getattr(self, k) for k in _REPORT_FIELDS}
         # Ensure JSON-serializable values
         d["tools_confirmed"] = list(self.tools_confirmed)
         d["timings_ms"] = {str(k): int(v) for k, v in (self.timings_ms or {}).items()}
         return d
 
 
+_REPORT_FIELDS = tuple(f.name for f in fields(ValidationReport))
+
 _ENDPOINT_RE = re.compile(r"(?i)(http://[\w\.-]+:(\d+)/(sse|messages))")
-_PORT_RE = re.compile(r"(?i)(?:PORT\s*=\s*(\d{3,5})|port\s*[:=]\s*(\d{3,5}))")
+_ENDPOINT_RE_B = re.compile(_ENDPOINT_RE.pattern.encode())
+# Endpoint URL or a bare port hint, in one pass (named groups say which matched)
+_DISCOVER_RE = re.compile(
+    r"(?i)(?P<url>http://[\w\.-]+:(?P<url_port>\d+)/(?P<path>sse|messages))"
+    r"|(?:PORT\s*=\s*|port\s*[:=]\s*)(?P<port>\d{3,5})"
+)
+_DISCOVER_RE_B = re.compile(_DISCOVER_RE.pattern.encode())
+_MESSAGES_RE = re.compile(r"(?i)messages")
+_MESSAGES_RE_B = re.compile(_MESSAGES_RE.pattern.encode())
+# run_in_container only searches the end of the followed logs: the log follow stops
+# right after the endpoint line, so that is where it is
+_DISCOVER_TAIL = 4096
+
+# Upper bound on how long we follow container logs waiting for the endpoint line
+_LOG_WAIT_S = 30.0
+
+
+def _scan(
+    logs: AnyStr, discover: re.Pattern[AnyStr], messages: re.Pattern[AnyStr]
+) -> tuple[re.Match[AnyStr] | None, re.Match[AnyStr] | None, bool]:
+    """(first endpoint URL, first port hint, whether "messages" is mentioned).
+
+    Stops at the first URL; the other two only matter when there is none.
+    """
+    port_hint = None
+    for m in discover.finditer(logs):
+        if m.group("url"):
+            return m, port_hint, False
+        if port_hint is None:
+            port_hint = m
+    return None, port_hint, messages.search(logs) is not None
 
 
-def discover_endpoint(logs: str, *, default_port: int = 6288) -> dict[str, Any]:
+def discover_endpoint(logs: str | bytes, *, default_port: int = 6288) -> dict[str, Any]:
     """Heuristic endpoint discovery from container logs.
     Returns dict: {url, transport, port}
+
+    The first endpoint URL in *logs* wins, else the first port hint, else
+    *default_port*. Raw log bytes are searched as-is, only the matched URL is
+    decoded.
     """
-    url = None
-    transport = None
-    port = None
-
-    m = _ENDPOINT_RE.search(logs)
-    if m:
-        url = m.group(1)
-        port = int(m.group(2)) if m.group(2) else None
-        transport = "SSE" if m.group(3).lower() == "sse" else "WS"
+    if isinstance(logs, str):
+        m, pm, has_messages = _scan(logs, _DISCOVER_RE, _MESSAGES_RE)
+        if m is not None:
+            url = m.group("url")
+            path = m.group("path")
+            port = int(m.group("url_port"))
+            return {"url": url, "transport": _transport(path), "port": port}
+        hint = pm.group("port") if pm is not None else None
     else:
-        # Try to guess a port even if URL not found
-        pm = _PORT_RE.search(logs)
-        if pm:
-            for g in pm.groups():
-                if g and g.isdigit():
-                    port = int(g)
-                    break
-        if port is None:
-            port = default_port
-        # Prefer /sse unless messages explicitly mentioned
-        transport = "SSE" if "messages" not in logs.lower() else "WS"
-        url = (
-            f"http://127.0.0.1:{port}/sse"
-            if transport == "SSE"
-            else f"http://127.0.0.1:{port}/messages"
-        )
+        mb, pmb, has_messages = _scan(bytes(logs), _DISCOVER_RE_B, _MESSAGES_RE_B)
+        if mb is not None:
+            url = mb.group("url").decode("utf-8", errors="replace")
+            path = mb.group("path").decode("ascii")
+            port = int(mb.group("url_port"))
+            return {"url": url, "transport": _transport(path), "port": port}
+        hint = pmb.group("port").decode("ascii") if pmb is not None else None
 
+    port = int(hint) if hint is not None else default_port
+    # Prefer /sse unless messages explicitly mentioned
+    transport = "SSE" if not has_messages else "WS"
+    url = (
+        f"http://127.0.0.1:{port}/sse"
+        if transport == "SSE"
+        else f"http://127.0.0.1:{port}/messages"
+    )
     return {"url": url, "transport": transport, "port": port}
 
 
+def _transport(path: str) -> str:
+    return "SSE" if path.lower() == "sse" else "WS"
+
+
 def _docker(*args: str, timeout: int = 300) -> subprocess.CompletedProcess:
     return subprocess.run(
         ["docker", *args],
@@ -90,6 +140,163 @@ def _docker(*args: str, timeout: int = 300) -> subprocess.CompletedProcess:
     )
 
 
+@lru_cache(maxsize=1)
+def _docker_client() -> Any:
+    """Shared docker SDK client, or None (SDK missing / daemon unreachable)."""
+    if docker is None:
+        return None
+    try:
+        client = docker.from_env()
+        client.ping()
+        return client
+    except Exception:
+        return None
+
+
+class _CliRunner:
+    """One ``docker`` CLI process per step."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def pull(self, image: str, timeout: int) -> None:
+        _docker("pull", image, timeout=timeout)
+
+    def run(
+        self, image: str, cmd: list[str], *, port: int, cpu: int, mem_mb: int, timeout: int
+    ) -> None:
+        started = _docker(
+            "run",
+            "-d",
+            "--rm",
+            "--name",
+            self.name,
+            "-p",
+            f"{port}:{port}",
+            "--cpus",
+            str(cpu),
+            "--memory",
+            f"{mem_mb}m",
+            "-e",
+            f"PORT={port}",
+            image,
+            *cmd,
+            timeout=timeout,
+        )
+        if started.returncode != 0:
+            raise RuntimeError(f"docker run failed: {started.stderr.strip()}")
+
+    def follow(self) -> tuple[Iterator[bytes], Callable[[], None]]:
+        proc = subprocess.Popen(
+            ["docker", "logs", "-f", self.name],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        out = proc.stdout  # always set: stdout=PIPE
+
+        def _close() -> None:
+            proc.kill()
+            proc.wait()
+
+        return iter(lambda: out.read1(4096), b""), _close  # type: ignore[union-attr]
+
+    def stop(self, timeout: int) -> None:
+        _docker("stop", self.name, timeout=timeout)
+
+    def kill(self) -> None:
+        _docker("kill", self.name, timeout=10)
+
+
+class _SdkRunner:
+    """Same steps through the docker SDK: one daemon connection, no process spawns."""
+
+    def __init__(self, client: Any, name: str) -> None:
+        self.client = client
+        self.name = name
+        self.container: Any = None
+
+    def pull(self, image: str, timeout: int) -> None:
+        # The SDK's pull has no timeout of its own; wait on a helper thread instead.
+        # A pull still running at the deadline is left to the daemon, like a killed
+        # `docker pull` CLI, and ``run`` pulls whatever is still missing.
+        done = threading.Event()
+
+        def _pull() -> None:
+            try:
+                self.client.images.pull(image)
+            except Exception:
+                pass  # best-effort; a missing image surfaces in run()
+            finally:
+                done.set()
+
+        threading.Thread(target=_pull, name="sandbox-pull", daemon=True).start()
+        if not done.wait(timeout):
+            raise TimeoutError(f"docker pull {image} timed out after {timeout}s")
+
+    def run(
+        self, image: str, cmd: list[str], *, port: int, cpu: int, mem_mb: int, timeout: int
+    ) -> None:
+        self.container = self.client.containers.run(
+            image,
+            command=cmd or None,
+            detach=True,
+            remove=True,
+            name=self.name,
+            ports={f"{port}/tcp": port},
+            nano_cpus=int(cpu * 1_000_000_000),
+            mem_limit=f"{mem_mb}m",
+            environment={"PORT": str(port)},
+        )
+
+    def follow(self) -> tuple[Iterator[bytes], Callable[[], None]]:
+        stream = self.container.logs(stdout=True, stderr=True, stream=True, follow=True)
+        return iter(stream), getattr(stream, "close", lambda: None)
+
+    def stop(self, timeout: int) -> None:
+        self.container.stop(timeout=timeout)
+
+    def kill(self) -> None:
+        if self.container is not None:
+            self.container.kill()
+
+
+def _tail_until(chunks: Iterator[bytes], pattern: re.Pattern[bytes], deadline: float) -> bytes:
+    """Collect *chunks* until *pattern* matches, the stream ends, or *deadline* passes.
+
+    The stream is read on a helper thread so a silent container can't block us
+    past the deadline; the caller closes the stream afterwards.
+    """
+    q: queue.Queue[bytes | None] = queue.Queue()
+
+    def _pump() -> None:
+        try:
+            for chunk in chunks:
+                q.put(chunk)
+        except Exception:
+            pass
+        finally:
+            q.put(None)
+
+    threading.Thread(target=_pump, name="sandbox-logs", daemon=True).start()
+    buf = bytearray()
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        try:
+            chunk = q.get(timeout=remaining)
+        except queue.Empty:
+            break
+        if chunk is None:
+            break
+        # a URL can straddle two chunks: rescan from a little before the new data
+        start = max(0, len(buf) - 256)
+        buf += chunk
+        if pattern.search(buf, start):
+            break
+    return bytes(buf)
+
+
 def run_in_container(
     image: str,
     cmd: list[str] | None,
@@ -117,46 +324,35 @@ def run_in_container(
     exit_code: int | None = None
     tools = []
 
+    # The docker SDK when installed and the daemon answers; otherwise the CLI
+    name = f"mcp-validate-{int(time.time())}"
+    client = _docker_client()
+    runner: _CliRunner | _SdkRunner = (
+        _SdkRunner(client, name) if client is not None else _CliRunner(name)
+    )
+
     # 1) Pull (best-effort)
     try:
-        _docker("pull", image, timeout=max(60, timeout // 2))
+        runner.pull(image, timeout=max(60, timeout // 2))
     except Exception:
         pass
 
-    # 2) Run container (detached)
-    name = f"mcp-validate-{int(time.time())}"
-    publish = ["-p", f"{guess_port}:{guess_port}"]
-    network = []  # bridge by default (needed to map ports)
-    limits = ["--cpus", str(cpu), "--memory", f"{mem_mb}m"]
-    envs: list[str] = ["-e", f"PORT={guess_port}"]
-
-    run_cmd = [
-        "run",
-        "-d",
-        "--rm",
-        "--name",
-        name,
-        *publish,
-        *limits,
-        *network,
-        *envs,
-        image,
-        *(cmd or []),
-    ]
-
+    # 2) Run container (detached, bridge network so the port can be mapped)
     try:
-        started = _docker(*run_cmd, timeout=timeout)
-        if started.returncode != 0:
-            raise RuntimeError(f"docker run failed: {started.stderr.strip()}")
-
-        # 3) Wait a short period for logs to populate
-        time.sleep(2.0)
+        runner.run(image, list(cmd or []), port=guess_port, cpu=cpu, mem_mb=mem_mb, timeout=timeout)
 
-        # 4) Fetch logs & discover endpoint
-        logs = _docker("logs", name, timeout=timeout)
-        combined = (logs.stdout or "") + "\n" + (logs.stderr or "")
-        logs_excerpt = combined[-4000:]  # last chunk
-        disc = discover_endpoint(combined, default_port=guess_port)
+        # 3) Follow the logs until the server prints its endpoint (or the
+        # container exits / the wait is over), then discover the endpoint. The
+        # wait starts now, not at t0, so a slow pull doesn't eat into it.
+        deadline = time.perf_counter() + min(timeout, _LOG_WAIT_S)
+        chunks, close = runner.follow()
+        try:
+            raw = _tail_until(chunks, _ENDPOINT_RE_B, deadline)
+        finally:
+            close()
+        # Search the raw bytes; only the excerpt kept for the report is decoded
+        logs_excerpt = raw[-4000:].decode("utf-8", errors="replace")  # last chunk
+        disc = discover_endpoint(raw[-_DISCOVER_TAIL:], default_port=guess_port)
         endpoint_url, transport, port = disc["url"], disc["transport"], disc["port"]
         timings["container_start_ms"] = int((time.perf_counter() - t0) * 1000)
 
@@ -177,14 +373,14 @@ def run_in_container(
 
         # 6) Try graceful stop, then kill if needed at timeout
         t2 = time.perf_counter()
-        _docker("stop", name, timeout=max(10, timeout // 3))
+        runner.stop(timeout=max(10, timeout // 3))
         timings["container_stop_ms"] = int((time.perf_counter() - t2) * 1000)
         exit_code = 0
 
-    except subprocess.TimeoutExpired as te:
+    except (subprocess.TimeoutExpired, _SdkTimeout) as te:
         error = f"timeout: {te}"
         try:
-            _docker("kill", name, timeout=10)
+            runner.kill()
         except Exception:
             pass
         exit_code = None
@@ -205,7 +401,7 @@ def run_in_container(
     except Exception as e:
         error = str(e)
         try:
-            _docker("kill", name, timeout=10)
+            runner.kill()
         except Exception:
             pass
         exit_code = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import threading
 import time
 
@@ -9,7 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .routers import catalogs as catalogs_router
 from .routers import jobs as jobs_router
 from .store.models import init_db
-from .workers.runner import worker_loop
+from .workers.runner import run_forever
 
 
 def create_app() -> FastAPI:
@@ -25,10 +26,12 @@ def create_app() -> FastAPI:
     app.include_router(jobs_router.router)
     app.include_router(catalogs_router.router)
 
-    # Background worker (dev in-memory queue)
+    # Background workers: one dispatcher feeding HARVESTER_WORKERS job threads
     q = jobs_router.get_queue()
+    q.recover()  # jobs left active by a previous process (in-memory queue only)
     stop = threading.Event()
-    t = threading.Thread(target=worker_loop, args=(q, stop), daemon=True)
+    workers = max(1, int(os.getenv("HARVESTER_WORKERS", "4")))
+    t = threading.Thread(target=run_forever, args=(q, stop, workers), daemon=True)
     t.start()
 
     @app.on_event("shutdown")
@@ -1,18 +1,101 @@
 from __future__ import annotations
 
+import importlib.util
+import json
+import os
+import random
+import threading
 import time
 from typing import Any
 
 import httpx
 
+try:  # optional
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from .ratelimit import HUB_BUCKET
+
+# Cap on a hub-supplied Retry-After, so one bad header can't stall a worker
+_MAX_RETRY_AFTER_S = 60.0
+
+
+class RateLimitedError(RuntimeError):
+    """MatrixHub still answered 429 after the last retry (transient, unlike other failures)."""
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-str keys: let the stdlib encoder handle it
+    return json.dumps(obj).encode("utf-8")
+
+
+def _retry_delay(i: int, retry_after: str | None = None) -> float:
+    """Sleep before attempt *i* + 1: Retry-After (seconds) when given, else exponential
+    backoff, plus up to 50% random jitter so workers don't retry in lockstep."""
+    delay = min(0.5 * (2 ** (i - 1)), 4.0)
+    if retry_after:
+        try:
+            delay = min(max(0.0, float(retry_after)), _MAX_RETRY_AFTER_S)
+        except ValueError:
+            pass  # HTTP-date form: keep our own backoff
+    return delay + random.uniform(0, delay * 0.5)
+
 
 class HubClient:
     """Minimal client for MatrixHub /catalog/install (idempotent; retries)."""
 
-    def __init__(self, base_url: str, *, token: str | None = None, timeout: float = 15.0):
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        token: str | None = None,
+        timeout: float = 15.0,
+        http2: bool | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
+        # HTTP/2 lets concurrent workers multiplex installs over one connection.
+        # Opt-in (HARVESTER_HUB_HTTP2=1) and only when the h2 package is installed.
+        if http2 is None:
+            http2 = os.getenv("HARVESTER_HUB_HTTP2", "").strip().lower() in ("1", "true", "yes")
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        # Fixed for the client's lifetime; build them once, not per request.
+        self._install_url = f"{self.base_url}/catalog/install"
+        self._headers_dict = self._headers()
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Lazily build one pooled httpx.Client; installs and retries reuse its
+        keep-alive connections instead of a fresh TCP/TLS handshake per attempt."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        http2=self.http2,
+                        timeout=self.timeout,
+                        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            try:
+                self._client.close()
+            finally:
+                self._client = None
+
+    def __enter__(self) -> HubClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def _headers(self) -> dict[str, str]:
         h = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -24,26 +107,32 @@ class HubClient:
     def install_manifest(
         self, *, entity_uid: str, target: str, manifest: dict[str, Any]
     ) -> dict[str, Any]:
-        url = f"{self.base_url}/catalog/install"
-        body = {"id": entity_uid, "target": target, "manifest": manifest}
+        url = self._install_url
+        # Encoded once for every attempt; Content-Type is already in the headers
+        content = _dumps({"id": entity_uid, "target": target, "manifest": manifest})
         attempts = 3
         for i in range(1, attempts + 1):
             try:
-                with httpx.Client(timeout=self.timeout) as c:
-                    r = c.post(url, headers=self._headers(), json=body)
-                    data = (
-                        r.json()
-                        if r.headers.get("content-type", "").startswith("application/json")
-                        else {"raw": r.text}
-                    )
-                    if r.status_code in (200, 201, 202, 409):
-                        return data
-                    if 500 <= r.status_code <= 599 and i < attempts:
-                        time.sleep(min(0.5 * (2 ** (i - 1)), 4.0))
-                        continue
-                    raise RuntimeError(f"hub install failed: {r.status_code} {data}")
+                HUB_BUCKET.acquire()
+                r = self._get_client().post(url, headers=self._headers_dict, content=content)
+                data = (
+                    (orjson.loads(r.content) if orjson is not None else r.json())
+                    if r.headers.get("content-type", "").startswith("application/json")
+                    else {"raw": r.text}
+                )
+                if r.status_code in (200, 201, 202, 409):
+                    return data
+                if r.status_code == 429:
+                    HUB_BUCKET.drain()  # the hub is throttling us: slow the whole process down
+                retryable = r.status_code == 429 or 500 <= r.status_code <= 599
+                if retryable and i < attempts:
+                    time.sleep(_retry_delay(i, r.headers.get("Retry-After")))
+                    continue
+                if r.status_code == 429:
+                    raise RateLimitedError(f"hub install rate limited: 429 {data}")
+                raise RuntimeError(f"hub install failed: {r.status_code} {data}")
             except Exception:
                 if i == attempts:
                     raise
-                time.sleep(min(0.5 * (2 ** (i - 1)), 4.0))
+                time.sleep(_retry_delay(i))
         raise RuntimeError("unreachable")
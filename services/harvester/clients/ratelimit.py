@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe client-side token bucket: *rate* tokens/second, at most *burst* banked.
+
+    Callers take a token before each outbound request, so the harvester paces
+    itself instead of discovering the limit through 403/429 responses.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available; returns 0.0 on success, else the
+        seconds until the next token (nothing is taken in that case)."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Block until a token is taken; False if that would exceed *timeout* seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def drain(self, n: float = 1.0) -> None:
+        """Drop up to *n* banked tokens, e.g. after the server answered 429/403."""
+        with self._lock:
+            self._refill()
+            self._tokens = max(0.0, self._tokens - n)
+
+
+# GitHub code search allows 30 requests/minute for authenticated callers
+GITHUB_SEARCH_BUCKET = TokenBucket(30 / 60, 30)
+# Shared by every HubClient in the process
+HUB_BUCKET = TokenBucket(10, 20)
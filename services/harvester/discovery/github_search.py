@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import json
 import os
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 
 import httpx
+from sqlalchemy import select
+
+from ..clients.ratelimit import GITHUB_SEARCH_BUCKET
+from ..store.models import DiscoveryCache, get_session
 
 GITHUB_API = "https://api.github.com"
+PER_PAGE = 30  # most items a single search query can contribute
 
 QUERIES = [
     "FastMCP filename:server.py in:path language:Python",
@@ -23,28 +32,102 @@ def _headers() -> dict[str, str]:
     return h
 
 
+_Cached = tuple[str, bytes]  # (etag, raw response body)
+
+
+def _load_cache(queries: list[str]) -> dict[str, _Cached]:
+    # Best-effort: without the cache we simply re-download
+    try:
+        db = get_session()
+        try:
+            rows = db.execute(
+                select(DiscoveryCache.query, DiscoveryCache.etag, DiscoveryCache.body).where(
+                    DiscoveryCache.query.in_(queries)
+                )
+            ).all()
+        finally:
+            db.close()
+    except Exception:
+        return {}
+    return {q: (etag, body) for q, etag, body in rows if etag}
+
+
+def _save_cache(fresh: dict[str, _Cached]) -> None:
+    if not fresh:
+        return
+    try:
+        db = get_session()
+        try:
+            now = datetime.now(timezone.utc)
+            for q, (etag, body) in fresh.items():
+                db.merge(DiscoveryCache(query=q, etag=etag, body=body, updated_at=now))
+            db.commit()
+        finally:
+            db.close()
+    except Exception:
+        pass
+
+
+def _search(
+    c: httpx.Client, q: str, cached: _Cached | None = None
+) -> tuple[list[dict], _Cached | None]:
+    """Items for one code-search query, plus a new (etag, body) cache entry if the
+    results changed. Empty when rate limited or on a request error."""
+    try:
+        GITHUB_SEARCH_BUCKET.acquire()
+        headers = {"If-None-Match": cached[0]} if cached else None
+        r = c.get(
+            f"{GITHUB_API}/search/code", params={"q": q, "per_page": PER_PAGE}, headers=headers
+        )
+        if r.status_code == 304 and cached:  # unchanged since the cached response
+            return json.loads(cached[1]).get("items", []), None
+        if r.status_code == 403:  # rate limited
+            GITHUB_SEARCH_BUCKET.drain()
+            time.sleep(2.0)
+            return [], None
+        r.raise_for_status()
+        etag = r.headers.get("ETag")
+        return r.json().get("items", []), ((etag, r.content) if etag else None)
+    except httpx.RequestError:
+        # Ignore search errors for single queries
+        return [], None
+
+
 def search_sources(limit: int = 100) -> list[str]:
     """Return a list of canonical sources (e.g., repo clone URLs)."""
     out: list[str] = []
     seen = set()
-    with httpx.Client(timeout=20.0, headers=_headers()) as c:
-        for q in QUERIES:
-            try:
-                r = c.get(f"{GITHUB_API}/search/code", params={"q": q, "per_page": 30})
-                if r.status_code == 403:  # rate limited
-                    time.sleep(2.0)
-                    continue
-                r.raise_for_status()
-                data = r.json()
-                for item in data.get("items", []):
-                    repo = item.get("repository", {})
-                    clone = repo.get("clone_url")
-                    if clone and clone not in seen:
-                        seen.add(clone)
-                        out.append(clone)
-                    if len(out) >= limit:
-                        return out
-            except httpx.RequestError:
-                # Ignore search errors for single queries
-                continue
+    cache = _load_cache(QUERIES)
+    fresh: dict[str, _Cached] = {}
+    # Queries run concurrently over one pooled client, but a query is only sent
+    # while the ones already in flight cannot fill *limit* on their own, so no
+    # search quota is spent on results that would be thrown away. Results are
+    # consumed in QUERIES order, so the dedup/limit outcome is unchanged.
+    with (
+        httpx.Client(timeout=20.0, headers=_headers()) as c,
+        ThreadPoolExecutor(max_workers=len(QUERIES)) as ex,
+    ):
+        todo = iter(QUERIES)
+        pending: deque[tuple[str, Future[tuple[list[dict], _Cached | None]]]] = deque()
+        while len(out) < limit:
+            while len(pending) * PER_PAGE < limit - len(out):
+                q = next(todo, None)
+                if q is None:
+                    break
+                pending.append((q, ex.submit(_search, c, q, cache.get(q))))
+            if not pending:
+                break
+            q, fut = pending.popleft()
+            items, entry = fut.result()
+            if entry:
+                fresh[q] = entry
+            for item in items:
+                repo = item.get("repository", {})
+                clone = repo.get("clone_url")
+                if clone and clone not in seen:
+                    seen.add(clone)
+                    out.append(clone)
+                if len(out) >= limit:
+                    break
+    _save_cache(fresh)
     return out
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import os
+import uuid
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, validator
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
-from ..store.models import Job, get_session, job_to_view
-from ..workers.queue import InMemoryQueue
+from ..store.models import ACTIVE_JOB_STATUSES, Job, get_session, job_to_view
+from ..workers.queue import HarvesterQueue, InMemoryQueue, SqlJobQueue
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 # Queue is injected by app.py via dependency override in prod; in dev we keep a module-level.
-_queue = InMemoryQueue()
+# HARVESTER_QUEUE=sql keeps queued/in-flight jobs in the database so they survive restarts.
+_queue: HarvesterQueue = (
+    SqlJobQueue() if os.getenv("HARVESTER_QUEUE", "memory").lower() == "sql" else InMemoryQueue()
+)
 
 
 # ----------------------------
@@ -52,6 +60,26 @@ class JobSubmit(BaseModel):
 # ----------------------------
 # Endpoints
 # ----------------------------
+def _insert_job(db: Session, job: Job) -> tuple[str, bool]:
+    """Insert *job* (its id set) unless its source already has a queued/running job.
+
+    Returns (job id, created); on a duplicate the active job's id is returned instead.
+    """
+    jid, source = job.id, job.source
+    db.add(job)
+    try:
+        db.commit()
+        return jid, True
+    except IntegrityError:
+        db.rollback()
+        existing = db.execute(
+            select(Job.id).where(Job.source == source, Job.status.in_(ACTIVE_JOB_STATUSES))
+        ).scalar()
+        if existing is None:
+            raise
+        return existing, False
+
+
 @router.post("", response_model=JobId)
 def submit_job(payload: JobSubmit) -> JobId:
     """Enqueue a job.
@@ -66,13 +94,11 @@ def submit_job(payload: JobSubmit) -> JobId:
         if payload.mode:
             options.setdefault("mode", payload.mode)
 
-        job = Job(source=payload.source, status="queued", options=options)
-        db.add(job)
-        db.commit()
-        db.refresh(job)
-
-        jid = job.id
-        _queue.enqueue({"id": jid, "source": job.source, "options": job.options})
+        jid, created = _insert_job(
+            db, Job(id=str(uuid.uuid4()), source=payload.source, status="queued", options=options)
+        )
+        if created:
+            _queue.enqueue({"id": jid, "source": payload.source, "options": options})
         return JobId(id=jid)
     finally:
         db.close()
@@ -82,7 +108,9 @@ def submit_job(payload: JobSubmit) -> JobId:
 def get_job(job_id: str):
     db = get_session()
     try:
-        job = db.get(Job, job_id)
+        job = db.execute(
+            select(Job).options(selectinload(Job.artifacts)).where(Job.id == job_id)
+        ).scalar_one_or_none()
         if not job:
             raise HTTPException(status_code=404, detail="job not found")
         return job_to_view(db, job).dict()
@@ -101,14 +129,32 @@ def discover_jobs(query: str = ""):
     sources = search_sources(limit=25)
     db = get_session()
     try:
-        enqueued = []
-        for src in sources:
-            job = Job(source=src, status="queued", options={"build": "docker", "validate": "light"})
-            db.add(job)
+        # Sources that already have a job (from any earlier discover run) are not re-enqueued
+        known = set(db.execute(select(Job.source).where(Job.source.in_(sources))).scalars())
+        sources = [src for src in sources if src not in known]
+        # One transaction for the whole batch. Ids are assigned here (not at flush) and
+        # the queue payloads built up front, so nothing is re-read after the commit.
+        payloads = [
+            {
+                "id": str(uuid.uuid4()),
+                "source": src,
+                "options": {"build": "docker", "validate": "light"},
+            }
+            for src in sources
+        ]
+        if db.get_bind().dialect.name == "postgresql":
+            # Discovered jobs can simply be rediscovered; skip the synchronous WAL flush
+            db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+        db.add_all(Job(status="queued", **p) for p in payloads)
+        try:
             db.commit()
-            db.refresh(job)
-            _queue.enqueue({"id": job.id, "source": job.source, "options": job.options})
-            enqueued.append(job.id)
+        except IntegrityError:
+            # A source was submitted concurrently: fall back to one singleflight insert each
+            db.rollback()
+            payloads = [p for p in payloads if _insert_job(db, Job(status="queued", **p))[1]]
+        for p in payloads:
+            _queue.enqueue(p)
+        enqueued = [p["id"] for p in payloads]
         return {"count": len(enqueued), "job_ids": enqueued}
     finally:
         db.close()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 import uuid
-from datetime import datetime
+import warnings
+from collections.abc import Iterable
+from datetime import datetime, timezone
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
@@ -15,10 +17,19 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     create_engine,
+    delete,
+    event,
+    inspect,
+    select,
+    text,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
 # ---------------------------------------------------------------------------
@@ -26,9 +37,37 @@ from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 # ---------------------------------------------------------------------------
 DB_URL = os.getenv("HARVESTER_DB_URL", "sqlite:///harvester.db")
 
-engine = create_engine(DB_URL, future=True)
+_IS_SQLITE = DB_URL.startswith("sqlite")
+
+if _IS_SQLITE:
+    # Worker threads share the engine; WAL (below) handles their concurrent access
+    _engine_kwargs: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+else:
+    # Sized for the worker threads that all commit Job/Artifact rows
+    _engine_kwargs = {
+        "pool_size": int(os.getenv("HARVESTER_DB_POOL", "16")),
+        "max_overflow": int(os.getenv("HARVESTER_DB_OVERFLOW", "8")),
+        "pool_pre_ping": True,
+    }
+
+engine = create_engine(DB_URL, future=True, **_engine_kwargs)
+
+if _IS_SQLITE:
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_wal(dbapi_conn: Any, _record: Any) -> None:
+        """WAL lets readers proceed while one worker writes (no "database is locked" stalls)."""
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.close()
+
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
-Base = declarative_base()
+Base: Any = declarative_base()
+
+# Job states that hold the source's singleflight slot (see ix_jobs_source_active)
+ACTIVE_JOB_STATUSES = ("queued", "running")
 
 
 # ---------------------------------------------------------------------------
@@ -58,9 +97,10 @@ class Job(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
+    visible_at = Column(DateTime, nullable=True)  # SqlJobQueue claim expiry
 
     confidence = Column(Float, nullable=True)  # detector/validate composite
-    frameworks = Column(String, nullable=True)  # comma-separated tags
+    frameworks = Column(String, nullable=True)  # comma-separated cache of job_frameworks
 
     # New: repo metadata & harvest summaries
     sha = Column(String, nullable=True, index=True)
@@ -71,14 +111,24 @@ class Job(Base):
 
     artifacts = relationship("Artifact", back_populates="job", cascade="all, delete-orphan")
 
-    __table_args__ = (Index("ix_jobs_status_created", "status", "created_at"),)
+    __table_args__ = (
+        Index("ix_jobs_status_created", "status", "created_at"),
+        # Singleflight: at most one queued/running job per source
+        Index(
+            "ix_jobs_source_active",
+            "source",
+            unique=True,
+            sqlite_where=status.in_(ACTIVE_JOB_STATUSES),
+            postgresql_where=status.in_(ACTIVE_JOB_STATUSES),
+        ),
+    )
 
 
 class Artifact(Base):
     __tablename__ = "artifacts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    job_id = Column(String, ForeignKey("jobs.id"), index=True, nullable=False)
+    job_id = Column(String, ForeignKey("jobs.id"), nullable=False)
     kind = Column(String, nullable=False)  # manifest|index|sbom|log|other
     uri = Column(String, nullable=False)  # file:// or s3:// or ghpages path
     digest = Column(String, nullable=True)
@@ -86,6 +136,27 @@ class Artifact(Base):
 
     job = relationship("Job", back_populates="artifacts")
 
+    # (job_id, kind) also serves plain job_id lookups, so job_id needs no index of its own
+    __table_args__ = (Index("ix_artifacts_job_kind", "job_id", "kind"),)
+
+
+class Framework(Base):
+    """Framework tag (fastmcp, langchain, ...), shared by every job that detected it."""
+
+    __tablename__ = "frameworks"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True, nullable=False)
+
+
+class JobFramework(Base):
+    """Job <-> framework link; the primary key serves per-job reads, the index per-framework."""
+
+    __tablename__ = "job_frameworks"
+
+    job_id = Column(String, ForeignKey("jobs.id"), primary_key=True)
+    framework_id = Column(Integer, ForeignKey("frameworks.id"), primary_key=True, index=True)
+
 
 class CatalogEntry(Base):
     """Indexable catalog row for a single manifest.
@@ -111,7 +182,23 @@ class CatalogEntry(Base):
 
     notes = Column(Text, nullable=True)
 
-    __table_args__ = (Index("ix_catalog_transport_validated", "transport", "validated"),)
+    __table_args__ = (
+        Index("ix_catalog_transport_validated", "transport", "validated"),
+        # /catalogs lists newest first; validated listings rank by score
+        Index("ix_catalog_last_seen", last_seen.desc()),
+        Index("ix_catalog_validated_score", "validated", score.desc()),
+    )
+
+
+class DiscoveryCache(Base):
+    """Last GitHub code-search response per query, revalidated with If-None-Match."""
+
+    __tablename__ = "discovery_cache"
+
+    query = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    body = Column(LargeBinary, nullable=False)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
 
 # ---------------------------------------------------------------------------
@@ -140,14 +227,93 @@ class JobView(BaseModel):
 
 def init_db() -> None:
     Base.metadata.create_all(engine)
+    _upgrade_schema()
+
+
+def _upgrade_schema() -> None:
+    """Bring a database created by an older harvester up to the current models.
+
+    create_all only creates missing tables, so columns and indexes added to
+    existing tables since are added here. Idempotent: runs on every start.
+    """
+    existing = set(inspect(engine).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            continue  # just created by create_all, complete already
+        have = {c["name"] for c in inspect(engine).get_columns(table.name)}
+        with engine.begin() as conn:
+            for col in table.columns:
+                if col.name in have or not col.nullable:
+                    continue
+                ddl = col.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{col.name}" {ddl}'))
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except IntegrityError:
+                # e.g. ix_jobs_source_active over a source with several active jobs
+                warnings.warn(
+                    f"could not create unique index {index.name}: existing rows violate it; "
+                    "resolve the duplicates and restart",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
 
 
 def get_session() -> Session:
     return SessionLocal()
 
 
+def set_job_frameworks(db: Session, job: Job, names: Iterable[str]) -> None:
+    """Record the job's framework tags as job_frameworks rows (plus the CSV cache on the job).
+
+    Runs inside the caller's transaction; replaces any tags from an earlier run of the job.
+    """
+    names = list(dict.fromkeys(n for n in names if n))
+    job.frameworks = ",".join(names)
+    db.flush()  # the session isn't autoflushing; pending links must be visible to the delete
+    db.execute(delete(JobFramework).where(JobFramework.job_id == job.id))
+    if not names:
+        return
+    _ensure_frameworks(db, names)
+    ids: dict[str, int] = dict(
+        db.execute(select(Framework.name, Framework.id).where(Framework.name.in_(names))).all()
+    )
+    db.add_all(JobFramework(job_id=job.id, framework_id=ids[n]) for n in names)
+
+
+def _ensure_frameworks(db: Session, names: list[str]) -> None:
+    """Insert any of *names* not yet in frameworks; concurrent jobs may add the same ones.
+
+    A plain INSERT of a name another worker just committed would fail the whole job
+    transaction on the UNIQUE constraint, so conflicts are ignored instead.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite_insert if dialect == "sqlite" else pg_insert
+        db.execute(
+            insert(Framework)
+            .values([{"name": n} for n in names])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        return
+    known: set[str] = set(
+        db.execute(select(Framework.name).where(Framework.name.in_(names))).scalars()
+    )
+    for n in names:
+        if n in known:
+            continue
+        try:
+            with db.begin_nested():  # a duplicate only rolls back this savepoint
+                db.add(Framework(name=n))
+        except IntegrityError:
+            pass
+
+
 def job_to_view(db: Session, job: Job) -> JobView:
-    arts = db.query(Artifact).filter(Artifact.job_id == job.id).all()
+    # Uses the relationship: no extra query when the job was loaded with
+    # selectinload(Job.artifacts), a lazy load otherwise
+    arts = job.artifacts
     transports_summary = job.transports_summary or {}
 
     summary: dict[str, Any] = {
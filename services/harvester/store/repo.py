@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import shutil
 from pathlib import Path
 
 ARTIFACT_ROOT = Path("harvester_artifacts").resolve()
+_CHUNK = 64 * 1024
 
 
 def _ext_for_kind(kind: str) -> str:
@@ -15,14 +17,28 @@ def _ext_for_kind(kind: str) -> str:
     return ".bin"
 
 
-def put_artifact(job_id: str, kind: str, data: bytes) -> str:
-    """Write artifact bytes to disk with content-hash name; return file:// URI."""
-    h = hashlib.sha256(data).hexdigest()[:16]
+def put_artifact(job_id: str, kind: str, data: bytes | Path) -> str:
+    """Write artifact bytes to disk with content-hash name; return file:// URI.
+
+    *data* may also be the path of a file to store, which is hashed and copied in
+    chunks (large logs never have to be loaded into memory).
+    """
+    if isinstance(data, Path):
+        hasher = hashlib.sha256()
+        with data.open("rb") as fp:
+            for chunk in iter(lambda: fp.read(_CHUNK), b""):
+                hasher.update(chunk)
+        h = hasher.hexdigest()[:16]
+    else:
+        h = hashlib.sha256(data).hexdigest()[:16]
     ext = _ext_for_kind(kind)
     out_dir = ARTIFACT_ROOT / job_id
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{h}_{kind}{ext}"
-    path.write_bytes(data)
+    if isinstance(data, Path):
+        shutil.copyfile(data, path)
+    else:
+        path.write_bytes(data)
     return f"file://{path}"
 
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import threading
+import time
 import uuid
-from queue import Queue
+from datetime import datetime, timedelta, timezone
+from queue import Empty, SimpleQueue
 from typing import Any
 
+from sqlalchemy import or_, select, update
+
+from ..store.models import ACTIVE_JOB_STATUSES, Job, get_session
+
 JobPayload = dict[str, Any]
 
 
@@ -23,14 +28,19 @@ class HarvesterQueue:
     def nack(self, job_id: str) -> None:
         raise NotImplementedError
 
+    def recover(self) -> int:
+        """Called once at startup; returns how many jobs were handed back to the queue."""
+        return 0
+
 
 class InMemoryQueue(HarvesterQueue):
     """Dev-only in-memory queue with visibility timeout semantics (simplified)."""
 
     def __init__(self) -> None:
-        self.q: Queue[tuple[str, JobPayload]] = Queue()
+        self.q: SimpleQueue[tuple[str, JobPayload]] = SimpleQueue()
+        # No lock of its own: each access below is a single dict set/pop, which is
+        # atomic under the GIL, so workers never serialize on a queue-wide mutex.
         self.inflight: dict[str, JobPayload] = {}
-        self.lock = threading.Lock()
 
     def enqueue(self, job: JobPayload) -> str:
         jid = job.get("id") or str(uuid.uuid4())
@@ -40,16 +50,133 @@ class InMemoryQueue(HarvesterQueue):
 
     def dequeue(self, timeout: float = 1.0) -> tuple[str, JobPayload]:
         jid, payload = self.q.get(timeout=timeout)
-        with self.lock:
-            self.inflight[jid] = payload
+        self.inflight[jid] = payload
         return jid, payload
 
     def ack(self, job_id: str) -> None:
-        with self.lock:
-            self.inflight.pop(job_id, None)
+        self.inflight.pop(job_id, None)
 
     def nack(self, job_id: str) -> None:
-        with self.lock:
-            payload = self.inflight.pop(job_id, None)
+        payload = self.inflight.pop(job_id, None)
         if payload:
             self.q.put((job_id, payload))
+
+    def recover(self) -> int:
+        """Re-enqueue the jobs a previous process left queued/running in the database.
+
+        Their rows still hold the source's singleflight slot, so without this a
+        restart would leave those sources un-harvestable. Assumes this process is
+        the only one serving the database, as the in-memory queue already does.
+        """
+        db = get_session()
+        try:
+            rows = db.execute(
+                select(Job.id, Job.source, Job.options)
+                .where(Job.status.in_(ACTIVE_JOB_STATUSES))
+                .order_by(Job.created_at)
+            ).all()
+            if rows:
+                db.execute(
+                    update(Job)
+                    .where(Job.id.in_([r.id for r in rows]))
+                    .values(status="queued", visible_at=None)
+                )
+                db.commit()
+        finally:
+            db.close()
+        for r in rows:
+            self.enqueue({"id": r.id, "source": r.source, "options": r.options})
+        return len(rows)
+
+
+class SqlJobQueue(HarvesterQueue):
+    """Durable queue on the jobs table itself: queued rows are the queue.
+
+    A dequeued job stays claimed (``visible_at``) for *visibility_timeout* seconds;
+    if the worker dies without ack/nack it becomes visible again and is retried, so
+    nothing is lost on restart. ``FOR UPDATE SKIP LOCKED`` lets workers on Postgres
+    pull concurrently; the claim itself is a conditional UPDATE, which also keeps
+    SQLite (no row locks) from handing one job to two workers.
+    """
+
+    def __init__(self, *, visibility_timeout: float = 1800.0, poll_interval: float = 0.25):
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+
+    def enqueue(self, job: JobPayload) -> str:
+        # The API already inserted the row as "queued"; only unknown jobs are added here
+        jid = job.get("id") or str(uuid.uuid4())
+        job["id"] = jid
+        db = get_session()
+        try:
+            if db.get(Job, jid) is None:
+                db.add(Job(id=jid, source=job["source"], options=job.get("options")))
+                db.commit()
+        finally:
+            db.close()
+        return jid
+
+    def _claim(self) -> tuple[str, JobPayload] | None:
+        now = datetime.now(timezone.utc)
+        db = get_session()
+        try:
+            row = db.execute(
+                select(Job.id, Job.source, Job.options, Job.status, Job.visible_at)
+                .where(
+                    or_(
+                        (Job.status == "queued")
+                        & (or_(Job.visible_at.is_(None), Job.visible_at < now)),
+                        # claimed by a worker that never acked: retry it
+                        (Job.status == "running") & (Job.visible_at < now),
+                    )
+                )
+                .order_by(Job.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+            if row is None:
+                return None
+            claimed = db.execute(
+                update(Job)
+                .where(Job.id == row.id, Job.status == row.status)
+                .where(
+                    Job.visible_at.is_(None)
+                    if row.visible_at is None
+                    else Job.visible_at == row.visible_at
+                )
+                .values(
+                    status="running",
+                    visible_at=now + timedelta(seconds=self.visibility_timeout),
+                )
+            ).rowcount
+            db.commit()
+            if claimed != 1:
+                return None  # another worker got there first
+            return row.id, {"id": row.id, "source": row.source, "options": row.options}
+        finally:
+            db.close()
+
+    def dequeue(self, timeout: float = 1.0) -> tuple[str, JobPayload]:
+        deadline = time.monotonic() + timeout
+        while True:
+            got = self._claim()
+            if got is not None:
+                return got
+            if time.monotonic() >= deadline:
+                raise Empty
+            time.sleep(self.poll_interval)
+
+    def ack(self, job_id: str) -> None:
+        # execute_job has already recorded the outcome; just release the claim
+        self._set(job_id, visible_at=None)
+
+    def nack(self, job_id: str) -> None:
+        self._set(job_id, status="queued", visible_at=None)
+
+    def _set(self, job_id: str, **values: Any) -> None:
+        db = get_session()
+        try:
+            db.execute(update(Job).where(Job.id == job_id).values(**values))
+            db.commit()
+        finally:
+            db.close()
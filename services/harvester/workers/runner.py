@@ -1,37 +1,143 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import socket
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+try:  # optional
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 from ..clients.hub_client import HubClient
 from ..discovery.scoring import score_entry
-from ..store.models import Artifact, Job, get_session
+from ..store.models import Artifact, Job, get_session, set_job_frameworks
 from ..store.repo import put_artifact
 
 AUTO_REGISTER_THRESHOLD = 0.8
 MATRIXHUB_URL = "http://127.0.0.1:7300"
+# Socket of a running mcp-ingest-daemon; jobs fall back to a subprocess without one
+INGEST_SOCKET = os.getenv("MCP_INGEST_SOCKET", "/var/run/mcp-ingest.sock")
+
+# One client per worker process, so auto-registrations share its connection pool
+_hub_client: HubClient | None = None
+
+
+def _hub() -> HubClient:
+    global _hub_client
+    if _hub_client is None:
+        _hub_client = HubClient(MATRIXHUB_URL)
+    return _hub_client
+
+
+def _run_via_daemon(
+    cmd: list[str], out_f: BinaryIO, err_f: BinaryIO, *, cwd: Path | None, timeout: int
+) -> int | None:
+    """Run an `mcp-ingest` command on the warm mcp-ingest-daemon (no interpreter start-up
+    per job); our stdout/stderr files are handed over as-is. None if no daemon answers."""
+    if cmd[:1] != ["mcp-ingest"] or not os.path.exists(INGEST_SOCKET):
+        return None
+    req = {"argv": cmd[1:], "cwd": str(cwd) if cwd else None, "timeout": timeout}
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        try:
+            sock.connect(INGEST_SOCKET)
+            socket.send_fds(
+                sock, [json.dumps(req).encode("utf-8")], [out_f.fileno(), err_f.fileno()]
+            )
+        except OSError:
+            return None  # stale socket / daemon down: caller falls back to a subprocess
+        t0 = time.monotonic()
+        sock.settimeout(timeout + 10)  # the daemon ends the job itself at *timeout*
+        buf = b""
+        try:
+            while chunk := sock.recv(4096):
+                buf += chunk
+        except OSError:
+            pass
+    try:
+        return int(json.loads(buf)["rc"])
+    except Exception:
+        # No answer: the job was killed (its timeout) or crashed
+        timed_out = time.monotonic() - t0 >= timeout
+        err_f.write(b"\n[timeout]" if timed_out else b"\n[mcp-ingest daemon: job died]")
+        return -1
+
 
+def _run(
+    cmd: list[str], *, log_path: Path, cwd: Path | None = None, timeout: int = 900
+) -> tuple[int, str]:
+    """Run a subprocess with a wall-clock timeout; returns (returncode, stdout).
 
-def _run(cmd: list[str], *, cwd: Path | None = None, timeout: int = 900) -> tuple[int, str, str]:
-    """Run a subprocess with a wall-clock timeout, capturing stdout/stderr."""
+    Output goes straight to files rather than through pipes into memory: *log_path*
+    ends up holding stdout, a ``---`` line, then stderr. Only stdout (the CLI's JSON
+    result) is read back. `mcp-ingest` commands go to the daemon when one is listening
+    on INGEST_SOCKET.
+    """
+    with open(log_path, "w+b") as out_f, tempfile.TemporaryFile() as err_f:
+        rc = _run_via_daemon(cmd, out_f, err_f, cwd=cwd, timeout=timeout)
+        if rc is None:
+            rc = _run_subprocess(cmd, out_f, err_f, cwd=cwd, timeout=timeout)
+        out_f.seek(0)
+        out = out_f.read().decode("utf-8", errors="replace")
+        out_f.write(b"\n---\n")
+        err_f.seek(0)
+        shutil.copyfileobj(err_f, out_f)
+    return rc, out
+
+
+def _artifact_row(job_id: str, kind: str, uri: str, size: int | None = None) -> dict[str, Any]:
+    return {"job_id": job_id, "kind": kind, "uri": uri, "digest": None, "bytes": size}
+
+
+def _insert_artifacts(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Write the collected Artifact rows as one executemany INSERT (no ORM objects)."""
+    if rows:
+        db.execute(insert(Artifact), rows)
+        rows.clear()
+
+
+def _run_subprocess(
+    cmd: list[str], out_f: BinaryIO, err_f: BinaryIO, *, cwd: Path | None, timeout: int
+) -> int:
     p = subprocess.Popen(
         cmd,
         cwd=str(cwd) if cwd else None,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+        stdout=out_f,
+        stderr=err_f,
     )
     try:
-        out, err = p.communicate(timeout=timeout)
-        return p.returncode, out or "", err or ""
+        return p.wait(timeout=timeout)
     except subprocess.TimeoutExpired:
         p.kill()
-        out, err = p.communicate()
-        return -1, out or "", (err or "") + "\n[timeout]"
+        p.wait()
+        err_f.write(b"\n[timeout]")
+        return -1
+
+
+def _run_logged(
+    artifacts: list[dict[str, Any]], job_id: str, cmd: list[str], *, log_path: Path, timeout: int
+) -> tuple[int, str]:
+    """_run, then queue the combined log as the job's "log" artifact; returns (rc, stdout)."""
+    try:
+        rc, out = _run(cmd, log_path=log_path, timeout=timeout)
+        log_uri = put_artifact(job_id, "log", log_path)
+    finally:
+        log_path.unlink(missing_ok=True)
+    artifacts.append(_artifact_row(job_id, "log", log_uri))
+    return rc, out
 
 
 def _persist_file(job_id: str, kind: str, path: Path) -> str | None:
@@ -48,21 +154,45 @@ def _persist_file(job_id: str, kind: str, path: Path) -> str | None:
     return uri
 
 
+def _json_loads(data: str | bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def _safe_json_load(s: str) -> dict:
     try:
-        return json.loads(s)
+        return _json_loads(s)
     except Exception:
         return {}
 
 
-def _auto_register_if_high(score: float, manifest_path: Path | None) -> None:
-    if score < AUTO_REGISTER_THRESHOLD or not manifest_path or not manifest_path.exists():
+def _parse_and_score(out: str) -> tuple[str | None, float, list[str]]:
+    """The CPU step after `mcp-ingest pack`: parse its JSON result and score it.
+
+    Returns (manifest_path, score, frameworks). Pure and module-level (picklable), but
+    run inline: it takes microseconds, far less than handing it to a process would.
+    """
+    result: dict[str, Any] = _safe_json_load(out)
+    manifest_path = result.get("describe", {}).get("manifest_path") or result.get("manifest_path")
+    # Compute score (detect+validation best-effort)
+    detect_report = (
+        result.get("detected", {}).get("report") if "detected" in result else result.get("report")
+    )
+    validation = result.get("register", {}) if "register" in result else {}
+    score = score_entry(
+        repo_metrics=None, detect_report=detect_report or {}, validation=validation or {}
+    )
+    frameworks = detect_report.get("frameworks", []) if isinstance(detect_report, dict) else []
+    return manifest_path, score, frameworks
+
+
+def _auto_register_if_high(score: float, manifest_bytes: bytes | None) -> None:
+    """Register the manifest (bytes already read for its artifact) when *score* is high."""
+    if score < AUTO_REGISTER_THRESHOLD or not manifest_bytes:
         return
     try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = _json_loads(manifest_bytes)
         entity_uid = f"{manifest.get('type', 'mcp_server')}:{manifest.get('id')}@{manifest.get('version', '0.1.0')}"
-        client = HubClient(MATRIXHUB_URL)
-        client.install_manifest(entity_uid=entity_uid, target="./", manifest=manifest)
+        _hub().install_manifest(entity_uid=entity_uid, target="./", manifest=manifest)
     except Exception:
         # best-effort only
         pass
@@ -92,6 +222,9 @@ def execute_job(job_id: str, payload: dict[str, Any]) -> None:
         timeout = int(options.get("timeout", 900))
 
         outdir = Path(tempfile.mkdtemp(prefix="mcp_job_"))
+        log_path = outdir.with_name(f"{outdir.name}.log")  # outside the CLI's --out tree
+        # Artifact rows are collected and inserted in bulk right before each commit
+        artifacts: list[dict[str, Any]] = []
 
         if mode == "harvest_repo":
             # Build CLI command for clear timeout semantics
@@ -111,16 +244,14 @@ def execute_job(job_id: str, payload: dict[str, Any]) -> None:
             if matrixhub:
                 cmd += ["--matrixhub", matrixhub]
 
-            rc, out, err = _run(cmd, timeout=timeout)
-
             # Always persist combined logs
-            log_uri = put_artifact(job.id, "log", (out + "\n---\n" + err).encode("utf-8"))
-            db.add(Artifact(job_id=job.id, kind="log", uri=log_uri, digest=None, bytes=None))
+            rc, out = _run_logged(artifacts, job.id, cmd, log_path=log_path, timeout=timeout)
 
             if rc != 0:
                 job.status = "failed"
                 job.error = f"harvest-repo failed: rc={rc}"
                 job.finished_at = datetime.utcnow()
+                _insert_artifacts(db, artifacts)
                 db.commit()
                 return
 
@@ -136,25 +267,20 @@ def execute_job(job_id: str, payload: dict[str, Any]) -> None:
                 if ip.exists():
                     ibytes = ip.read_bytes()
                     i_uri = put_artifact(job.id, "index", ibytes)
-                    db.add(
-                        Artifact(
-                            job_id=job.id, kind="index", uri=i_uri, digest=None, bytes=len(ibytes)
-                        )
-                    )
+                    artifacts.append(_artifact_row(job.id, "index", i_uri, len(ibytes)))
 
             # Persist all manifests
             stored = 0
+            first_mbytes: bytes | None = None  # kept for auto-register, no second read
             for mp in manifest_paths:
                 p = Path(str(mp)).expanduser().resolve()
                 if not p.exists():
                     continue
-                mbytes = p.read_bytes()
-                m_uri = put_artifact(job.id, "manifest", mbytes)
-                db.add(
-                    Artifact(
-                        job_id=job.id, kind="manifest", uri=m_uri, digest=None, bytes=len(mbytes)
-                    )
-                )
+                raw = p.read_bytes()
+                if first_mbytes is None:
+                    first_mbytes = raw
+                m_uri = put_artifact(job.id, "manifest", raw)
+                artifacts.append(_artifact_row(job.id, "manifest", m_uri, len(raw)))
                 stored += 1
 
             # Score (lightweight): if manifests produced, assign a baseline; higher if summary says validated
@@ -166,24 +292,17 @@ def execute_job(job_id: str, payload: dict[str, Any]) -> None:
             job.confidence = score
             frameworks = summary.get("frameworks")
             if isinstance(frameworks, list):
-                job.frameworks = ",".join(frameworks)
+                set_job_frameworks(db, job, frameworks)
             job.status = "succeeded"
             job.finished_at = datetime.utcnow()
+            _insert_artifacts(db, artifacts)
             db.commit()
 
             # Auto-register top entries only if requested via options and high score
             if options.get("auto_register_top") and repo_index:
                 try:
-                    # pick first manifest path for auto-register attempt
-                    first_path = next(
-                        (
-                            Path(str(mp)).expanduser().resolve()
-                            for mp in manifest_paths
-                            if Path(str(mp)).exists()
-                        ),
-                        None,
-                    )
-                    _auto_register_if_high(score, first_path)
+                    # first stored manifest is the auto-register candidate
+                    _auto_register_if_high(score, first_mbytes)
                 except Exception:
                     pass
 
@@ -198,77 +317,91 @@ def execute_job(job_id: str, payload: dict[str, Any]) -> None:
         if options.get("validate") in {"light", "strict"}:
             cmd += ["--validate", "strict"]
 
-        rc, out, err = _run(cmd, timeout=timeout)
-
-        log_uri = put_artifact(job.id, "log", (out + "\n---\n" + err).encode("utf-8"))
-        db.add(Artifact(job_id=job.id, kind="log", uri=log_uri, digest=None, bytes=None))
+        rc, out = _run_logged(artifacts, job.id, cmd, log_path=log_path, timeout=timeout)
 
         if rc != 0:
             job.status = "failed"
             job.error = f"mcp-ingest pack failed: rc={rc}"
             job.finished_at = datetime.utcnow()
+            _insert_artifacts(db, artifacts)
             db.commit()
             return
 
-        result: dict[str, Any] = _safe_json_load(out)
-        manifest_path: str | None = None
-        manifest_path = result.get("describe", {}).get("manifest_path") or result.get(
-            "manifest_path"
-        )
+        manifest_path, score, frameworks = _parse_and_score(out)
+        mbytes: bytes | None = None
 
         if manifest_path:
             mp = Path(manifest_path).expanduser().resolve()
             if mp.exists():
                 mbytes = mp.read_bytes()
                 m_uri = put_artifact(job.id, "manifest", mbytes)
-                db.add(
-                    Artifact(
-                        job_id=job.id, kind="manifest", uri=m_uri, digest=None, bytes=len(mbytes)
-                    )
-                )
+                artifacts.append(_artifact_row(job.id, "manifest", m_uri, len(mbytes)))
 
         # Optional index
         ip = Path(outdir / "index.json")
         if ip.exists():
             ibytes = ip.read_bytes()
             i_uri = put_artifact(job.id, "index", ibytes)
-            db.add(Artifact(job_id=job.id, kind="index", uri=i_uri, digest=None, bytes=len(ibytes)))
-
-        # Compute score (detect+validation best-effort)
-        detect_report = (
-            result.get("detected", {}).get("report")
-            if "detected" in result
-            else result.get("report")
-        )
-        validation = result.get("register", {}) if "register" in result else {}
-        score = score_entry(
-            repo_metrics=None, detect_report=detect_report or {}, validation=validation or {}
-        )
+            artifacts.append(_artifact_row(job.id, "index", i_uri, len(ibytes)))
 
         job.confidence = score
-        job.frameworks = (
-            ",".join(detect_report.get("frameworks", [])) if isinstance(detect_report, dict) else ""
-        )
+        set_job_frameworks(db, job, frameworks)
         job.status = "succeeded"
         job.finished_at = datetime.utcnow()
+        _insert_artifacts(db, artifacts)
         db.commit()
 
         # Optional auto-register if score high and manifest exists
         if manifest_path and score >= AUTO_REGISTER_THRESHOLD:
-            _auto_register_if_high(score, Path(manifest_path))
+            _auto_register_if_high(score, mbytes)
 
     finally:
         db.close()
 
 
+def _safe_execute(queue, jid: str, payload: dict[str, Any]) -> None:
+    """execute_job with the queue's ack/nack; never raises."""
+    try:
+        execute_job(jid, payload)
+        queue.ack(jid)
+    except Exception:
+        try:
+            queue.nack(jid)
+        except Exception:
+            pass
+
+
 def worker_loop(queue, stop_event) -> None:
     while not stop_event.is_set():
         try:
             jid, payload = queue.dequeue(timeout=1.0)
-            try:
-                execute_job(jid, payload)
-                queue.ack(jid)
-            except Exception:
-                queue.nack(jid)
         except Exception:
             continue
+        _safe_execute(queue, jid, payload)
+
+
+def run_forever(queue, stop_event, workers: int = 4) -> None:
+    """Dequeue on this thread and run up to *workers* jobs at once on a thread pool.
+
+    Jobs are subprocess/I/O bound, so threads are enough. A job is only taken off
+    the queue once a worker is free: nothing piles up in the executor, where a
+    durable queue's visibility timeout could expire before the job even starts.
+    """
+    slots = threading.BoundedSemaphore(workers)
+
+    def _run(jid: str, payload: dict[str, Any]) -> None:
+        try:
+            _safe_execute(queue, jid, payload)
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="harvest-job") as ex:
+        while not stop_event.is_set():
+            if not slots.acquire(timeout=1.0):
+                continue
+            try:
+                jid, payload = queue.dequeue(timeout=1.0)
+            except Exception:
+                slots.release()
+                continue
+            ex.submit(_run, jid, payload)
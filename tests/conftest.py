@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+"""Shared test setup.
+
+The harvester service (services/harvester) reads HARVESTER_DB_URL at import
+time, so every test module that imports it is pointed at one throwaway SQLite
+file before collection starts; a developer's real database is never touched.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+_DB_DIR = Path(tempfile.mkdtemp(prefix="harvester-test-"))
+os.environ["HARVESTER_DB_URL"] = f"sqlite:///{_DB_DIR / 'harvester.db'}"
+
+
+@pytest.fixture
+def ingest_daemon() -> Iterator[str]:
+    """A running ``python -m mcp_ingest.daemon``; yields its socket path."""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        pytest.skip("the daemon needs AF_UNIX sockets and fork")
+    # AF_UNIX paths are short (~100 bytes): keep it out of pytest's deep tmp dirs
+    sock_dir = Path(tempfile.mkdtemp(prefix="mcp-ingest-"))
+    path = sock_dir / "d.sock"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "mcp_ingest.daemon", "--socket", str(path)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not path.exists():
+            if proc.poll() is not None or time.monotonic() > deadline:
+                pytest.fail("mcp-ingest daemon did not start")
+            time.sleep(0.05)
+        yield str(path)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+        shutil.rmtree(sock_dir, ignore_errors=True)
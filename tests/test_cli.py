@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+"""Tests for mcp_ingest.cli helpers."""
+
+import itertools
+from typing import Any
+
+import pytest
+
+from mcp_ingest.cli import _parse_kv_list
+
+
+def _split_parse(values: list[str] | None) -> list[dict[str, Any]]:
+    """The str.split parser _parse_kv_list replaced; its output is the contract."""
+    out: list[dict[str, Any]] = []
+    for item in values or []:
+        entry: dict[str, Any] = {}
+        for kv in item.split(","):
+            if "=" in kv:
+                k, v = kv.split("=", 1)
+                entry[k.strip()] = v.strip()
+        if entry:
+            out.append(entry)
+    return out
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (None, []),
+        ([], []),
+        (["", "noequals"], []),
+        (["uri=file://a.txt, name = A "], [{"uri": "file://a.txt", "name": "A"}]),
+        (["k=a=b", "x="], [{"k": "a=b"}, {"x": ""}]),
+        (["junk,k=v,,tail"], [{"k": "v"}]),
+        (["=v"], [{"": "v"}]),
+    ],
+)
+def test_parse_kv_list(values: list[str] | None, expected: list[dict[str, Any]]) -> None:
+    assert _parse_kv_list(values) == expected
+
+
+def test_parse_kv_list_matches_split_parser_exhaustively() -> None:
+    for n in range(7):
+        for chars in itertools.product("ab= ,\n", repeat=n):
+            item = "".join(chars)
+            assert _parse_kv_list([item]) == _split_parse([item]), repr(item)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+"""Tests for mcp_ingest.daemon, talking its socket protocol directly."""
+
+import json
+import socket
+import tempfile
+from pathlib import Path
+
+
+def _submit(sock_path: str, req: dict, tmp_path: Path) -> tuple[dict | None, str, str]:
+    """Send one job with fresh stdout/stderr files; returns (reply, stdout, stderr)."""
+    with (
+        tempfile.TemporaryFile(dir=tmp_path) as out_f,
+        tempfile.TemporaryFile(dir=tmp_path) as err_f,
+        socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s,
+    ):
+        s.connect(sock_path)
+        socket.send_fds(s, [json.dumps(req).encode()], [out_f.fileno(), err_f.fileno()])
+        s.settimeout(60)
+        buf = b""
+        while chunk := s.recv(4096):
+            buf += chunk
+        out_f.seek(0)
+        err_f.seek(0)
+        reply = json.loads(buf) if buf else None
+        return reply, out_f.read().decode(), err_f.read().decode()
+
+
+def test_job_runs_in_its_cwd_and_writes_to_the_passed_stdout(
+    ingest_daemon: str, tmp_path: Path
+) -> None:
+    (tmp_path / "server.py").write_text(
+        "from mcp.server.fastmcp import FastMCP\nmcp = FastMCP('demo')\n", encoding="utf-8"
+    )
+    reply, out, _ = _submit(
+        ingest_daemon, {"argv": ["detect", "."], "cwd": str(tmp_path), "timeout": 60}, tmp_path
+    )
+    assert reply == {"rc": 0}
+    assert json.loads(out)["detector"] == "fastmcp"
+
+
+def test_argparse_exit_code_is_reported(ingest_daemon: str, tmp_path: Path) -> None:
+    reply, _, err = _submit(ingest_daemon, {"argv": ["no-such-command"]}, tmp_path)
+    assert reply == {"rc": 2}
+    assert "invalid choice" in err
+
+
+def test_repeated_jobs_give_the_same_output(ingest_daemon: str, tmp_path: Path) -> None:
+    first = _submit(ingest_daemon, {"argv": ["--help"], "cwd": str(tmp_path)}, tmp_path)
+    second = _submit(ingest_daemon, {"argv": ["--help"]}, tmp_path)
+    assert first[0] == second[0] == {"rc": 0}
+    assert first[1] == second[1] and "usage: mcp-ingest" in first[1]
+
+
+def test_missing_descriptors_is_reported_as_a_failed_job(ingest_daemon: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(ingest_daemon)
+        s.sendall(json.dumps({"argv": ["--help"]}).encode())
+        s.settimeout(60)
+        assert json.loads(s.recv(4096)) == {"rc": 1}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+"""Tests for the on-disk detector cache (mcp_ingest.utils.detect_cache)."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mcp_ingest.utils import detect_cache
+
+
+def _touch(p: Path, text: str = "x = 1\n") -> Path:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(text, encoding="utf-8")
+    return p
+
+
+def test_content_key_tracks_detector_inputs_only(tmp_path: Path) -> None:
+    server = _touch(tmp_path / "server.py")
+    _touch(tmp_path / "README.md", "hello")
+    key = detect_cache.content_key(tmp_path)
+    assert detect_cache.content_key(tmp_path) == key
+
+    _touch(tmp_path / "README.md", "hello, world")  # not read by any detector
+    assert detect_cache.content_key(tmp_path) == key
+
+    server.write_text("x = 12\n", encoding="utf-8")
+    assert detect_cache.content_key(tmp_path) != key
+
+    key = detect_cache.content_key(tmp_path)
+    _touch(tmp_path / "package.json", "{}")
+    assert detect_cache.content_key(tmp_path) != key
+
+    key = detect_cache.content_key(tmp_path)
+    (tmp_path / "tools").mkdir()  # the node detector checks for tools/
+    assert detect_cache.content_key(tmp_path) != key
+
+
+def test_content_key_covers_vendored_trees_the_detectors_walk(tmp_path: Path) -> None:
+    _touch(tmp_path / "server.py")
+    key = detect_cache.content_key(tmp_path)
+    _touch(tmp_path / ".venv" / "lib" / "mcp_server.py")  # iter_files reads this too
+    assert detect_cache.content_key(tmp_path) != key
+
+    key = detect_cache.content_key(tmp_path)
+    _touch(tmp_path / "node_modules" / "dep" / "package.json", "{}")
+    assert detect_cache.content_key(tmp_path) != key
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_dangling_symlink_does_not_hide_sibling_files(tmp_path: Path) -> None:
+    os.symlink(tmp_path / "missing.py", tmp_path / "a_link.py")
+    files = [_touch(tmp_path / f"m{i}.py") for i in range(20)]
+    key = detect_cache.content_key(tmp_path)
+    for f in files:
+        f.write_text("changed = True\n", encoding="utf-8")
+        assert detect_cache.content_key(tmp_path) != key
+        key = detect_cache.content_key(tmp_path)
+
+
+def test_store_lookup_flush_roundtrip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_file = tmp_path / "detect.json"
+    monkeypatch.setattr(detect_cache, "_CACHE_FILE", cache_file)
+    monkeypatch.setattr(detect_cache, "_cache", None)
+
+    assert detect_cache.lookup("k") is None
+    detect_cache.store("k", {"confidence": 0.9}, "fastmcp")
+    detect_cache.flush()
+    assert cache_file.is_file()
+
+    monkeypatch.setattr(detect_cache, "_cache", None)  # force a reload from disk
+    assert detect_cache.lookup("k") == ({"confidence": 0.9}, "fastmcp")
+
+    detect_cache.clear_detect_cache()
+    assert detect_cache.lookup("k") is None
+    assert not cache_file.exists()
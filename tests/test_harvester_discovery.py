@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+"""Tests for the harvester's GitHub code-search discovery (offline)."""
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from services.harvester.discovery import github_search  # noqa: E402
+
+
+def _fake_search(per_query: dict[str, list[str]], sent: list[str]):
+    def search(c, q, cached=None):
+        sent.append(q)
+        return [{"repository": {"clone_url": u}} for u in per_query[q]], None
+
+    return search
+
+
+@pytest.fixture
+def no_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(github_search, "_load_cache", lambda queries: {})
+    monkeypatch.setattr(github_search, "_save_cache", lambda fresh: None)
+
+
+@pytest.mark.usefixtures("no_cache")
+def test_stops_sending_queries_once_limit_is_reached(monkeypatch: pytest.MonkeyPatch) -> None:
+    full_page = {
+        q: [f"https://github.com/{i}/{n}.git" for n in range(github_search.PER_PAGE)]
+        for i, q in enumerate(github_search.QUERIES)
+    }
+    sent: list[str] = []
+    monkeypatch.setattr(github_search, "_search", _fake_search(full_page, sent))
+
+    out = github_search.search_sources(limit=github_search.PER_PAGE + 1)
+    assert len(out) == github_search.PER_PAGE + 1
+    assert sent == github_search.QUERIES[:2]
+
+
+@pytest.mark.usefixtures("no_cache")
+def test_results_are_deduplicated_in_query_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    q0, q1, q2, q3 = github_search.QUERIES
+    per_query = {q0: ["a", "b"], q1: ["b", "c"], q2: [], q3: ["d", "a"]}
+    sent: list[str] = []
+    monkeypatch.setattr(github_search, "_search", _fake_search(per_query, sent))
+
+    assert github_search.search_sources(limit=100) == ["a", "b", "c", "d"]
+    assert sorted(sent) == sorted(github_search.QUERIES)
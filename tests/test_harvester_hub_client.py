@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+"""Offline tests for the harvester's MatrixHub client (retries and Retry-After)."""
+
+import httpx
+import pytest
+
+from services.harvester.clients import hub_client
+from services.harvester.clients.hub_client import HubClient, RateLimitedError, _retry_delay
+
+
+class _NoLimit:
+    def acquire(self, timeout: float | None = None) -> bool:
+        return True
+
+    def drain(self, n: float = 1.0) -> None:
+        pass
+
+
+@pytest.fixture
+def slept(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    calls: list[float] = []
+    monkeypatch.setattr(hub_client, "HUB_BUCKET", _NoLimit())
+    monkeypatch.setattr(hub_client.time, "sleep", calls.append)
+    return calls
+
+
+def _client(replies: list[httpx.Response]) -> HubClient:
+    it = iter(replies)
+    hc = HubClient("http://hub.test", token="t")
+    hc._client = httpx.Client(transport=httpx.MockTransport(lambda request: next(it)))
+    return hc
+
+
+@pytest.mark.parametrize(
+    ("i", "retry_after", "low", "high"),
+    [
+        (1, None, 0.5, 0.75),
+        (3, None, 2.0, 3.0),
+        (9, None, 4.0, 6.0),
+        (1, "5", 5.0, 7.5),
+        (1, "3600", 60.0, 90.0),
+        (2, "Wed, 21 Oct 2015 07:28:00 GMT", 1.0, 1.5),  # HTTP-date: own backoff
+    ],
+)
+def test_retry_delay(i: int, retry_after: str | None, low: float, high: float) -> None:
+    for _ in range(20):
+        assert low <= _retry_delay(i, retry_after) <= high
+
+
+def test_install_honours_retry_after_then_succeeds(slept: list[float]) -> None:
+    hc = _client(
+        [
+            httpx.Response(429, headers={"Retry-After": "2"}, json={"detail": "slow down"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+    assert hc.install_manifest(entity_uid="a@1", target="./", manifest={}) == {"ok": True}
+    assert len(slept) == 1 and 2.0 <= slept[0] <= 3.0
+
+
+def test_install_still_throttled_raises_rate_limited(slept: list[float]) -> None:
+    hc = _client([httpx.Response(429, json={"detail": "slow down"})] * 3)
+    with pytest.raises(RateLimitedError):
+        hc.install_manifest(entity_uid="a@1", target="./", manifest={})
+    assert len(slept) == 2
+
+
+def test_install_hard_failure_is_not_rate_limited(slept: list[float]) -> None:
+    hc = _client([httpx.Response(503, json={"detail": "unavailable"})] * 3)
+    with pytest.raises(RuntimeError) as exc:
+        hc.install_manifest(entity_uid="a@1", target="./", manifest={})
+    assert not isinstance(exc.value, RateLimitedError)
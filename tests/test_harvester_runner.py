@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+"""Tests for the harvester worker's command runner (services/harvester/workers/runner)."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from services.harvester.workers import runner  # noqa: E402
+
+
+@pytest.fixture
+def no_daemon(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(runner, "INGEST_SOCKET", str(tmp_path / "absent.sock"))
+
+
+@pytest.mark.usefixtures("no_daemon")
+def test_subprocess_log_holds_stdout_then_stderr(tmp_path: Path) -> None:
+    log = tmp_path / "job.log"
+    cmd = [sys.executable, "-c", "import sys; print('{}'); sys.stderr.write('warn')"]
+    rc, out = runner._run(cmd, log_path=log, timeout=60)
+    assert (rc, out) == (0, "{}\n")
+    assert log.read_bytes() == b"{}\n\n---\nwarn"
+
+
+@pytest.mark.usefixtures("no_daemon")
+def test_subprocess_timeout_is_marked_in_the_log(tmp_path: Path) -> None:
+    log = tmp_path / "job.log"
+    cmd = [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(60)"]
+    rc, out = runner._run(cmd, log_path=log, timeout=1)
+    assert (rc, out) == (-1, "started\n")
+    assert log.read_bytes().endswith(b"\n---\n\n[timeout]")
+
+
+def test_stale_socket_falls_back_to_a_subprocess(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    stale = tmp_path / "stale.sock"
+    stale.touch()  # left behind by a daemon that is gone
+    monkeypatch.setattr(runner, "INGEST_SOCKET", str(stale))
+    with open(tmp_path / "out", "w+b") as out_f, open(tmp_path / "err", "w+b") as err_f:
+        assert runner._run_via_daemon(["mcp-ingest"], out_f, err_f, cwd=None, timeout=5) is None
+
+
+def test_mcp_ingest_commands_go_to_the_daemon(
+    monkeypatch: pytest.MonkeyPatch, ingest_daemon: str, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(runner, "INGEST_SOCKET", ingest_daemon)
+    spawned: list[list[str]] = []
+    monkeypatch.setattr(runner, "_run_subprocess", lambda cmd, *a, **kw: spawned.append(cmd))
+    (tmp_path / "server.py").write_text(
+        "from mcp.server.fastmcp import FastMCP\nmcp = FastMCP('demo')\n", encoding="utf-8"
+    )
+
+    log = tmp_path / "job.log"
+    rc, out = runner._run(["mcp-ingest", "detect", "."], log_path=log, cwd=tmp_path, timeout=60)
+    assert rc == 0 and json.loads(out)["detector"] == "fastmcp"
+    assert log.read_text().startswith(out + "\n---\n")
+
+    rc, _ = runner._run(["mcp-ingest", "no-such-command"], log_path=log, timeout=60)
+    assert rc == 2 and "invalid choice" in log.read_text().split("\n---\n", 1)[1]
+    assert spawned == []
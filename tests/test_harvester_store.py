@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+"""Tests for the harvester service's SQL store and queue (services/harvester).
+
+conftest.py points HARVESTER_DB_URL at a throwaway SQLite file.
+"""
+
+import os
+from queue import Empty
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import select, text, update  # noqa: E402
+from sqlalchemy.exc import IntegrityError  # noqa: E402
+
+from services.harvester.store import models  # noqa: E402
+from services.harvester.store.models import (  # noqa: E402
+    Framework,
+    Job,
+    JobFramework,
+    get_session,
+    init_db,
+    set_job_frameworks,
+)
+from services.harvester.workers.queue import InMemoryQueue, SqlJobQueue  # noqa: E402
+
+# Imported earlier against another database: never touch it
+if models.DB_URL != os.environ.get("HARVESTER_DB_URL"):
+    pytest.skip("harvester store already bound to another database", allow_module_level=True)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_db() -> None:
+    models.Base.metadata.drop_all(models.engine)
+    init_db()
+
+
+def _job(db, source: str) -> Job:
+    job = Job(id=source, source=source, status="running")
+    db.add(job)
+    db.commit()
+    return job
+
+
+def test_framework_insert_ignores_names_another_job_committed() -> None:
+    a, b = get_session(), get_session()
+    try:
+        job_a, job_b = _job(a, "src-a"), _job(b, "src-b")
+        set_job_frameworks(a, job_a, ["fastmcp", "langchain"])
+        a.commit()
+        # What the losing worker of a race does: insert a name that now exists
+        models._ensure_frameworks(b, ["fastmcp", "crewai"])
+        set_job_frameworks(b, job_b, ["fastmcp", "crewai"])
+        b.commit()
+
+        names = a.execute(select(Framework.name)).scalars().all()
+        assert sorted(names) == ["crewai", "fastmcp", "langchain"]
+        links = a.execute(select(JobFramework.job_id, JobFramework.framework_id)).all()
+        assert len(links) == 4
+        assert job_b.frameworks == "fastmcp,crewai"
+    finally:
+        a.close()
+        b.close()
+
+
+def test_set_job_frameworks_replaces_earlier_tags() -> None:
+    db = get_session()
+    try:
+        job = _job(db, "src")
+        set_job_frameworks(db, job, ["fastmcp"])
+        set_job_frameworks(db, job, ["langchain", "langchain", ""])
+        db.commit()
+        rows = db.execute(
+            select(Framework.name).join(JobFramework, JobFramework.framework_id == Framework.id)
+        ).scalars()
+        assert list(rows) == ["langchain"]
+    finally:
+        db.close()
+
+
+def _downgrade_to_old_schema() -> None:
+    # What a database created before visible_at / singleflight looks like
+    with models.engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_jobs_source_active"))
+        conn.execute(text("ALTER TABLE jobs DROP COLUMN visible_at"))
+
+
+def test_init_db_upgrades_an_existing_database() -> None:
+    _downgrade_to_old_schema()
+    with models.engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO jobs (id, mode, source, status, created_at) "
+                "VALUES ('j1', 'pack', 'src', 'queued', CURRENT_TIMESTAMP)"
+            )
+        )
+
+    init_db()
+    init_db()  # idempotent
+
+    db = get_session()
+    try:
+        assert db.execute(select(Job)).scalar_one().visible_at is None
+        db.add(Job(id="j2", source="src", status="queued"))
+        with pytest.raises(IntegrityError):  # singleflight index is in place
+            db.commit()
+    finally:
+        db.close()
+
+
+def test_init_db_warns_when_singleflight_index_cannot_be_built() -> None:
+    _downgrade_to_old_schema()
+    with models.engine.begin() as conn:
+        for jid in ("j1", "j2"):
+            conn.execute(
+                text(
+                    "INSERT INTO jobs (id, mode, source, status, created_at) "
+                    f"VALUES ('{jid}', 'pack', 'src', 'queued', CURRENT_TIMESTAMP)"
+                )
+            )
+
+    with pytest.warns(RuntimeWarning, match="ix_jobs_source_active"):
+        init_db()
+
+
+def test_sql_queue_claim_hides_job_until_visibility_timeout() -> None:
+    q = SqlJobQueue(visibility_timeout=0.2, poll_interval=0.01)
+    jid = q.enqueue({"source": "src", "options": {"mode": "pack"}})
+    got = q.dequeue(timeout=0.1)
+    assert got == (jid, {"id": jid, "source": "src", "options": {"mode": "pack"}})
+    with pytest.raises(Empty):  # claimed: no second worker gets it
+        q.dequeue(timeout=0.05)
+
+    # The worker died without ack/nack: the job reappears once the claim expires
+    assert q.dequeue(timeout=2.0)[0] == jid
+    q.ack(jid)
+    db = get_session()
+    try:
+        job = db.get(Job, jid)
+        assert (job.status, job.visible_at) == ("running", None)
+    finally:
+        db.close()
+    with pytest.raises(Empty):  # acked jobs are never handed out again
+        q.dequeue(timeout=0.3)
+
+
+def test_sql_queue_nack_requeues_immediately() -> None:
+    q = SqlJobQueue(visibility_timeout=60.0, poll_interval=0.01)
+    jid = q.enqueue({"source": "src"})
+    assert q.dequeue(timeout=0.1)[0] == jid
+    q.nack(jid)
+    assert q.dequeue(timeout=0.1)[0] == jid
+
+
+def test_insert_job_returns_the_active_job_for_a_busy_source() -> None:
+    from services.harvester.routers.jobs import _insert_job
+
+    db = get_session()
+    try:
+        assert _insert_job(db, Job(id="j1", source="src", status="queued")) == ("j1", True)
+        assert _insert_job(db, Job(id="j2", source="src", status="queued")) == ("j1", False)
+        db.execute(update(Job).where(Job.id == "j1").values(status="succeeded"))
+        db.commit()
+        # Finished jobs release the slot
+        assert _insert_job(db, Job(id="j3", source="src", status="queued")) == ("j3", True)
+    finally:
+        db.close()
+
+
+def test_submit_job_enqueues_each_source_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.harvester.routers import jobs
+
+    enqueued: list[str] = []
+    monkeypatch.setattr(jobs._queue, "enqueue", lambda job: enqueued.append(job["id"]))
+    first = jobs.submit_job(jobs.JobSubmit(source="https://github.com/o/r.git")).id
+    again = jobs.submit_job(jobs.JobSubmit(source=" https://github.com/o/r.git ")).id
+    assert again == first
+    assert enqueued == [first]
+
+
+def test_in_memory_queue_recovers_jobs_left_active_by_a_restart(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from services.harvester.routers import jobs
+
+    monkeypatch.setattr(jobs, "_queue", InMemoryQueue())
+    src = "https://github.com/o/r.git"
+    jid = jobs.submit_job(jobs.JobSubmit(source=src)).id
+    db = get_session()
+    try:
+        db.add(Job(id="j-running", source="other", status="running"))
+        db.commit()
+    finally:
+        db.close()
+
+    restarted = InMemoryQueue()  # the old process and its queue are gone
+    monkeypatch.setattr(jobs, "_queue", restarted)
+    assert restarted.recover() == 2
+    assert jobs.submit_job(jobs.JobSubmit(source=src)).id == jid
+    assert restarted.q.qsize() == 2
+    got = {restarted.dequeue(timeout=0.1)[0] for _ in range(2)}
+    assert got == {jid, "j-running"}
+    db = get_session()
+    try:
+        assert db.get(Job, "j-running").status == "queued"
+    finally:
+        db.close()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+"""Offline tests for HubClient.install_manifests (batch endpoint + fallback)."""
+
+import json
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from mcp_ingest.register.hub_client import HubClient
+from mcp_ingest.utils.idempotency import HTTPError
+
+ITEMS = [
+    {"id": f"mcp_server:s{i}@1", "target": "./", "manifest": {"id": f"s{i}"}} for i in range(3)
+]
+
+
+def _client(batch: Callable[[httpx.Request], httpx.Response]) -> tuple[HubClient, list[str]]:
+    """HubClient whose /catalog/install:batch answers via *batch*; single installs succeed."""
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith(":batch"):
+            return batch(request)
+        return httpx.Response(200, json={"installed": json.loads(request.content)["id"]})
+
+    hc = HubClient("http://hub.test", token="t")
+    hc._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return hc, calls
+
+
+def test_batch_results_are_returned_in_order() -> None:
+    hc, calls = _client(
+        lambda r: httpx.Response(200, json={"results": [{"n": i} for i in range(3)]})
+    )
+    assert hc.install_manifests(ITEMS) == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert calls == ["/catalog/install:batch"]
+
+
+def test_missing_batch_endpoint_falls_back_and_is_remembered() -> None:
+    hc, calls = _client(lambda r: httpx.Response(404, json={"detail": "not found"}))
+    results = hc.install_manifests(ITEMS)
+    assert [r["installed"] for r in results] == [i["id"] for i in ITEMS]  # type: ignore[index]
+
+    calls.clear()
+    hc.install_manifests(ITEMS[:1])
+    assert calls == ["/catalog/install"]
+
+
+def test_unexpected_batch_response_falls_back_to_single_installs() -> None:
+    hc, calls = _client(lambda r: httpx.Response(200, json={"ok": True}))
+    results = hc.install_manifests(ITEMS)
+    assert [r["installed"] for r in results] == [i["id"] for i in ITEMS]  # type: ignore[index]
+    assert calls.count("/catalog/install") == len(ITEMS)
+
+
+@pytest.mark.parametrize("status", [400, 401, 413, 422, 429])
+def test_rejected_batch_falls_back_to_single_installs(status: int) -> None:
+    hc, calls = _client(lambda r: httpx.Response(status, json={"detail": "rejected"}))
+    results = hc.install_manifests(ITEMS)
+    assert [r["installed"] for r in results] == [i["id"] for i in ITEMS]  # type: ignore[index]
+    assert calls.count("/catalog/install") == len(ITEMS)
+
+    calls.clear()  # a rejected batch says nothing about support: try it again next time
+    hc.install_manifests(ITEMS[:1])
+    assert calls[0] == "/catalog/install:batch"
+
+
+def test_per_item_errors_in_a_batch_response_are_failures() -> None:
+    entries = [{"ok": True}, {"error": "invalid manifest"}, {"status_code": 422}]
+    hc, _ = _client(lambda r: httpx.Response(200, json={"results": entries}))
+    ok, bad, invalid = hc.install_manifests(ITEMS)
+    assert ok == {"ok": True}
+    assert isinstance(bad, HTTPError) and "invalid manifest" in str(bad)
+    assert isinstance(invalid, HTTPError) and invalid.status == 422
+
+
+def test_connect_error_falls_back_to_single_installs() -> None:
+    attempts = []
+
+    def batch(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    hc, calls = _client(batch)
+    results = hc.install_manifests(ITEMS)
+    assert len(attempts) == 1
+    assert all(isinstance(r, dict) for r in results)
+
+
+def _read_timeout(request: httpx.Request) -> httpx.Response:
+    raise httpx.ReadTimeout("slow", request=request)
+
+
+@pytest.mark.parametrize(
+    "batch",
+    [lambda r: httpx.Response(502, json={"detail": "bad gateway"}), _read_timeout],
+    ids=["5xx", "read-timeout"],
+)
+def test_ambiguous_batch_failure_is_not_retried_item_by_item(
+    batch: Callable[[httpx.Request], httpx.Response],
+) -> None:
+    hc, calls = _client(batch)
+    results = hc.install_manifests(ITEMS)
+    assert calls == ["/catalog/install:batch"]  # no single installs: no double install
+    assert all(isinstance(r, (HTTPError, httpx.ReadTimeout)) for r in results)
+
+
+def test_sdk_client_cache_follows_env_token_and_closes_evicted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from mcp_ingest import sdk
+
+    monkeypatch.setattr(sdk, "_HUB_CLIENTS", sdk.OrderedDict())
+    for var in ("MATRIX_TOKEN", "API_TOKEN"):
+        monkeypatch.delenv(var, raising=False)
+
+    monkeypatch.setenv("MATRIX_HUB_TOKEN", "one")
+    first = sdk._hub_client("http://hub.test", None)
+    assert sdk._hub_client("http://hub.test", None) is first
+    monkeypatch.setenv("MATRIX_HUB_TOKEN", "two")
+    second = sdk._hub_client("http://hub.test", None)
+    assert second is not first and second.token == "two"
+
+    first._get_client()  # open its connection pool
+    for i in range(sdk._HUB_CLIENTS_MAX):
+        sdk._hub_client(f"http://hub{i}.test", "t")
+    assert first._client is None  # evicted and closed
+    assert len(sdk._HUB_CLIENTS) == sdk._HUB_CLIENTS_MAX
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+"""Tests for mcp_ingest.utils._json: both backends must write the same bytes."""
+
+from typing import Any
+
+import pytest
+
+from mcp_ingest.utils import _json
+
+DOC = {"name": "Café ☕ 例え", "tools": [{"id": "t", "n": 1, "ok": True, "x": None}], "a": 1.5}
+
+
+def _dump_both(monkeypatch: pytest.MonkeyPatch, **kw: Any) -> tuple[bytes, bytes]:
+    if _json.orjson is None:
+        pytest.skip("orjson not installed")
+    fast = _json.dumps_bytes(DOC, **kw)
+    monkeypatch.setattr(_json, "orjson", None)
+    return fast, _json.dumps_bytes(DOC, **kw)
+
+
+@pytest.mark.parametrize(
+    "kw",
+    [{}, {"sort_keys": True}, {"indent": True, "sort_keys": True, "newline": True}],
+    ids=["compact", "sorted", "pretty"],
+)
+def test_backends_write_identical_bytes(monkeypatch: pytest.MonkeyPatch, kw: dict) -> None:
+    fast, stdlib = _dump_both(monkeypatch, **kw)
+    assert fast == stdlib
+    assert "Café ☕ 例え".encode() in stdlib  # raw UTF-8, no \u escapes
+
+
+def test_stdlib_fallback_round_trips_non_ascii(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_json, "orjson", None)
+    data = _json.dumps_bytes(DOC, indent=True)
+    assert b"\\u" not in data
+    assert _json.loads(data) == DOC
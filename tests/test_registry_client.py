@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+"""Offline tests for RegistryClient retries and Retry-After handling."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from mcp_ingest.registry import client as registry_client
+from mcp_ingest.registry.client import RegistryClient, _retry_after
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("", None), ("3", 3.0), ("1.5", 1.5), ("-4", 0.0), ("soon", None)],
+)
+def test_retry_after_delta_seconds(value: str | None, expected: float | None) -> None:
+    assert _retry_after(value) == expected
+
+
+def test_retry_after_http_date() -> None:
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    wait = _retry_after(format_datetime(future, usegmt=True))
+    assert wait is not None and 25.0 < wait <= 30.0
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert _retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def _client(statuses: list[tuple[int, dict[str, str]]]) -> RegistryClient:
+    replies = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, headers = next(replies)
+        return httpx.Response(status, headers=headers, json={"servers": []})
+
+    rc = RegistryClient(base_url="http://registry.test", max_retries=3)
+    rc._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return rc
+
+
+def test_retry_after_wins_over_backoff_and_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    slept: list[float] = []
+    monkeypatch.setattr(registry_client.time, "sleep", slept.append)
+    rc = _client([(429, {"Retry-After": "7"}), (503, {"Retry-After": "86400"}), (200, {})])
+    assert rc._get("/v0/servers", {}) == {"servers": []}
+    assert slept == [7.0, registry_client._MAX_RETRY_AFTER_S]
+
+
+def test_backoff_is_jittered_without_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    slept: list[float] = []
+    monkeypatch.setattr(registry_client.time, "sleep", slept.append)
+    rc = _client([(502, {}), (502, {}), (200, {})])
+    rc._get("/v0/servers", {})
+    first, second = slept
+    assert 0.5 <= first < 1.5 and 1.0 <= second < 3.0
+
+
+def test_gives_up_after_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry_client.time, "sleep", lambda s: None)
+    rc = _client([(429, {"Retry-After": "1"})] * 3)
+    with pytest.raises(httpx.HTTPStatusError):
+        rc._get("/v0/servers", {})
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+"""Offline tests for mcp_ingest.registry.harvest (registry client stubbed)."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_ingest.registry import harvest
+
+
+def _payload(name: str) -> dict:
+    return {
+        "server": {
+            "name": name,
+            "description": "Test server",
+            "version": "1.0.0",
+            "remotes": [{"transport": "SSE", "url": f"https://example.com/{name}/sse"}],
+        }
+    }
+
+
+class _FakeClient:
+    def __init__(self, base_url: str) -> None:
+        pass
+
+    def iter_servers_latest(self, **_: Any) -> Any:
+        yield _payload("io.github.test/good")
+        yield _payload("io.github.test/broken")
+
+
+def test_failed_manifest_write_is_left_out_of_index(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(harvest, "RegistryClient", _FakeClient)
+    real_write = harvest.write_json
+
+    def flaky_write(path: Path, obj: Any) -> None:
+        if path.name == "manifest.json" and "broken" in str(obj.get("name")):
+            raise OSError("disk full")
+        real_write(path, obj)
+
+    monkeypatch.setattr(harvest, "write_json", flaky_write)
+
+    index_path = harvest.harvest_registry(
+        out_dir=tmp_path, promote_tools=False, promote_agents=False
+    )
+    index = json.loads(index_path.read_text())
+
+    assert [i["name"] for i in index["items"]] == ["io.github.test/good"]
+    assert index["counts"]["total_items"] == 1
+    for rel in index["manifests"]:
+        assert (tmp_path / rel).is_file()
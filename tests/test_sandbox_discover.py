@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+"""Tests for mcp_ingest.validate.sandbox_container.discover_endpoint."""
+
+import pytest
+
+from mcp_ingest.validate.sandbox_container import discover_endpoint
+
+BANNER_THEN_NOISE = (
+    "Uvicorn running on http://0.0.0.0:8000/sse\n"
+    + "DEBUG heartbeat ok\n" * 500
+    + "see http://0.0.0.0:9999/messages for the old API\n"
+)
+
+
+@pytest.mark.parametrize("as_bytes", [False, True], ids=["str", "bytes"])
+def test_first_url_wins_over_later_ones_and_noise(as_bytes: bool) -> None:
+    logs = BANNER_THEN_NOISE.encode() if as_bytes else BANNER_THEN_NOISE
+    assert discover_endpoint(logs) == {
+        "url": "http://0.0.0.0:8000/sse",
+        "transport": "SSE",
+        "port": 8000,
+    }
+
+
+@pytest.mark.parametrize("as_bytes", [False, True], ids=["str", "bytes"])
+def test_port_hint_and_messages_anywhere_in_the_log(as_bytes: bool) -> None:
+    text = "listening PORT=7001\n" + "x" * 10_000 + "\nPOST /messages\nport: 7002\n"
+    logs = text.encode() if as_bytes else text
+    assert discover_endpoint(logs) == {
+        "url": "http://127.0.0.1:7001/messages",
+        "transport": "WS",
+        "port": 7001,
+    }
+
+
+def test_default_port_when_nothing_matches() -> None:
+    assert discover_endpoint(b"starting...\n", default_port=6288) == {
+        "url": "http://127.0.0.1:6288/sse",
+        "transport": "SSE",
+        "port": 6288,
+    }
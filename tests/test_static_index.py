@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+"""Tests for mcp_ingest.publishers.static_index content-hashed publishing."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from mcp_ingest.publishers import static_index
+
+
+def test_content_token_is_sha256_by_default(tmp_path: Path) -> None:
+    src = tmp_path / "manifest.json"
+    src.write_text('{"id": "x"}\n', encoding="utf-8")
+    token = hashlib.sha256(src.read_bytes()).hexdigest()[:16]
+
+    res = static_index.publish({"manifest": src}, str(tmp_path / "site"), provider="local")
+
+    assert res.ok, res.error
+    assert Path(res.objects["manifest"]).name == f"{token}-manifest.json"
+    # the in-memory and on-disk paths agree
+    assert static_index._content_hash(src, src.read_bytes()) == token
+
+
+@pytest.mark.skipif("blake3" in static_index._HASHERS, reason="blake3 installed")
+def test_blake3_without_the_package_is_an_error(tmp_path: Path) -> None:
+    src = tmp_path / "manifest.json"
+    src.write_text("{}", encoding="utf-8")
+    res = static_index.publish(
+        {"manifest": src}, str(tmp_path / "site"), provider="local", hash_algo="blake3"
+    )
+    assert not res.ok
+    assert "blake3" in (res.error or "")
+    assert not (tmp_path / "site").exists()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+"""Offline tests for examples/catalog-automation/scripts/sync_mcp_servers.py.
+
+The harvester is replaced by a stub that writes a fixed harvest tree, so a
+sync can be run end to end against a temporary catalog.
+"""
+
+import importlib.util
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+_SCRIPT = (
+    Path(__file__).resolve().parents[1]
+    / "examples"
+    / "catalog-automation"
+    / "scripts"
+    / "sync_mcp_servers.py"
+)
+
+
+@pytest.fixture()
+def sync(monkeypatch: pytest.MonkeyPatch) -> Any:
+    spec = importlib.util.spec_from_file_location("sync_mcp_servers", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, mod)  # dataclasses look the module up
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _manifest(mid: str, repo: str, subpath: str = "") -> dict[str, Any]:
+    return {
+        "type": "mcp_server",
+        "id": mid,
+        "name": mid,
+        "mcp_registration": {"server": {"transport": "SSE", "url": "http://127.0.0.1:6288/sse"}},
+        "provenance": {
+            "repo_url": f"https://github.com/{repo}",
+            "subpath": subpath,
+            # restamped by enrich_manifest on every harvest
+            "harvested_at": datetime.now(timezone.utc).isoformat(),
+        },
+    }
+
+
+def _stub_harvest(monkeypatch: pytest.MonkeyPatch, sync: Any, manifests: list[dict]) -> None:
+    def harvest_source(*, out_dir: Path, **_: Any) -> None:
+        rels = []
+        for i, m in enumerate(manifests):
+            rel = f"m{i}/manifest.json"
+            (out_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+            # fresh timestamp per run, as the real harvester produces
+            m["provenance"]["harvested_at"] = datetime.now(timezone.utc).isoformat()
+            (out_dir / rel).write_text(json.dumps(m), encoding="utf-8")
+            rels.append(rel)
+        (out_dir / "index.json").write_text(json.dumps({"manifests": rels}), encoding="utf-8")
+
+    monkeypatch.setattr(sync, "harvest_source", harvest_source)
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, sync: Any, root: Path) -> None:
+    argv = ["sync", "--source-repo", "https://github.com/o/r", "--catalog-root", str(root)]
+    monkeypatch.setattr(sys, "argv", argv)
+    sync.main()
+
+
+def test_content_digest_ignores_harvested_at(sync: Any) -> None:
+    a = _manifest("x", "o/a")
+    b = json.loads(json.dumps(a))
+    b["provenance"]["harvested_at"] = "2000-01-01T00:00:00+00:00"
+    assert sync.content_digest(a) == sync.content_digest(b)
+
+    b["description"] = "changed"
+    assert sync.content_digest(a) != sync.content_digest(b)
+
+
+def test_second_sync_takes_unchanged_path(
+    sync: Any, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _stub_harvest(monkeypatch, sync, [_manifest("a", "o/a"), _manifest("b", "o/b")])
+
+    _run(monkeypatch, sync, tmp_path)
+    assert sync._skipped_unchanged == 0
+    written = sorted((tmp_path / "servers").glob("*/*/manifest.json"))
+    assert len(written) == 2
+    first = {p: json.loads(p.read_text())["harvest"]["content_sha256"] for p in written}
+
+    _run(monkeypatch, sync, tmp_path)
+    assert sync._skipped_unchanged == 2
+    for p, digest in first.items():
+        assert json.loads(p.read_text())["harvest"]["content_sha256"] == digest
+
+
+def test_changed_manifest_is_rewritten(
+    sync: Any, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    manifests = [_manifest("a", "o/a")]
+    _stub_harvest(monkeypatch, sync, manifests)
+    _run(monkeypatch, sync, tmp_path)
+
+    manifests[0]["description"] = "new description"
+    _run(monkeypatch, sync, tmp_path)
+    assert sync._skipped_unchanged == 0
+    (mf,) = (tmp_path / "servers").glob("*/*/manifest.json")
+    assert json.loads(mf.read_text())["description"] == "new description"
+
+
+def test_id_collision_aborts_before_any_write(
+    sync: Any, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    ok = [_manifest(f"ok{i}", f"o/ok{i}") for i in range(20)]
+    _stub_harvest(monkeypatch, sync, [*ok, _manifest("dup", "o/a"), _manifest("dup", "o/b")])
+
+    with pytest.raises(SystemExit) as exc:
+        _run(monkeypatch, sync, tmp_path)
+
+    # reported in harvest order, and nothing reached the catalog
+    msg = str(exc.value)
+    assert msg.index("repo_full='o/a'") < msg.index("repo_full='o/b'")
+    assert not list((tmp_path / "servers").rglob("*.json"))
+
+
+def test_transports_sharing_a_variant_dir_keep_harvest_order(
+    sync: Any, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    sse, ws = _manifest("demo-sse", "o/demo"), _manifest("demo-ws", "o/demo")
+    ws["mcp_registration"]["server"]["transport"] = "WS"
+    _stub_harvest(monkeypatch, sync, [sse, ws])
+
+    real_write_one = sync.write_one
+
+    def slow_first(h: Any, **kw: Any) -> Any:
+        if h.mid == "demo-sse":
+            time.sleep(0.2)  # a parallel write of demo-ws would now finish first
+        return real_write_one(h, **kw)
+
+    monkeypatch.setattr(sync, "write_one", slow_first)
+    _run(monkeypatch, sync, tmp_path)
+    (mf,) = (tmp_path / "servers").glob("*/*/manifest.json")
+    assert json.loads(mf.read_text())["id"] == "demo-ws"  # last in harvest order wins
+
+
+def test_existing_manifests_are_private_copies(sync: Any, tmp_path: Path) -> None:
+    mf = tmp_path / "manifest.json"
+    mf.write_text(json.dumps(_manifest("a", "o/a")), encoding="utf-8")
+
+    first = sync._load_existing(mf)
+    sync.mark_deprecated(first, reason="gone")
+    again = sync._load_existing(mf)
+    assert "lifecycle" not in again  # the cached parse was not touched
+    assert again is not first
+
+
+def _item(**overrides: Any) -> dict[str, Any]:
+    item = {
+        "id": "mcp_server:demo@0.1.0",
+        "manifest_path": "servers/o/demo/manifest.json",
+        "name": "demo",
+        "repo": "https://github.com/o/demo",
+        "status": "ok",
+        "subpath": "",
+        "transport": "SSE",
+        "type": "mcp_server",
+    }
+    item.update(overrides)
+    return item
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request: pytest.FixtureRequest, sync: Any, monkeypatch: pytest.MonkeyPatch) -> Any:
+    if request.param == "json":
+        monkeypatch.setattr(sync, "orjson", None)
+    elif sync.orjson is None:
+        pytest.skip("orjson not installed")
+    return sync
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        {"generated_at": "now", "items": [_item(), _item(name="two", subpath="a/b")], "n": 2},
+        {"items": []},
+        {},
+    ],
+    ids=["items", "empty-list", "empty"],
+)
+def test_write_json_stream_matches_write_json(
+    serializer: Any, tmp_path: Path, index: dict[str, Any]
+) -> None:
+    streamed, whole = tmp_path / "streamed.json", tmp_path / "whole.json"
+    serializer.write_json_stream(streamed, index, "items")
+    serializer.write_json(whole, index)
+    assert streamed.read_bytes() == whole.read_bytes()
+    assert not (tmp_path / "streamed.json.tmp").exists()
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        _item(),
+        _item(subpath=None, transport=None),
+        _item(name='quo"te\\back\nline\ttab\x01', repo="https://例え.jp/ünï/😀"),
+        _item(extra="key"),  # off-template shapes use the generic serializer
+        _item(name=7),
+        {"id": "x"},
+    ],
+    ids=["plain", "nulls", "escapes", "extra-key", "non-string", "partial"],
+)
+def test_dumps_index_item_matches_generic_serializer(
+    serializer: Any, tmp_path: Path, item: dict[str, Any]
+) -> None:
+    assert serializer.dumps_index_item(item) == serializer._dumps_nested(item, 2)
+
+    index = {"items": [item, item]}
+    streamed, whole = tmp_path / "streamed.json", tmp_path / "whole.json"
+    serializer.write_json_stream(streamed, index, "items", serializer.dumps_index_item)
+    serializer.write_json(whole, index)
+    assert streamed.read_bytes() == whole.read_bytes()